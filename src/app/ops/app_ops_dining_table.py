@@ -10,14 +10,18 @@ you want and use the alias of persistence_batch_ops_dining_table.
 from typing import Callable
 
 from src.app.ops.exceptions.app_ops_exceptions import (
+    ConcurrentUpdateError,
     CreateDiningTableError,
     DeleteDiningTableError,
     GetDiningTableListError,
+    UpdateDiningTablesError,
     UpdateNameError,
     UpdatePositionError,
     UpdateSizeError,
 )
 from src.app.ops.utils import app_ops_utils
+from src.app.ops.utils.edit_session import EditSession
+from src.app.ops.utils.list_cache import default_list_cache
 from src.persistence.database.ops import (
     db_batch_ops_dining_table as persistence_batch_ops_dining_table,
 )
@@ -25,6 +29,10 @@ from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_dining_table
+from src.utils.tracing import default_tracer
+
+LIST_CACHE_ENTITY = "dining_table"
+CHANGED_SINCE_READ = "The dining table was changed or deleted since it was read."
 
 
 def validate_dining_table_name(text: str):
@@ -35,88 +43,428 @@ def validate_dining_table_name(text: str):
         raise ValueError("Invalid dining table name format.")
 
 
+@default_tracer.traced("app_ops_dining_table.create_dining_table")
 async def create_dining_table(
     request: schema_dining_table.SchemaDiningTableCreate,
     insert_dining_table_func=persistence_batch_ops_dining_table.insert_dining_table,
     validate_dining_table_name_func: Callable[[str], None] = validate_dining_table_name,
+    list_cache=default_list_cache,
 ) -> schema_dining_table.SchemaDiningTableDisplay:
     try:
-        validate_dining_table_name_func(request.name)
+        with default_tracer.span("validation"):
+            validate_dining_table_name_func(request.name)
     except ValueError as ve:
         raise CreateDiningTableError(ve) from ve
 
     try:
-        return await insert_dining_table_func(request)
+        new_record = await insert_dining_table_func(request)
     except PersistenceOpsBaseError as poe:
         raise CreateDiningTableError(poe) from poe
 
+    list_cache.invalidate(LIST_CACHE_ENTITY)
+    return new_record
+
+
+@default_tracer.traced("app_ops_dining_table.create_dining_tables")
+async def create_dining_tables(
+    requests: list[schema_dining_table.SchemaDiningTableCreate],
+    insert_dining_tables_func=persistence_batch_ops_dining_table.insert_dining_tables,
+    validate_dining_table_name_func: Callable[[str], None] = validate_dining_table_name,
+    list_cache=default_list_cache,
+) -> list[schema_dining_table.SchemaDiningTableBatchResult]:
+    """
+    Creates all the valid dining tables in a single transaction.
+    Returns one result per request, in the same order, holding either
+    the new dining table or the reason the request was rejected.
+    """
+    results = [None] * len(requests)
+    valid_indexes = []
+    with default_tracer.span("validation"):
+        for index, request in enumerate(requests):
+            try:
+                validate_dining_table_name_func(request.name)
+                valid_indexes.append(index)
+            except ValueError as ve:
+                results[index] = schema_dining_table.SchemaDiningTableBatchResult(
+                    error=str(ve)
+                )
+
+    if valid_indexes:
+        try:
+            new_dining_tables = await insert_dining_tables_func(
+                [requests[index] for index in valid_indexes]
+            )
+        except PersistenceOpsBaseError as poe:
+            raise CreateDiningTableError(poe) from poe
+
+        for index, new_dining_table in zip(valid_indexes, new_dining_tables):
+            results[index] = schema_dining_table.SchemaDiningTableBatchResult(
+                dining_table_id=new_dining_table.id, dining_table=new_dining_table
+            )
+        list_cache.invalidate(LIST_CACHE_ENTITY)
+
+    return results
+
 
+@default_tracer.traced("app_ops_dining_table.delete_dining_table")
 async def delete_dining_table(
     dining_table_id,
     delete_dining_table_func=persistence_batch_ops_dining_table.delete_dining_table,
+    list_cache=default_list_cache,
 ):
     await app_ops_utils.affect_existing_row(
         delete_dining_table_func,
         DeleteDiningTableError,
         dining_table_id=dining_table_id,
     )
+    list_cache.invalidate(LIST_CACHE_ENTITY)
 
 
+@default_tracer.traced("app_ops_dining_table.update_position")
 async def update_position(
     dining_table_id,
     request: schema_dining_table.SchemaUpdatePosition,
+    expected_last_updated_on=None,
     update_position_func=persistence_batch_ops_dining_table.update_position,
-):
-    await app_ops_utils.affect_existing_row(
-        update_position_func,
+    list_cache=default_list_cache,
+) -> schema_dining_table.SchemaDiningTableDisplay:
+    # Also invalidated when the row was changed concurrently, so that
+    # the current version is read from the database rather than the cache.
+    try:
+        return await app_ops_utils.affect_existing_row(
+            update_position_func,
+            UpdatePositionError,
+            dining_table_id=dining_table_id,
+            request=request,
+            expected_last_updated_on=expected_last_updated_on,
+        )
+    finally:
+        list_cache.invalidate(LIST_CACHE_ENTITY)
+
+
+@default_tracer.traced("app_ops_dining_table.update_positions")
+async def update_positions(
+    requests: dict[object, schema_dining_table.SchemaUpdatePosition],
+    update_positions_func=persistence_batch_ops_dining_table.update_positions,
+    list_cache=default_list_cache,
+) -> list[schema_dining_table.SchemaDiningTableBatchResult]:
+    """
+    Updates the positions of the specified dining tables, keyed by
+    dining table id, in a single transaction.
+    Returns one result per dining table id, in the same order.
+    """
+    return await _affect_existing_rows(
+        update_positions_func,
         UpdatePositionError,
-        dining_table_id=dining_table_id,
-        request=request,
+        list(requests),
+        requests,
+        list_cache=list_cache,
     )
 
 
+@default_tracer.traced("app_ops_dining_table.update_size")
 async def update_size(
     dining_table_id,
     request: schema_dining_table.SchemaUpdateSize,
+    expected_last_updated_on=None,
     update_size_func=persistence_batch_ops_dining_table.update_size,
-):
-    await app_ops_utils.affect_existing_row(
-        update_size_func,
-        UpdateSizeError,
-        dining_table_id=dining_table_id,
-        request=request,
-    )
+    list_cache=default_list_cache,
+) -> schema_dining_table.SchemaDiningTableDisplay:
+    try:
+        return await app_ops_utils.affect_existing_row(
+            update_size_func,
+            UpdateSizeError,
+            dining_table_id=dining_table_id,
+            request=request,
+            expected_last_updated_on=expected_last_updated_on,
+        )
+    finally:
+        list_cache.invalidate(LIST_CACHE_ENTITY)
 
 
+@default_tracer.traced("app_ops_dining_table.update_name")
 async def update_name(
     dining_table_id,
     request: schema_dining_table.SchemaUpdateName,
+    expected_last_updated_on=None,
     update_name_func=persistence_batch_ops_dining_table.update_name,
     validate_dining_table_name_func: Callable[[str], None] = validate_dining_table_name,
-):
+    list_cache=default_list_cache,
+) -> schema_dining_table.SchemaDiningTableDisplay:
     try:
-        validate_dining_table_name_func(request.name)
+        with default_tracer.span("validation"):
+            validate_dining_table_name_func(request.name)
     except ValueError as ve:
         raise UpdateNameError(ve) from ve
 
-    await app_ops_utils.affect_existing_row(
-        update_name_func,
-        UpdateNameError,
-        dining_table_id=dining_table_id,
-        request=request,
+    try:
+        return await app_ops_utils.affect_existing_row(
+            update_name_func,
+            UpdateNameError,
+            dining_table_id=dining_table_id,
+            request=request,
+            expected_last_updated_on=expected_last_updated_on,
+        )
+    finally:
+        list_cache.invalidate(LIST_CACHE_ENTITY)
+
+
+@default_tracer.traced("app_ops_dining_table.update_dining_tables")
+async def update_dining_tables(
+    requests: dict[object, schema_dining_table.SchemaUpdateDiningTable],
+    expected_last_updated_on: dict = None,
+    update_dining_tables_func=persistence_batch_ops_dining_table.update_dining_tables,
+    validate_dining_table_name_func: Callable[[str], None] = validate_dining_table_name,
+    list_cache=default_list_cache,
+) -> list[schema_dining_table.SchemaDiningTableBatchResult]:
+    """
+    Applies the fields set in each request to the dining table with
+    the matching id, keyed by dining table id, in a single transaction.
+    Returns one result per dining table id, in the same order.
+
+    expected_last_updated_on maps dining table ids to the last_updated_on
+    they were read with. Those dining tables are only updated if they have
+    not been written since, else their result holds CHANGED_SINCE_READ.
+    """
+    validation_errors = {}
+    with default_tracer.span("validation"):
+        for dining_table_id, request in requests.items():
+            if request.name is None:
+                continue
+            try:
+                validate_dining_table_name_func(request.name)
+            except ValueError as ve:
+                validation_errors[dining_table_id] = str(ve)
+
+    valid_requests = {
+        dining_table_id: request
+        for dining_table_id, request in requests.items()
+        if dining_table_id not in validation_errors
+    }
+    results = dict(
+        zip(
+            valid_requests,
+            await _affect_existing_rows(
+                update_dining_tables_func,
+                UpdateDiningTablesError,
+                list(valid_requests),
+                valid_requests,
+                expected_last_updated_on={
+                    dining_table_id: last_updated_on
+                    for dining_table_id, last_updated_on in (
+                        expected_last_updated_on or {}
+                    ).items()
+                    if dining_table_id in valid_requests
+                },
+                list_cache=list_cache,
+            ),
+        )
+    )
+
+    return [
+        (
+            schema_dining_table.SchemaDiningTableBatchResult(
+                dining_table_id=dining_table_id,
+                error=validation_errors[dining_table_id],
+            )
+            if dining_table_id in validation_errors
+            else results[dining_table_id]
+        )
+        for dining_table_id in requests
+    ]
+
+
+@default_tracer.traced("app_ops_dining_table.delete_dining_tables")
+async def delete_dining_tables(
+    dining_table_ids: list,
+    delete_dining_tables_func=persistence_batch_ops_dining_table.delete_dining_tables,
+    list_cache=default_list_cache,
+) -> list[schema_dining_table.SchemaDiningTableBatchResult]:
+    """
+    Deletes the specified dining tables in a single transaction.
+    Returns one result per dining table id, in the same order.
+    """
+    return await _affect_existing_rows(
+        delete_dining_tables_func,
+        DeleteDiningTableError,
+        dining_table_ids,
+        dining_table_ids,
+        list_cache=list_cache,
     )
 
 
+async def _affect_existing_rows(
+    affect_existing_rows_func: Callable[..., list],
+    error_to_raise: Callable[[Exception], Exception],
+    dining_table_ids: list,
+    request,
+    expected_last_updated_on: dict = None,
+    list_cache=default_list_cache,
+) -> list[schema_dining_table.SchemaDiningTableBatchResult]:
+    """
+    affect_existing_rows_func reports either the ids of the affected rows
+    or the affected dining tables, which are then included in the results.
+
+    expected_last_updated_on, when not empty, is passed on to
+    affect_existing_rows_func, and the rows it holds that were not
+    affected are reported with CHANGED_SINCE_READ.
+    """
+    if not dining_table_ids:
+        return []
+
+    kwargs = {}
+    if expected_last_updated_on:
+        kwargs["expected_last_updated_on"] = expected_last_updated_on
+    version_checked_ids = {
+        str(dining_table_id) for dining_table_id in expected_last_updated_on or {}
+    }
+
+    try:
+        affected_rows = await affect_existing_rows_func(request, **kwargs)
+    except PersistenceOpsBaseError as poe:
+        raise error_to_raise(poe) from poe
+
+    affected_by_id = {}
+    for affected_row in affected_rows:
+        if isinstance(affected_row, schema_dining_table.SchemaDiningTableDisplay):
+            affected_by_id[str(affected_row.id)] = affected_row
+        else:
+            affected_by_id[str(affected_row)] = None
+
+    list_cache.invalidate(LIST_CACHE_ENTITY)
+    return [
+        schema_dining_table.SchemaDiningTableBatchResult(
+            dining_table_id=dining_table_id,
+            dining_table=affected_by_id.get(str(dining_table_id)),
+            error=(
+                None
+                if str(dining_table_id) in affected_by_id
+                else (
+                    CHANGED_SINCE_READ
+                    if str(dining_table_id) in version_checked_ids
+                    else "No rows were affected."
+                )
+            ),
+        )
+        for dining_table_id in dining_table_ids
+    ]
+
+
+@default_tracer.traced("app_ops_dining_table.get_dining_table_list")
 async def get_dining_table_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     select_dining_table_list_func=persistence_batch_ops_dining_table.select_dining_table_list,
+    list_cache=default_list_cache,
 ):
-    return await app_ops_utils.get_data_list(
-        page_index,
-        page_size,
-        sort_by,
-        select_dining_table_list_func,
-        GetDiningTableListError,
+    return await list_cache.get_or_load(
+        LIST_CACHE_ENTITY,
+        (page_index, page_size, sort_by, after),
+        lambda: app_ops_utils.get_data_list(
+            page_index,
+            page_size,
+            sort_by,
+            select_dining_table_list_func,
+            GetDiningTableListError,
+            after=after,
+        ),
     )
+
+
+class DiningTableEditSession(EditSession):
+    """
+    Edit session for the floor plan. Position, size and name changes
+    apply to the in-memory layout immediately and are tracked as a diff
+    per dining table id, which commit writes with update_dining_tables
+    in a single transaction and revert discards.
+
+    The last_updated_on each dining table was read with is tracked too,
+    and refreshed from the rows written by commit, so that a dining table
+    changed by someone else since is not overwritten. Such changes are
+    dropped from the session and reported as a ConcurrentUpdateError,
+    so the caller can reload the dining tables. Changes to dining tables
+    tracked without last_updated_on that no longer exist are dropped too,
+    and reported as an UpdateDiningTablesError.
+    """
+
+    def __init__(
+        self,
+        update_dining_tables_func=persistence_batch_ops_dining_table.update_dining_tables,
+    ):
+        super().__init__(self._write)
+        self.update_dining_tables_func = update_dining_tables_func
+        self._last_updated_on: dict = {}
+
+    def track_dining_table(
+        self, dining_table_id, name: str, x, y, width, height, last_updated_on=None
+    ):
+        self.track(dining_table_id, name=name, x=x, y=y, width=width, height=height)
+        self._last_updated_on[dining_table_id] = last_updated_on
+
+    def untrack(self, key):
+        super().untrack(key)
+        self._last_updated_on.pop(key, None)
+
+    def update_position(
+        self, dining_table_id, request: schema_dining_table.SchemaUpdatePosition
+    ):
+        self.edit(dining_table_id, x=request.x, y=request.y)
+
+    def update_size(
+        self, dining_table_id, request: schema_dining_table.SchemaUpdateSize
+    ):
+        self.edit(dining_table_id, width=request.width, height=request.height)
+
+    def update_name(
+        self,
+        dining_table_id,
+        request: schema_dining_table.SchemaUpdateName,
+        validate_dining_table_name_func: Callable[
+            [str], None
+        ] = validate_dining_table_name,
+    ):
+        try:
+            validate_dining_table_name_func(request.name)
+        except ValueError as ve:
+            raise UpdateNameError(ve) from ve
+
+        self.edit(dining_table_id, name=request.name)
+
+    async def commit(self) -> list[schema_dining_table.SchemaDiningTableBatchResult]:
+        results = await super().commit()
+        for result in results:
+            if (
+                result.dining_table is not None
+                and result.dining_table_id in self._last_updated_on
+            ):
+                self._last_updated_on[result.dining_table_id] = (
+                    result.dining_table.last_updated_on
+                )
+
+        failed_results = [result for result in results if not result.succeeded]
+        if failed_results:
+            for result in failed_results:
+                self.untrack(result.dining_table_id)
+            message = "; ".join(
+                f"{result.dining_table_id}: {result.error}" for result in failed_results
+            )
+            if any(result.error == CHANGED_SINCE_READ for result in failed_results):
+                raise ConcurrentUpdateError(message)
+            raise UpdateDiningTablesError(message)
+        return results
+
+    async def _write(self, changes_by_id: dict):
+        return await update_dining_tables(
+            {
+                dining_table_id: schema_dining_table.SchemaUpdateDiningTable(**changes)
+                for dining_table_id, changes in changes_by_id.items()
+            },
+            expected_last_updated_on={
+                dining_table_id: self._last_updated_on[dining_table_id]
+                for dining_table_id in changes_by_id
+                if self._last_updated_on.get(dining_table_id) is not None
+            },
+            update_dining_tables_func=self.update_dining_tables_func,
+        )
@@ -16,13 +16,18 @@ from src.app.ops.exceptions.app_ops_exceptions import (
     GetMenuByIdError,
     GetMenuListError,
     UpdateNameError,
+    UpsertMenusError,
 )
 from src.app.ops.utils import app_ops_utils
+from src.app.ops.utils.list_cache import default_list_cache
 from src.persistence.database.ops import db_batch_ops_menu as persistence_batch_ops_menu
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_menu
+from src.utils.tracing import default_tracer
+
+LIST_CACHE_ENTITY = "menu"
 
 
 def validate_menu_name(text: str):
@@ -33,10 +38,12 @@ def validate_menu_name(text: str):
         raise ValueError("Invalid menu name format.")
 
 
+@default_tracer.traced("app_ops_menu.create_menu")
 async def create_menu(
     request: schema_menu.SchemaMenuCreate,
     insert_menu_func=persistence_batch_ops_menu.insert_menu,
     validate_menu_name_func: Callable[[str], None] = validate_menu_name,
+    list_cache=default_list_cache,
 ) -> schema_menu.SchemaMenuDisplay:
     try:
         validate_menu_name_func(request.name)
@@ -44,47 +51,105 @@ async def create_menu(
         raise CreateMenuError(ve) from ve
 
     try:
-        return await insert_menu_func(request)
+        new_record = await insert_menu_func(request)
     except PersistenceOpsBaseError as poe:
         raise CreateMenuError(poe) from poe
 
+    list_cache.invalidate(LIST_CACHE_ENTITY)
+    return new_record
+
+
+@default_tracer.traced("app_ops_menu.upsert_menus")
+async def upsert_menus(
+    requests: list[schema_menu.SchemaMenuUpsert],
+    upsert_menus_func=persistence_batch_ops_menu.upsert_menus,
+    validate_menu_name_func: Callable[[str], None] = validate_menu_name,
+    list_cache=default_list_cache,
+) -> list[schema_menu.SchemaMenuDisplay]:
+    """
+    Inserts or renames the specified menus, keyed by id, in a single
+    transaction, e.g. to sync them from a central system. Running the same
+    import again changes nothing. Returns the menus that were inserted
+    or renamed. Nothing is written if any of the names is invalid.
+    """
+    for request in requests:
+        try:
+            validate_menu_name_func(request.name)
+        except ValueError as ve:
+            raise UpsertMenusError(f"{request.id}: {ve}") from ve
+
+    try:
+        upserted_menus = await upsert_menus_func(requests)
+    except PersistenceOpsBaseError as poe:
+        raise UpsertMenusError(poe) from poe
+
+    if upserted_menus:
+        list_cache.invalidate(LIST_CACHE_ENTITY)
+    return upserted_menus
 
+
+@default_tracer.traced("app_ops_menu.delete_menu")
 async def delete_menu(
     menu_id,
     delete_menu_func=persistence_batch_ops_menu.delete_menu,
+    list_cache=default_list_cache,
 ):
     await app_ops_utils.affect_existing_row(
         delete_menu_func, DeleteMenuError, menu_id=menu_id
     )
+    list_cache.invalidate(LIST_CACHE_ENTITY)
 
 
+@default_tracer.traced("app_ops_menu.update_name")
 async def update_name(
     menu_id,
     request: schema_menu.SchemaUpdateName,
+    expected_last_updated_on=None,
     update_name_func=persistence_batch_ops_menu.update_name,
     validate_menu_name_func: Callable[[str], None] = validate_menu_name,
-):
+    list_cache=default_list_cache,
+) -> schema_menu.SchemaMenuDisplay:
     try:
         validate_menu_name_func(request.name)
     except ValueError as ve:
         raise UpdateNameError(ve) from ve
 
-    await app_ops_utils.affect_existing_row(
-        update_name_func, UpdateNameError, menu_id=menu_id, request=request
-    )
-
-
+    try:
+        return await app_ops_utils.affect_existing_row(
+            update_name_func,
+            UpdateNameError,
+            menu_id=menu_id,
+            request=request,
+            expected_last_updated_on=expected_last_updated_on,
+        )
+    finally:
+        list_cache.invalidate(LIST_CACHE_ENTITY)
+
+
+@default_tracer.traced("app_ops_menu.get_menu_list")
 async def get_menu_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     select_menu_list_func=persistence_batch_ops_menu.select_menu_list,
+    list_cache=default_list_cache,
 ):
-    return await app_ops_utils.get_data_list(
-        page_index, page_size, sort_by, select_menu_list_func, GetMenuListError
+    return await list_cache.get_or_load(
+        LIST_CACHE_ENTITY,
+        (page_index, page_size, sort_by, after),
+        lambda: app_ops_utils.get_data_list(
+            page_index,
+            page_size,
+            sort_by,
+            select_menu_list_func,
+            GetMenuListError,
+            after=after,
+        ),
     )
 
 
+@default_tracer.traced("app_ops_menu.get_menu_by_id")
 async def get_menu_by_id(
     menu_id: UUID,
     select_menu_by_id_func=persistence_batch_ops_menu.select_menu_by_id,
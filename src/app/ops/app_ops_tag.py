@@ -16,13 +16,18 @@ from src.app.ops.exceptions.app_ops_exceptions import (
     GetTagByIdError,
     GetTagListError,
     UpdateNameError,
+    UpsertTagsError,
 )
 from src.app.ops.utils import app_ops_utils
+from src.app.ops.utils.list_cache import default_list_cache
 from src.persistence.database.ops import db_batch_ops_tag as persistence_batch_ops_tag
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_tag
+from src.utils.tracing import default_tracer
+
+LIST_CACHE_ENTITY = "tag"
 
 
 def validate_tag_name(text: str):
@@ -33,10 +38,12 @@ def validate_tag_name(text: str):
         raise ValueError("Invalid tag name format.")
 
 
+@default_tracer.traced("app_ops_tag.create_tag")
 async def create_tag(
     request: schema_tag.SchemaTagCreate,
     insert_tag_func=persistence_batch_ops_tag.insert_tag,
     validate_tag_name_func: Callable[[str], None] = validate_tag_name,
+    list_cache=default_list_cache,
 ) -> schema_tag.SchemaTagDisplay:
     try:
         validate_tag_name_func(request.name)
@@ -44,47 +51,105 @@ async def create_tag(
         raise CreateTagError(ve) from ve
 
     try:
-        return await insert_tag_func(request)
+        new_record = await insert_tag_func(request)
     except PersistenceOpsBaseError as poe:
         raise CreateTagError(poe) from poe
 
+    list_cache.invalidate(LIST_CACHE_ENTITY)
+    return new_record
+
+
+@default_tracer.traced("app_ops_tag.upsert_tags")
+async def upsert_tags(
+    requests: list[schema_tag.SchemaTagUpsert],
+    upsert_tags_func=persistence_batch_ops_tag.upsert_tags,
+    validate_tag_name_func: Callable[[str], None] = validate_tag_name,
+    list_cache=default_list_cache,
+) -> list[schema_tag.SchemaTagDisplay]:
+    """
+    Inserts or renames the specified tags, keyed by id, in a single
+    transaction, e.g. to sync them from a central system. Running the same
+    import again changes nothing. Returns the tags that were inserted
+    or renamed. Nothing is written if any of the names is invalid.
+    """
+    for request in requests:
+        try:
+            validate_tag_name_func(request.name)
+        except ValueError as ve:
+            raise UpsertTagsError(f"{request.id}: {ve}") from ve
+
+    try:
+        upserted_tags = await upsert_tags_func(requests)
+    except PersistenceOpsBaseError as poe:
+        raise UpsertTagsError(poe) from poe
+
+    if upserted_tags:
+        list_cache.invalidate(LIST_CACHE_ENTITY)
+    return upserted_tags
 
+
+@default_tracer.traced("app_ops_tag.delete_tag")
 async def delete_tag(
     tag_id,
     delete_tag_func=persistence_batch_ops_tag.delete_tag,
+    list_cache=default_list_cache,
 ):
     await app_ops_utils.affect_existing_row(
         delete_tag_func, DeleteTagError, tag_id=tag_id
     )
+    list_cache.invalidate(LIST_CACHE_ENTITY)
 
 
+@default_tracer.traced("app_ops_tag.update_name")
 async def update_name(
     tag_id,
     request: schema_tag.SchemaUpdateName,
+    expected_last_updated_on=None,
     update_name_func=persistence_batch_ops_tag.update_name,
     validate_tag_name_func: Callable[[str], None] = validate_tag_name,
-):
+    list_cache=default_list_cache,
+) -> schema_tag.SchemaTagDisplay:
     try:
         validate_tag_name_func(request.name)
     except ValueError as ve:
         raise UpdateNameError(ve) from ve
 
-    await app_ops_utils.affect_existing_row(
-        update_name_func, UpdateNameError, tag_id=tag_id, request=request
-    )
-
-
+    try:
+        return await app_ops_utils.affect_existing_row(
+            update_name_func,
+            UpdateNameError,
+            tag_id=tag_id,
+            request=request,
+            expected_last_updated_on=expected_last_updated_on,
+        )
+    finally:
+        list_cache.invalidate(LIST_CACHE_ENTITY)
+
+
+@default_tracer.traced("app_ops_tag.get_tag_list")
 async def get_tag_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     select_tag_list_func=persistence_batch_ops_tag.select_tag_list,
+    list_cache=default_list_cache,
 ):
-    return await app_ops_utils.get_data_list(
-        page_index, page_size, sort_by, select_tag_list_func, GetTagListError
+    return await list_cache.get_or_load(
+        LIST_CACHE_ENTITY,
+        (page_index, page_size, sort_by, after),
+        lambda: app_ops_utils.get_data_list(
+            page_index,
+            page_size,
+            sort_by,
+            select_tag_list_func,
+            GetTagListError,
+            after=after,
+        ),
     )
 
 
+@default_tracer.traced("app_ops_tag.get_tag_by_id")
 async def get_tag_by_id(
     tag_id: UUID,
     select_tag_by_id_func=persistence_batch_ops_tag.select_tag_by_id,
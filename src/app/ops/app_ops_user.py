@@ -19,12 +19,15 @@ from src.app.ops.exceptions.app_ops_exceptions import (
     GetUserByUsernameError,
     GetUserListError,
     LoginError,
+    UpsertUsersError,
 )
 from src.app.ops.utils import app_ops_utils
+from src.app.ops.utils.credential_cache import default_credential_cache
 from src.persistence.database.ops import db_batch_ops_user as persistence_batch_ops_user
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
+from src.utils.tracing import default_tracer
 
 
 def validate_password(text: str):
@@ -43,6 +46,7 @@ def validate_pin(text: str):
         raise ValueError("Invalid PIN format.")
 
 
+@default_tracer.traced("app_ops_user.create_user")
 async def create_user(
     request: schema_user.SchemaUserCreate,
     insert_user_func=persistence_batch_ops_user.insert_user,
@@ -59,39 +63,98 @@ async def create_user(
         raise CreateUserError(poe) from poe
 
 
-async def delete_user(user_id, delete_user_func=persistence_batch_ops_user.delete_user):
-    await app_ops_utils.affect_existing_row(
-        delete_user_func, DeleteUserError, user_id=user_id
-    )
+@default_tracer.traced("app_ops_user.upsert_users")
+async def upsert_users(
+    requests: list[schema_user.SchemaUserCreate],
+    update_passwords: bool = False,
+    upsert_users_func=persistence_batch_ops_user.upsert_users,
+    validate_password_func: Callable[[str], None] = validate_password,
+    credential_cache=default_credential_cache,
+) -> list[schema_user.SchemaUserDisplay]:
+    """
+    Creates the specified users whose username does not exist yet, in a
+    single transaction, and returns them. Unlike create_user, this is safe
+    to run again with the same requests. The passwords of existing users
+    are only changed, and those users returned, if update_passwords is set.
+    Nothing is written if any of the passwords is invalid.
+    """
+    for request in requests:
+        try:
+            validate_password_func(request.password)
+        except ValueError as ve:
+            raise UpsertUsersError(f"{request.username}: {ve}") from ve
+
+    try:
+        upserted_users = await upsert_users_func(
+            requests, update_passwords=update_passwords
+        )
+    except PersistenceOpsBaseError as poe:
+        raise UpsertUsersError(poe) from poe
 
+    for user in upserted_users:
+        credential_cache.invalidate_user(user.id)
+    return upserted_users
+
+
+@default_tracer.traced("app_ops_user.delete_user")
+async def delete_user(
+    user_id,
+    delete_user_func=persistence_batch_ops_user.delete_user,
+    credential_cache=default_credential_cache,
+):
+    try:
+        await app_ops_utils.affect_existing_row(
+            delete_user_func, DeleteUserError, user_id=user_id
+        )
+    finally:
+        credential_cache.invalidate_user(user_id)
 
+
+@default_tracer.traced("app_ops_user.change_password")
 async def change_password(
     user_id,
     request: schema_user.SchemaChangePassword,
+    expected_last_updated_on=None,
     update_password_func=persistence_batch_ops_user.update_password,
     validate_password_func: Callable[[str], None] = validate_password,
-):
+    credential_cache=default_credential_cache,
+) -> schema_user.SchemaUserDisplay:
     try:
         validate_password_func(request.new_password)
     except ValueError as ve:
         raise ChangePasswordError(ve) from ve
 
-    await app_ops_utils.affect_existing_row(
-        update_password_func, ChangePasswordError, user_id=user_id, request=request
-    )
-
-
+    try:
+        return await app_ops_utils.affect_existing_row(
+            update_password_func,
+            ChangePasswordError,
+            user_id=user_id,
+            request=request,
+            expected_last_updated_on=expected_last_updated_on,
+        )
+    finally:
+        credential_cache.invalidate_user(user_id)
+
+
+@default_tracer.traced("app_ops_user.get_user_list")
 async def get_user_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     select_user_list_func=persistence_batch_ops_user.select_user_list,
 ):
     return await app_ops_utils.get_data_list(
-        page_index, page_size, sort_by, select_user_list_func, GetUserListError
+        page_index,
+        page_size,
+        sort_by,
+        select_user_list_func,
+        GetUserListError,
+        after=after,
     )
 
 
+@default_tracer.traced("app_ops_user.get_user_by_id")
 async def get_user_by_id(
     user_id: UUID,
     select_user_by_id_func=persistence_batch_ops_user.select_user_by_id,
@@ -102,6 +165,7 @@ async def get_user_by_id(
         raise GetUserByIdError(poe) from poe
 
 
+@default_tracer.traced("app_ops_user.get_user_by_username")
 async def get_user_by_username(
     username: str,
     select_user_by_username_func=persistence_batch_ops_user.select_user_by_username,
@@ -115,15 +179,26 @@ async def get_user_by_username(
         raise GetUserByUsernameError(poe) from poe
 
 
+@default_tracer.traced("app_ops_user.login")
 async def login(
     username: str,
     password: str,
     select_user_by_username_and_password_func=persistence_batch_ops_user.select_user_by_username_and_password,
+    credential_cache=default_credential_cache,
 ):
     if not username or not password:
         return None
 
+    user = credential_cache.get(username, password)
+    if user is not None:
+        return user
+
+    generation = credential_cache.generation
     try:
-        return await select_user_by_username_and_password_func(username, password)
+        user = await select_user_by_username_and_password_func(username, password)
     except PersistenceOpsBaseError as poe:
         raise LoginError(poe) from poe
+
+    if user is not None:
+        credential_cache.put(username, password, user, generation=generation)
+    return user
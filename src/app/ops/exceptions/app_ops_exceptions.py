@@ -6,6 +6,11 @@ class OpsBaseError(Exception):
         super().__init__(str(original_exception))
 
 
+class ConcurrentUpdateError(OpsBaseError):
+    def __init__(self, original_exception: Optional[Exception] = None):
+        super().__init__(str(original_exception))
+
+
 class CreateUserError(OpsBaseError):
     def __init__(self, original_exception: Optional[Exception] = None):
         super().__init__(str(original_exception))
@@ -36,6 +41,11 @@ class GetUserByUsernameError(OpsBaseError):
         super().__init__(str(original_exception))
 
 
+class UpsertUsersError(OpsBaseError):
+    def __init__(self, original_exception: Optional[Exception] = None):
+        super().__init__(str(original_exception))
+
+
 class LoginError(OpsBaseError):
     def __init__(self, original_exception: Optional[Exception] = None):
         super().__init__(str(original_exception))
@@ -66,6 +76,11 @@ class UpdateNameError(OpsBaseError):
         super().__init__(str(original_exception))
 
 
+class UpdateDiningTablesError(OpsBaseError):
+    def __init__(self, original_exception: Optional[Exception] = None):
+        super().__init__(str(original_exception))
+
+
 class GetDiningTableListError(OpsBaseError):
     def __init__(self, original_exception: Optional[Exception] = None):
         super().__init__(str(original_exception))
@@ -91,6 +106,11 @@ class GetMenuByIdError(OpsBaseError):
         super().__init__(str(original_exception))
 
 
+class UpsertMenusError(OpsBaseError):
+    def __init__(self, original_exception: Optional[Exception] = None):
+        super().__init__(str(original_exception))
+
+
 class CreateTagError(OpsBaseError):
     def __init__(self, original_exception: Optional[Exception] = None):
         super().__init__(str(original_exception))
@@ -109,3 +129,8 @@ class GetTagByIdError(OpsBaseError):
 class GetTagListError(OpsBaseError):
     def __init__(self, original_exception: Optional[Exception] = None):
         super().__init__(str(original_exception))
+
+
+class UpsertTagsError(OpsBaseError):
+    def __init__(self, original_exception: Optional[Exception] = None):
+        super().__init__(str(original_exception))
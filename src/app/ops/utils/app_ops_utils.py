@@ -1,41 +1,64 @@
 from typing import Callable
 
+from src.app.ops.exceptions.app_ops_exceptions import ConcurrentUpdateError
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
+from src.utils import paging_cursor
+from src.utils.tracing import default_tracer
 
 
+@default_tracer.traced("app_ops_utils.affect_existing_row")
 async def affect_existing_row(
     affect_existing_row_func: Callable[..., int],
     error_to_raise: Callable[[Exception], Exception],
+    expected_last_updated_on=None,
     **kwargs: any
 ):
     """
     Generic function for calling persistent operations that affect only 1 row,
     i.e. deleting or updating a record.
     The persistent function specified as the argument affect_existing_row_func
-    needs to report the number of rows affected. This function will assess
-    the rowcount and raise the specified error if anything by 1 row was affected.
+    needs to report the number of rows affected, either as a count or as
+    the list of affected rows. This function will assess the rowcount and
+    raise the specified error if anything by 1 row was affected.
+    Returns the affected row if a list was reported, else None.
+
+    expected_last_updated_on is the last_updated_on of the row as read by
+    the caller. When provided, it is passed on to affect_existing_row_func,
+    which must then only affect the row if it has not been written since,
+    and ConcurrentUpdateError is raised if no row was affected.
 
     kwargs represents any additional parameters that should be provided
     to the implementation of affect_existing_row_func.
     """
+    if expected_last_updated_on is not None:
+        kwargs["expected_last_updated_on"] = expected_last_updated_on
+
     try:
-        rowcount = await affect_existing_row_func(**kwargs)
+        affected = await affect_existing_row_func(**kwargs)
+        rowcount = len(affected) if isinstance(affected, list) else affected
         if rowcount > 1:
             raise PersistenceOpsBaseError("More than 1 row was affected.")
-        if rowcount < 1:
+        if rowcount < 1 and expected_last_updated_on is None:
             raise PersistenceOpsBaseError("No rows were affected.")
     except PersistenceOpsBaseError as poe:
         raise error_to_raise(poe) from poe
 
+    if rowcount < 1:
+        raise ConcurrentUpdateError("The row was changed or deleted since it was read.")
+
+    return affected[0] if isinstance(affected, list) else None
 
+
+@default_tracer.traced("app_ops_utils.get_data_list")
 async def get_data_list(
     page_index: int,
     page_size: int,
     sort_by: str,
     select_data_list_func: Callable[..., list],
     error_to_raise: Callable[[Exception], Exception],
+    after: str = None,
     **kwargs: any
 ):
     """
@@ -49,6 +72,14 @@ async def get_data_list(
         page_size: int,
         sort_by: str,
 
+    and, when after is provided, also:
+
+        after: str,
+
+    after is the cursor returned by get_next_cursor for the previous page.
+    When provided, the page following the cursor is returned and
+    page_index is ignored.
+
     Use error_to_raise to specify an error that is related to the
     implementation of select_data_list_func.
 
@@ -66,9 +97,23 @@ async def get_data_list(
     func_kwargs.update(
         {"page_index": page_index, "page_size": page_size, "sort_by": sort_by}
     )
+    if after is not None:
+        func_kwargs["after"] = after
 
     try:
         return await select_data_list_func(**func_kwargs)
 
     except PersistenceOpsBaseError as poe:
         raise error_to_raise(poe) from poe
+
+
+def get_next_cursor(data_list: list, sort_by: str):
+    """
+    Returns the cursor to provide as after to get_data_list in order to
+    fetch the page following data_list, or None if data_list is empty.
+
+    sort_by must be the same sort string used to fetch data_list.
+    """
+    if not data_list:
+        return None
+    return paging_cursor.encode_cursor(data_list[-1], sort_by)
@@ -0,0 +1,119 @@
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from src.configuration import Configuration
+
+
+class CredentialCache:
+    """
+    Memory-only cache of successful logins, so that a repeat login with
+    the same username and password skips the database lookup and the
+    bcrypt verification.
+
+    Passwords are never stored. Each entry holds an HMAC-SHA256 digest of
+    the username and password, keyed with a random secret generated per
+    process, so the cache contents are useless outside of this process.
+
+    Entries expire ttl seconds after the login was verified, and the least
+    recently used entries are evicted once max_size entries are held.
+    A ttl of 0 or less disables the cache.
+    The ttl also bounds how long a password changed on another terminal
+    keeps working here, as only local changes invalidate entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._secret = os.urandom(32)
+        self._entries: OrderedDict = OrderedDict()
+        self.generation = 0
+
+    @property
+    def enabled(self):
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, username: str, password: str):
+        """
+        Returns the user cached for the specified credentials,
+        or None if they were not verified recently.
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(username)
+        if entry is None:
+            return None
+
+        expires_on, digest, user = entry
+        if expires_on <= self.clock():
+            del self._entries[username]
+            return None
+
+        if not hmac.compare_digest(digest, self._digest(username, password)):
+            return None
+
+        self._entries.move_to_end(username)
+        return user
+
+    def put(self, username: str, password: str, user, generation: int = None):
+        """
+        Caches the specified user as verified for the specified credentials.
+
+        - *generation* The generation read before the verification started.
+        If any user was invalidated since, the entry is not stored, as the
+        verification may have used a password that has since changed.
+        """
+        if not self.enabled:
+            return
+
+        if generation is not None and generation != self.generation:
+            return
+
+        self._entries[username] = (
+            self.clock() + self.ttl,
+            self._digest(username, password),
+            user,
+        )
+        self._entries.move_to_end(username)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id):
+        """
+        Drops the entry of the specified user, if any.
+        """
+        self.generation += 1
+        for username in [
+            username
+            for username, (_, _, user) in self._entries.items()
+            if str(user.id) == str(user_id)
+        ]:
+            del self._entries[username]
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _digest(self, username: str, password: str):
+        message = f"{len(username)}:{username}{password}".encode("utf-8")
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
+
+
+# Shared by app_ops_user.
+default_credential_cache = CredentialCache(
+    max_size=Configuration.CREDENTIAL_CACHE__MAX_SIZE,
+    ttl=Configuration.CREDENTIAL_CACHE__TTL,
+)
@@ -0,0 +1,98 @@
+from typing import Awaitable, Callable
+
+
+class EditSession:
+    """
+    Tracks in-memory edits to a set of records as a diff against their
+    last committed values, so that they can be written together with
+    commit or discarded with revert.
+
+    Records are registered with track, giving their committed values.
+    edit records changes; a field edited back to its committed value
+    drops out of the diff, so undoing a change by hand leaves nothing
+    to write.
+
+    commit_func receives a dict of key to changed fields (a dict of field
+    to value) and must write them all in a single transaction. Nothing is
+    committed if it raises, and the edits are kept so the user can retry.
+    """
+
+    def __init__(self, commit_func: Callable[[dict], Awaitable[list]]):
+        self.commit_func = commit_func
+        self._committed: dict = {}
+        self._edits: dict = {}
+
+    @property
+    def has_changes(self):
+        return bool(self._edits)
+
+    def track(self, key, **values):
+        """
+        Registers a record with its committed values,
+        dropping any edits made to it.
+        """
+        self._committed[key] = dict(values)
+        self._edits.pop(key, None)
+
+    def untrack(self, key):
+        """Stops tracking a record, e.g. once it is deleted."""
+        self._committed.pop(key, None)
+        self._edits.pop(key, None)
+
+    def edit(self, key, **changes):
+        committed = self._committed[key]
+        edits = self._edits.setdefault(key, {})
+        for field, value in changes.items():
+            if committed.get(field) == value:
+                edits.pop(field, None)
+            else:
+                edits[field] = value
+        if not edits:
+            del self._edits[key]
+
+    def diff(self):
+        """Returns a copy of the changed fields per key."""
+        return {key: dict(edits) for key, edits in self._edits.items()}
+
+    async def commit(self):
+        """
+        Writes the diff with commit_func and returns its result, or an
+        empty list if there was nothing to write. Edits made while the
+        write is in progress are kept for the next commit.
+        """
+        committing = self.diff()
+        if not committing:
+            return []
+
+        results = await self.commit_func(committing)
+        self._mark_committed(committing)
+        return results
+
+    def revert(self):
+        """
+        Drops all edits and returns the committed values of the edited
+        fields per key, to restore the in-memory records with.
+        """
+        reverted = {
+            key: {field: self._committed[key][field] for field in edits}
+            for key, edits in self._edits.items()
+        }
+        self._edits.clear()
+        return reverted
+
+    def _mark_committed(self, committed_changes: dict):
+        for key, changes in committed_changes.items():
+            if key not in self._committed:
+                continue
+            self._committed[key].update(changes)
+            edits = self._edits.get(key)
+            if edits is None:
+                continue
+            for field in [
+                field
+                for field, value in edits.items()
+                if self._committed[key].get(field) == value
+            ]:
+                del edits[field]
+            if not edits:
+                del self._edits[key]
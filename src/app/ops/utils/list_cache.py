@@ -0,0 +1,97 @@
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from src.configuration import Configuration
+
+DEFAULT_MAX_SIZE = 256
+DEFAULT_TTL = 30.0
+
+
+class ListCache:
+    """
+    In-process read-through cache for data lists, keyed by entity name
+    and the arguments of the list query.
+
+    Entries expire ttl seconds after being loaded, and the least recently
+    used entries are evicted once max_size entries are held.
+    Writes to an entity must call invalidate, which drops its entries and
+    prevents loads that were already in flight from being stored.
+    Only local writes invalidate entries, so the ttl also bounds how long
+    changes made on another terminal take to show here.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._generations: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get_or_load(
+        self, entity: str, key: tuple, load_func: Callable[[], Awaitable[list]]
+    ) -> list:
+        """
+        Returns the cached list for the specified entity and key,
+        or awaits load_func and caches its result.
+        Errors raised by load_func are not cached.
+        """
+        cache_key = (entity, *key)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            expires_on, data_list = entry
+            if expires_on > self.clock():
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return list(data_list)
+            del self._entries[cache_key]
+
+        self.misses += 1
+        generation = self._generations.get(entity, 0)
+        data_list = await load_func()
+        if self._generations.get(entity, 0) == generation:
+            self._put(cache_key, list(data_list))
+        return data_list
+
+    def invalidate(self, entity: str):
+        self._generations[entity] = self._generations.get(entity, 0) + 1
+        for cache_key in [key for key in self._entries if key[0] == entity]:
+            del self._entries[cache_key]
+
+    def clear(self):
+        for entity in list(self._generations):
+            self.invalidate(entity)
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _put(self, cache_key: tuple, data_list: list):
+        self._entries[cache_key] = (self.clock() + self.ttl, data_list)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Shared by the app_ops modules. Its ttl bounds how stale the lists may be
+# after edits on other terminals, so it is kept short, and it also bounds
+# how long the lists preloaded by the warm-up stay warm.
+default_list_cache = ListCache(
+    max_size=Configuration.LIST_CACHE__MAX_SIZE,
+    ttl=Configuration.LIST_CACHE__TTL,
+)
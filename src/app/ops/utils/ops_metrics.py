@@ -0,0 +1,127 @@
+import functools
+import importlib
+import inspect
+import json
+import time
+from typing import Callable
+
+from src.utils.latency_histogram import LatencyHistogram
+
+# The modules whose public coroutines are the entry points used by the UI.
+APP_OPS_MODULE_NAMES = (
+    "src.app.ops.app_ops_dining_table",
+    "src.app.ops.app_ops_menu",
+    "src.app.ops.app_ops_tag",
+    "src.app.ops.app_ops_user",
+)
+
+
+class OpsMetrics:
+    """
+    The latency histogram, call count and error counts of every
+    instrumented app ops entry point. Errors are counted per type of
+    the exception raised, e.g. UpdateNameError or ConcurrentUpdateError.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.errors: dict[str, dict[str, int]] = {}
+        # (module, name) -> the function replaced by install
+        self._originals: dict[tuple, Callable] = {}
+
+    def record(self, name: str, seconds: float, error: Exception = None):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(seconds)
+        if error is not None:
+            errors = self.errors.setdefault(name, {})
+            error_type = type(error).__name__
+            errors[error_type] = errors.get(error_type, 0) + 1
+
+    def instrument(self, func, name: str):
+        """
+        Returns a coroutine function that awaits func and records
+        its latency and error, if any, under the specified name.
+        """
+
+        @functools.wraps(func)
+        async def instrumented(*args, **kwargs):
+            started_on = self.clock()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self.record(name, self.clock() - started_on, e)
+                raise
+            self.record(name, self.clock() - started_on)
+            return result
+
+        return instrumented
+
+    def install(self, modules):
+        """
+        Replaces every public coroutine function defined in the specified
+        modules with its instrumented version. Only callers that look the
+        functions up on the module when calling them are measured, so
+        install before the UI modules are imported.
+        """
+        for module in modules:
+            for name, func in inspect.getmembers(module, inspect.iscoroutinefunction):
+                if name.startswith("_") or func.__module__ != module.__name__:
+                    continue
+                if (module, name) in self._originals:
+                    continue
+                self._originals[(module, name)] = func
+                short_module_name = module.__name__.rsplit(".", 1)[-1]
+                setattr(
+                    module, name, self.instrument(func, f"{short_module_name}.{name}")
+                )
+
+    def uninstall(self):
+        for (module, name), func in self._originals.items():
+            setattr(module, name, func)
+        self._originals.clear()
+
+    def as_dict(self):
+        return {
+            name: {
+                "calls": histogram.count,
+                "errors": dict(sorted(self.errors.get(name, {}).items())),
+                **{
+                    key: value
+                    for key, value in histogram.as_dict().items()
+                    if key != "count"
+                },
+            }
+            for name, histogram in sorted(self.histograms.items())
+        }
+
+    def to_json(self):
+        return json.dumps(self.as_dict(), indent=2, sort_keys=True)
+
+    def write_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(self.to_json())
+            metrics_file.write("\n")
+
+    def reset(self):
+        self.histograms.clear()
+        self.errors.clear()
+
+
+def install_app_ops_metrics(metrics: OpsMetrics = None):
+    """
+    Instruments the entry points of the app ops modules with the
+    specified metrics, the shared default_ops_metrics by default.
+    """
+    metrics = metrics or default_ops_metrics
+    metrics.install(
+        [importlib.import_module(module_name) for module_name in APP_OPS_MODULE_NAMES]
+    )
+    return metrics
+
+
+# Filled once install_app_ops_metrics is called, i.e. when
+# app_ops.metrics is enabled in the configuration.
+default_ops_metrics = OpsMetrics()
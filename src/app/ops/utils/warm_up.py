@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Optional
+
+
+class WarmUpStatus(Enum):
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class WarmUpStep:
+    """
+    A named unit of warm-up work.
+
+    - *name* Shown to the user while the step runs
+    - *func* Awaited to perform the step
+    """
+
+    name: str
+    func: Callable[[], Awaitable]
+
+
+async def run_warm_up(
+    steps: list[WarmUpStep],
+    on_status: Optional[Callable[[str, WarmUpStatus], None]] = None,
+) -> dict:
+    """
+    Runs the specified steps one after another and returns a dict of
+    step name to the error it raised, or None if it succeeded.
+
+    A failed step does not stop the later steps, as everything
+    the warm-up prepares is otherwise loaded on first use.
+
+    - *on_status* Called with the step name and its status
+    when the step starts and when it ends.
+    """
+    results = {}
+    for step in steps:
+        if on_status:
+            on_status(step.name, WarmUpStatus.RUNNING)
+        try:
+            await step.func()
+            results[step.name] = None
+        except Exception as e:
+            results[step.name] = e
+        if on_status:
+            on_status(
+                step.name,
+                (
+                    WarmUpStatus.DONE
+                    if results[step.name] is None
+                    else WarmUpStatus.FAILED
+                ),
+            )
+    return results
@@ -6,8 +6,54 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _getenv_int(key: str, default: int):
+    value = os.getenv(key)
+    return default if value is None or not value.strip() else int(value)
+
+
+def _getenv_bool(key: str, default: bool):
+    value = os.getenv(key)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 class Configuration:
     PERSISTENCE__DATABASE__DATABASE_URL = os.getenv("persistence.database.database_url")
+    PERSISTENCE__DATABASE__POOL_SIZE = _getenv_int("persistence.database.pool_size", 5)
+    PERSISTENCE__DATABASE__MAX_OVERFLOW = _getenv_int(
+        "persistence.database.max_overflow", 10
+    )
+    PERSISTENCE__DATABASE__POOL_RECYCLE = _getenv_int(
+        "persistence.database.pool_recycle", -1
+    )
+    PERSISTENCE__DATABASE__POOL_PRE_PING = _getenv_bool(
+        "persistence.database.pool_pre_ping", False
+    )
+    PERSISTENCE__DATABASE__POOL_TIMEOUT = _getenv_int(
+        "persistence.database.pool_timeout", 30
+    )
+    PERSISTENCE__DATABASE__POOL_WARM_UP_CONNECTIONS = _getenv_int(
+        "persistence.database.pool_warm_up_connections", 0
+    )
+    PERSISTENCE__DATABASE__SQL_TIMING = _getenv_bool(
+        "persistence.database.sql_timing", False
+    )
+    PERSISTENCE__DATABASE__SLOW_QUERY_THRESHOLD_MS = _getenv_int(
+        "persistence.database.slow_query_threshold_ms", 250
+    )
+    BCRYPT__MAX_WORKERS = _getenv_int("bcrypt.max_workers", 4)
+    CREDENTIAL_CACHE__MAX_SIZE = _getenv_int("credential_cache.max_size", 64)
+    CREDENTIAL_CACHE__TTL = _getenv_int("credential_cache.ttl", 0)
+    LIST_CACHE__MAX_SIZE = _getenv_int("list_cache.max_size", 256)
+    LIST_CACHE__TTL = _getenv_int("list_cache.ttl", 10)
+    APP_OPS__METRICS = _getenv_bool("app_ops.metrics", False)
+    APP_OPS__METRICS_PATH = os.getenv("app_ops.metrics_path")
+    WATCHDOG__ENABLED = _getenv_bool("watchdog.enabled", False)
+    WATCHDOG__STALL_THRESHOLD_MS = _getenv_int("watchdog.stall_threshold_ms", 100)
+    WATCHDOG__REPORT_PATH = os.getenv("watchdog.report_path", "loop_stalls.jsonl")
+    TRACING__ENABLED = _getenv_bool("tracing.enabled", False)
+    TRACING__PATH = os.getenv("tracing.path", "traces.jsonl")
     INITIAL_USER_1__USERNAME = os.getenv("initial_user_1.username")
     INITIAL_USER_1__PASSWORD = os.getenv("initial_user_1.password")
     INITIAL_USER_2__USERNAME = os.getenv("initial_user_2.username")
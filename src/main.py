@@ -2,33 +2,47 @@ import asyncio
 import os
 import sys
 
-from PySide6.QtWidgets import QApplication
-from qasync import QEventLoop
+from src.utils.startup_profiler import StartupProfiler
 
-# sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from src.app.ops import app_ops_user
-from src.configuration import Configuration
-from src.persistence.database import session
+PROFILE_STARTUP_ARG = "--profile-startup"
+SQL_STATS_ARG = "--sql-stats"
 
-# Needed to create the database tables
-from src.persistence.database.models import *
-from src.schemas.schema_user import SchemaUserCreate
-from src.ui.orderit import OrderItMainWindow
+# Created before the heavy imports below so that their cost is included.
+profiler = StartupProfiler(enabled=PROFILE_STARTUP_ARG in sys.argv)
+
+with profiler.phase("import Qt"):
+    from PySide6.QtWidgets import QApplication
+    from qasync import QEventLoop
+
+with profiler.phase("import configuration"):
+    # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    from src.configuration import Configuration
+    from src.utils import bcrypt_hash
 
 
 async def setup_database():
+    # The models and the persistence layer are only imported here,
+    # so that a normal start does not pay for mapping them up front.
+    # Needed to create the database tables
+    import src.persistence.database.models  # noqa: F401
+    from src.app.ops import app_ops_user
+    from src.persistence.database import session
+    from src.schemas.schema_user import SchemaUserCreate
+
     await session.create_database_tables()
-    await app_ops_user.create_user(
-        SchemaUserCreate(
-            username=Configuration.INITIAL_USER_1__USERNAME,
-            password=Configuration.INITIAL_USER_1__PASSWORD,
-        )
-    )
-    await app_ops_user.create_user(
-        SchemaUserCreate(
-            username=Configuration.INITIAL_USER_2__USERNAME,
-            password=Configuration.INITIAL_USER_2__PASSWORD,
-        )
+    # Only created if missing, so that the setup can be run again
+    # without resetting the passwords of the existing users.
+    await app_ops_user.upsert_users(
+        [
+            SchemaUserCreate(
+                username=Configuration.INITIAL_USER_1__USERNAME,
+                password=Configuration.INITIAL_USER_1__PASSWORD,
+            ),
+            SchemaUserCreate(
+                username=Configuration.INITIAL_USER_2__USERNAME,
+                password=Configuration.INITIAL_USER_2__PASSWORD,
+            ),
+        ]
     )
 
 
@@ -47,15 +61,66 @@ def setup():
     print("Setup completed")
 
 
+def print_startup_profile():
+    profiler.mark("first paint")
+    print(profiler.report())
+
+
+def print_sql_stats():
+    from src.persistence.database.utils.sql_timing import default_sql_timing
+
+    print(default_sql_timing.dump())
+
+
+def write_app_ops_metrics():
+    from src.app.ops.utils.ops_metrics import default_ops_metrics
+
+    default_ops_metrics.write_json(Configuration.APP_OPS__METRICS_PATH)
+
+
+def create_loop_watchdog():
+    from src.utils.loop_watchdog import LoopWatchdog
+
+    return LoopWatchdog(
+        stall_threshold=Configuration.WATCHDOG__STALL_THRESHOLD_MS / 1000,
+        report_path=Configuration.WATCHDOG__REPORT_PATH,
+    )
+
+
 def main():
-    app = QApplication(sys.argv)
-    loop = QEventLoop(app)
-    asyncio.set_event_loop(loop)
-    window = OrderItMainWindow(app)
-    window.show()
+    if SQL_STATS_ARG in sys.argv:
+        # Read by the session module, which is only imported further down.
+        Configuration.PERSISTENCE__DATABASE__SQL_TIMING = True
+    if Configuration.APP_OPS__METRICS:
+        # Before the UI is imported, so that it calls the instrumented functions.
+        with profiler.phase("instrument app ops"):
+            from src.app.ops.utils.ops_metrics import install_app_ops_metrics
+
+            install_app_ops_metrics()
+    with profiler.phase("create application"):
+        app = QApplication(sys.argv)
+        loop = QEventLoop(app)
+        asyncio.set_event_loop(loop)
+    with profiler.phase("create main window"):
+        from src.ui.orderit import OrderItMainWindow
+
+        window = OrderItMainWindow(app)
+    if profiler.enabled:
+        window.on_first_paint.connect(print_startup_profile)
+    watchdog = create_loop_watchdog() if Configuration.WATCHDOG__ENABLED else None
     with loop:
+        window.show()
+        if watchdog:
+            watchdog.start(loop)
         # This replaces app.exec()
         loop.run_forever()
+        if watchdog:
+            loop.run_until_complete(watchdog.stop())
+    bcrypt_hash.shutdown_executor()
+    if SQL_STATS_ARG in sys.argv:
+        print_sql_stats()
+    if Configuration.APP_OPS__METRICS and Configuration.APP_OPS__METRICS_PATH:
+        write_app_ops_metrics()
 
 
 if __name__ == "__main__":
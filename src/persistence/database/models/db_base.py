@@ -8,6 +8,16 @@ from sqlalchemy.sql import func
 from src.persistence.database.session import Base
 
 
+def new_row_version():
+    """
+    Returns the value to set last_updated_on to when a row is written.
+    It is generated here rather than by the database, as it is compared
+    by conditional updates and must keep its microseconds on every
+    backend, which func.now() does not on SQLite.
+    """
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
 class DbBase(Base):
     __abstract__ = True
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -18,11 +28,13 @@ class DbBase(Base):
         default=func.now(),
         nullable=False,
     )
+    # Also serves as the row version for optimistic concurrency control,
+    # see query_utils.apply_version_check.
     last_updated_on: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        default=func.now(),
-        onupdate=func.now(),
+        default=new_row_version,
+        onupdate=new_row_version,
         nullable=False,
     )
 
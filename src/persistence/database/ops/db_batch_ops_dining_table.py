@@ -11,8 +11,10 @@ from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_dining_table
+from src.utils.tracing import default_tracer
 
 
+@default_tracer.traced("db_batch_ops_dining_table.insert_dining_table")
 async def insert_dining_table(
     request: schema_dining_table.SchemaDiningTableCreate,
     async_session_scope_func=async_session_scope,
@@ -21,17 +23,43 @@ async def insert_dining_table(
     async with async_session_scope_func() as async_session:
         try:
             new_record = await insert_dining_table_func(async_session, request)
+            new_dining_table = (
+                schema_dining_table.SchemaDiningTableDisplay.model_validate(new_record)
+            )
             await async_session.commit()
-            await async_session.refresh(new_record)
+            return new_dining_table
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
         except PersistenceOpsBaseError as poe:
             await async_session.rollback()
             raise PersistenceOpsBaseError(poe) from poe
-        return schema_dining_table.SchemaDiningTableDisplay.model_validate(new_record)
 
 
+@default_tracer.traced("db_batch_ops_dining_table.insert_dining_tables")
+async def insert_dining_tables(
+    requests: list[schema_dining_table.SchemaDiningTableCreate],
+    async_session_scope_func=async_session_scope,
+    insert_dining_tables_func=db_ops_dining_table.insert_dining_tables,
+):
+    async with async_session_scope_func() as async_session:
+        try:
+            new_records = await insert_dining_tables_func(async_session, requests)
+            new_dining_tables = [
+                schema_dining_table.SchemaDiningTableDisplay.model_validate(new_record)
+                for new_record in new_records
+            ]
+            await async_session.commit()
+            return new_dining_tables
+        except SQLAlchemyError as sqlae:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+        except PersistenceOpsBaseError as poe:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(poe) from poe
+
+
+@default_tracer.traced("db_batch_ops_dining_table.delete_dining_table")
 async def delete_dining_table(
     dining_table_id,
     async_session_scope_func=async_session_scope,
@@ -50,19 +78,85 @@ async def delete_dining_table(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_dining_table.update_position")
 async def update_position(
     dining_table_id,
     request: schema_dining_table.SchemaUpdatePosition,
+    expected_last_updated_on=None,
     async_session_scope_func=async_session_scope,
     update_position_func=db_ops_dining_table.update_position,
 ):
     async with async_session_scope_func() as async_session:
         try:
-            rowcount = await update_position_func(
-                async_session, dining_table_id, request
+            updated_records = await update_position_func(
+                async_session,
+                dining_table_id,
+                request,
+                expected_last_updated_on=expected_last_updated_on,
             )
+            updated_dining_tables = [
+                schema_dining_table.SchemaDiningTableDisplay.model_validate(
+                    updated_record
+                )
+                for updated_record in updated_records
+            ]
             await async_session.commit()
-            return rowcount
+            return updated_dining_tables
+        except SQLAlchemyError as sqlae:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+        except PersistenceOpsBaseError as poe:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(poe) from poe
+
+
+@default_tracer.traced("db_batch_ops_dining_table.update_positions")
+async def update_positions(
+    requests: dict[object, schema_dining_table.SchemaUpdatePosition],
+    async_session_scope_func=async_session_scope,
+    update_positions_func=db_ops_dining_table.update_positions,
+):
+    async with async_session_scope_func() as async_session:
+        try:
+            updated_records = await update_positions_func(async_session, requests)
+            updated_dining_tables = [
+                schema_dining_table.SchemaDiningTableDisplay.model_validate(
+                    updated_record
+                )
+                for updated_record in updated_records
+            ]
+            await async_session.commit()
+            return updated_dining_tables
+        except SQLAlchemyError as sqlae:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+        except PersistenceOpsBaseError as poe:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(poe) from poe
+
+
+@default_tracer.traced("db_batch_ops_dining_table.update_dining_tables")
+async def update_dining_tables(
+    requests: dict[object, schema_dining_table.SchemaUpdateDiningTable],
+    expected_last_updated_on: dict = None,
+    async_session_scope_func=async_session_scope,
+    update_dining_tables_func=db_ops_dining_table.update_dining_tables,
+):
+    async with async_session_scope_func() as async_session:
+        try:
+            updated_records = await update_dining_tables_func(
+                async_session,
+                requests,
+                expected_last_updated_on=expected_last_updated_on,
+            )
+            updated_dining_tables = [
+                schema_dining_table.SchemaDiningTableDisplay.model_validate(
+                    updated_record
+                )
+                for updated_record in updated_records
+            ]
+            await async_session.commit()
+            return updated_dining_tables
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
@@ -71,17 +165,30 @@ async def update_position(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_dining_table.update_size")
 async def update_size(
     dining_table_id,
     request: schema_dining_table.SchemaUpdateSize,
+    expected_last_updated_on=None,
     async_session_scope_func=async_session_scope,
     update_size_func=db_ops_dining_table.update_size,
 ):
     async with async_session_scope_func() as async_session:
         try:
-            rowcount = await update_size_func(async_session, dining_table_id, request)
+            updated_records = await update_size_func(
+                async_session,
+                dining_table_id,
+                request,
+                expected_last_updated_on=expected_last_updated_on,
+            )
+            updated_dining_tables = [
+                schema_dining_table.SchemaDiningTableDisplay.model_validate(
+                    updated_record
+                )
+                for updated_record in updated_records
+            ]
             await async_session.commit()
-            return rowcount
+            return updated_dining_tables
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
@@ -90,17 +197,51 @@ async def update_size(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_dining_table.update_name")
 async def update_name(
     dining_table_id,
     request: schema_dining_table.SchemaUpdateName,
+    expected_last_updated_on=None,
     async_session_scope_func=async_session_scope,
     update_name_func=db_ops_dining_table.update_name,
 ):
     async with async_session_scope_func() as async_session:
         try:
-            rowcount = await update_name_func(async_session, dining_table_id, request)
+            updated_records = await update_name_func(
+                async_session,
+                dining_table_id,
+                request,
+                expected_last_updated_on=expected_last_updated_on,
+            )
+            updated_dining_tables = [
+                schema_dining_table.SchemaDiningTableDisplay.model_validate(
+                    updated_record
+                )
+                for updated_record in updated_records
+            ]
             await async_session.commit()
-            return rowcount
+            return updated_dining_tables
+        except SQLAlchemyError as sqlae:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+        except PersistenceOpsBaseError as poe:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(poe) from poe
+
+
+@default_tracer.traced("db_batch_ops_dining_table.delete_dining_tables")
+async def delete_dining_tables(
+    dining_table_ids: list,
+    async_session_scope_func=async_session_scope,
+    delete_dining_tables_func=db_ops_dining_table.delete_dining_tables,
+):
+    async with async_session_scope_func() as async_session:
+        try:
+            deleted_ids = await delete_dining_tables_func(
+                async_session, dining_table_ids
+            )
+            await async_session.commit()
+            return deleted_ids
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
@@ -109,17 +250,19 @@ async def update_name(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_dining_table.select_dining_table_list")
 async def select_dining_table_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     async_session_scope_func=async_session_scope,
     select_dining_table_list_func=db_ops_dining_table.select_dining_table_list,
 ):
     async with async_session_scope_func() as async_session:
         try:
             dining_tables = await select_dining_table_list_func(
-                async_session, page_index, page_size, sort_by
+                async_session, page_index, page_size, sort_by, after
             )
             return [
                 schema_dining_table.SchemaDiningTableDisplay.model_validate(
@@ -13,8 +13,10 @@ from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_menu
+from src.utils.tracing import default_tracer
 
 
+@default_tracer.traced("db_batch_ops_menu.insert_menu")
 async def insert_menu(
     request: schema_menu.SchemaMenuCreate,
     async_session_scope_func=async_session_scope,
@@ -23,17 +25,41 @@ async def insert_menu(
     async with async_session_scope_func() as async_session:
         try:
             new_record = await insert_menu_func(async_session, request)
+            new_menu = schema_menu.SchemaMenuDisplay.model_validate(new_record)
             await async_session.commit()
-            await async_session.refresh(new_record)
+            return new_menu
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
         except PersistenceOpsBaseError as poe:
             await async_session.rollback()
             raise PersistenceOpsBaseError(poe) from poe
-        return schema_menu.SchemaMenuDisplay.model_validate(new_record)
 
 
+@default_tracer.traced("db_batch_ops_menu.upsert_menus")
+async def upsert_menus(
+    requests: list[schema_menu.SchemaMenuUpsert],
+    async_session_scope_func=async_session_scope,
+    upsert_menus_func=db_ops_menu.upsert_menus,
+):
+    async with async_session_scope_func() as async_session:
+        try:
+            upserted_records = await upsert_menus_func(async_session, requests)
+            upserted_menus = [
+                schema_menu.SchemaMenuDisplay.model_validate(upserted_record)
+                for upserted_record in upserted_records
+            ]
+            await async_session.commit()
+            return upserted_menus
+        except SQLAlchemyError as sqlae:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+        except PersistenceOpsBaseError as poe:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(poe) from poe
+
+
+@default_tracer.traced("db_batch_ops_menu.delete_menu")
 async def delete_menu(
     menu_id,
     async_session_scope_func=async_session_scope,
@@ -52,17 +78,28 @@ async def delete_menu(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_menu.update_name")
 async def update_name(
     menu_id,
     request: schema_menu.SchemaUpdateName,
+    expected_last_updated_on=None,
     async_session_scope_func=async_session_scope,
     update_name_func=db_ops_menu.update_name,
 ):
     async with async_session_scope_func() as async_session:
         try:
-            rowcount = await update_name_func(async_session, menu_id, request)
+            updated_records = await update_name_func(
+                async_session,
+                menu_id,
+                request,
+                expected_last_updated_on=expected_last_updated_on,
+            )
+            updated_menus = [
+                schema_menu.SchemaMenuDisplay.model_validate(updated_record)
+                for updated_record in updated_records
+            ]
             await async_session.commit()
-            return rowcount
+            return updated_menus
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
@@ -71,17 +108,19 @@ async def update_name(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_menu.select_menu_list")
 async def select_menu_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     async_session_scope_func=async_session_scope,
     select_menu_list_func=db_ops_menu.select_menu_list,
 ):
     async with async_session_scope_func() as async_session:
         try:
             menus = await select_menu_list_func(
-                async_session, page_index, page_size, sort_by
+                async_session, page_index, page_size, sort_by, after
             )
             return [
                 schema_menu.SchemaMenuDisplay.model_validate(menu) for menu in menus
@@ -90,6 +129,7 @@ async def select_menu_list(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_menu.select_menu_by_id")
 async def select_menu_by_id(
     menu_id: UUID,
     async_session_scope_func=async_session_scope,
@@ -13,8 +13,10 @@ from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_tag
+from src.utils.tracing import default_tracer
 
 
+@default_tracer.traced("db_batch_ops_tag.insert_tag")
 async def insert_tag(
     request: schema_tag.SchemaTagCreate,
     async_session_scope_func=async_session_scope,
@@ -23,17 +25,41 @@ async def insert_tag(
     async with async_session_scope_func() as async_session:
         try:
             new_record = await insert_tag_func(async_session, request)
+            new_tag = schema_tag.SchemaTagDisplay.model_validate(new_record)
             await async_session.commit()
-            await async_session.refresh(new_record)
+            return new_tag
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
         except PersistenceOpsBaseError as poe:
             await async_session.rollback()
             raise PersistenceOpsBaseError(poe) from poe
-        return schema_tag.SchemaTagDisplay.model_validate(new_record)
 
 
+@default_tracer.traced("db_batch_ops_tag.upsert_tags")
+async def upsert_tags(
+    requests: list[schema_tag.SchemaTagUpsert],
+    async_session_scope_func=async_session_scope,
+    upsert_tags_func=db_ops_tag.upsert_tags,
+):
+    async with async_session_scope_func() as async_session:
+        try:
+            upserted_records = await upsert_tags_func(async_session, requests)
+            upserted_tags = [
+                schema_tag.SchemaTagDisplay.model_validate(upserted_record)
+                for upserted_record in upserted_records
+            ]
+            await async_session.commit()
+            return upserted_tags
+        except SQLAlchemyError as sqlae:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+        except PersistenceOpsBaseError as poe:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(poe) from poe
+
+
+@default_tracer.traced("db_batch_ops_tag.delete_tag")
 async def delete_tag(
     tag_id,
     async_session_scope_func=async_session_scope,
@@ -52,17 +78,28 @@ async def delete_tag(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_tag.update_name")
 async def update_name(
     tag_id,
     request: schema_tag.SchemaUpdateName,
+    expected_last_updated_on=None,
     async_session_scope_func=async_session_scope,
     update_name_func=db_ops_tag.update_name,
 ):
     async with async_session_scope_func() as async_session:
         try:
-            rowcount = await update_name_func(async_session, tag_id, request)
+            updated_records = await update_name_func(
+                async_session,
+                tag_id,
+                request,
+                expected_last_updated_on=expected_last_updated_on,
+            )
+            updated_tags = [
+                schema_tag.SchemaTagDisplay.model_validate(updated_record)
+                for updated_record in updated_records
+            ]
             await async_session.commit()
-            return rowcount
+            return updated_tags
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
@@ -71,23 +108,26 @@ async def update_name(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_tag.select_tag_list")
 async def select_tag_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     async_session_scope_func=async_session_scope,
     select_tag_list_func=db_ops_tag.select_tag_list,
 ):
     async with async_session_scope_func() as async_session:
         try:
             tags = await select_tag_list_func(
-                async_session, page_index, page_size, sort_by
+                async_session, page_index, page_size, sort_by, after
             )
             return [schema_tag.SchemaTagDisplay.model_validate(tag) for tag in tags]
         except PersistenceOpsBaseError as poe:
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_tag.select_tag_by_id")
 async def select_tag_by_id(
     tag_id: UUID,
     async_session_scope_func=async_session_scope,
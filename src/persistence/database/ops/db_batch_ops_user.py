@@ -3,6 +3,7 @@ Don't call functionality from this modules directly.
 These functions are meant to be called y the app_ops layer.
 """
 
+import asyncio
 from uuid import UUID
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -14,8 +15,10 @@ from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.utils import bcrypt_hash
+from src.utils.tracing import default_tracer
 
 
+@default_tracer.traced("db_batch_ops_user.insert_user")
 async def insert_user(
     request: schema_user.SchemaUserCreate,
     async_session_scope_func=async_session_scope,
@@ -24,17 +27,75 @@ async def insert_user(
     async with async_session_scope_func() as async_session:
         try:
             new_record = await insert_user_func(async_session, request)
+            new_user = schema_user.SchemaUserDisplay.model_validate(new_record)
             await async_session.commit()
-            await async_session.refresh(new_record)
+            return new_user
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
         except PersistenceOpsBaseError as poe:
             await async_session.rollback()
             raise PersistenceOpsBaseError(poe) from poe
-        return schema_user.SchemaUserDisplay.model_validate(new_record)
 
 
+@default_tracer.traced("db_batch_ops_user.upsert_users")
+async def upsert_users(
+    requests: list[schema_user.SchemaUserCreate],
+    update_passwords: bool = False,
+    async_session_scope_func=async_session_scope,
+    upsert_users_func=db_ops_user.upsert_users,
+    select_existing_usernames_func=db_ops_user.select_existing_usernames,
+):
+    """
+    Unless update_passwords is set, the existing usernames are looked up
+    first, so that only the passwords of new users are hashed.
+    The passwords are hashed before the session of the upsert is opened,
+    so that a large sync does not hold a connection meanwhile.
+    """
+    if not update_passwords:
+        async with async_session_scope_func() as async_session:
+            try:
+                existing_usernames = await select_existing_usernames_func(
+                    async_session, [request.username for request in requests]
+                )
+            except PersistenceOpsBaseError as poe:
+                raise PersistenceOpsBaseError(poe) from poe
+        requests = [
+            request
+            for request in requests
+            if request.username not in existing_usernames
+        ]
+    if not requests:
+        return []
+
+    password_hashes = await asyncio.gather(
+        *(bcrypt_hash.bcrypt_async(request.password) for request in requests)
+    )
+    async with async_session_scope_func() as async_session:
+        try:
+            upserted_records = await upsert_users_func(
+                async_session,
+                {
+                    request.username: password_hash
+                    for request, password_hash in zip(requests, password_hashes)
+                },
+                update_passwords=update_passwords,
+            )
+            upserted_users = [
+                schema_user.SchemaUserDisplay.model_validate(upserted_record)
+                for upserted_record in upserted_records
+            ]
+            await async_session.commit()
+            return upserted_users
+        except SQLAlchemyError as sqlae:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+        except PersistenceOpsBaseError as poe:
+            await async_session.rollback()
+            raise PersistenceOpsBaseError(poe) from poe
+
+
+@default_tracer.traced("db_batch_ops_user.delete_user")
 async def delete_user(
     user_id,
     async_session_scope_func=async_session_scope,
@@ -53,18 +114,29 @@ async def delete_user(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_user.update_password")
 async def update_password(
     user_id,
     request: schema_user.SchemaChangePassword,
+    expected_last_updated_on=None,
     async_session_scope_func=async_session_scope,
     update_password_func=db_ops_user.update_password,
 ):
 
     async with async_session_scope_func() as async_session:
         try:
-            rowcount = await update_password_func(async_session, user_id, request)
+            updated_records = await update_password_func(
+                async_session,
+                user_id,
+                request,
+                expected_last_updated_on=expected_last_updated_on,
+            )
+            updated_users = [
+                schema_user.SchemaUserDisplay.model_validate(updated_record)
+                for updated_record in updated_records
+            ]
             await async_session.commit()
-            return rowcount
+            return updated_users
         except SQLAlchemyError as sqlae:
             await async_session.rollback()
             raise PersistenceOpsBaseError(sqlae) from sqlae
@@ -73,17 +145,19 @@ async def update_password(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_user.select_user_list")
 async def select_user_list(
     page_index: int,
     page_size: int,
     sort_by: str,
+    after: str = None,
     async_session_scope_func=async_session_scope,
     select_user_list_func=db_ops_user.select_user_list,
 ):
     async with async_session_scope_func() as async_session:
         try:
             users = await select_user_list_func(
-                async_session, page_index, page_size, sort_by
+                async_session, page_index, page_size, sort_by, after
             )
             return [
                 schema_user.SchemaUserDisplay.model_validate(user) for user in users
@@ -92,6 +166,7 @@ async def select_user_list(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_user.select_user_by_id")
 async def select_user_by_id(
     user_id: UUID,
     async_session_scope_func=async_session_scope,
@@ -107,6 +182,7 @@ async def select_user_by_id(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_user.select_user_by_username")
 async def select_user_by_username(
     username: str,
     async_session_scope_func=async_session_scope,
@@ -122,6 +198,7 @@ async def select_user_by_username(
             raise PersistenceOpsBaseError(poe) from poe
 
 
+@default_tracer.traced("db_batch_ops_user.select_user_by_username_and_password")
 async def select_user_by_username_and_password(
     username: str,
     password: str,
@@ -141,11 +218,11 @@ async def select_user_by_username_and_password(
     if user is None:
         return None
 
-    if not _is_password_correct(password, user.password_hash):
+    if not await _is_password_correct(password, user.password_hash):
         return None
 
     return schema_user.SchemaUserDisplay.model_validate(user)
 
 
-def _is_password_correct(password, password_hash):
-    return bcrypt_hash.verify_bcrypt(password, password_hash)
+async def _is_password_correct(password, password_hash):
+    return await bcrypt_hash.verify_bcrypt_async(password, password_hash)
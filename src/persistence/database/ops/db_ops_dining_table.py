@@ -5,7 +5,7 @@ These functions are meant to be called by the persistence_batch_ops layer.
 
 # from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import and_, case, delete, insert, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,25 +16,45 @@ from src.persistence.interface.ops.exceptions.ops_exceptions import (
 )
 from src.schemas.schema_dining_table import (
     SchemaDiningTableCreate,
+    SchemaUpdateDiningTable,
     SchemaUpdateName,
     SchemaUpdatePosition,
     SchemaUpdateSize,
 )
 
+# Maximum number of rows affected by a single batch statement,
+# which keeps the number of bound parameters within the driver limits.
+BATCH_CHUNK_SIZE = 500
+
 
 async def insert_dining_table(
     async_session: AsyncSession, request: SchemaDiningTableCreate
 ):
-    new_record = DbDiningTable(
-        name=request.name,
-        x=request.x,
-        y=request.y,
-        width=request.width,
-        height=request.height,
-    )
+    stmt = insert(DbDiningTable).values(**request.model_dump()).returning(DbDiningTable)
+    try:
+        return (await async_session.scalars(stmt)).one()
+    except SQLAlchemyError as sqlae:
+        raise PersistenceOpsBaseError(sqlae) from sqlae
+
+
+async def insert_dining_tables(
+    async_session: AsyncSession, requests: list[SchemaDiningTableCreate]
+):
+    """
+    Inserts all the specified dining tables with a single multi-row INSERT
+    and returns the new records, in the same order as the requests.
+    """
+    if not requests:
+        return []
+    stmt = insert(DbDiningTable).returning(DbDiningTable, sort_by_parameter_order=True)
     try:
-        async_session.add(new_record)
-        return new_record
+        return list(
+            (
+                await async_session.scalars(
+                    stmt, [request.model_dump() for request in requests]
+                )
+            ).all()
+        )
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
@@ -48,57 +68,198 @@ async def delete_dining_table(async_session: AsyncSession, dining_table_id):
 
 
 async def update_position(
-    async_session: AsyncSession, dining_table_id, request: SchemaUpdatePosition
+    async_session: AsyncSession,
+    dining_table_id,
+    request: SchemaUpdatePosition,
+    expected_last_updated_on=None,
 ):
-    stmt = (
+    stmt = query_utils.apply_version_check(
         update(DbDiningTable)
         .where(DbDiningTable.id == dining_table_id)
-        .values(x=request.x, y=request.y)
-    )
+        .values(x=request.x, y=request.y),
+        DbDiningTable,
+        expected_last_updated_on,
+    ).returning(DbDiningTable)
     try:
-        return (await async_session.execute(stmt)).rowcount
+        return list((await async_session.scalars(stmt)).all())
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
 
+async def update_positions(
+    async_session: AsyncSession, requests: dict[object, SchemaUpdatePosition]
+):
+    """
+    Updates the positions of all the specified dining tables, keyed by
+    dining table id, and returns the updated rows.
+    """
+    return await _update_by_ids(
+        async_session,
+        {
+            dining_table_id: {"x": request.x, "y": request.y}
+            for dining_table_id, request in requests.items()
+        },
+    )
+
+
+async def update_dining_tables(
+    async_session: AsyncSession,
+    requests: dict[object, SchemaUpdateDiningTable],
+    expected_last_updated_on: dict = None,
+):
+    """
+    Applies the fields set in each request to the dining table with
+    the matching id, in as few statements as possible, and returns
+    the updated rows.
+
+    expected_last_updated_on maps dining table ids to the last_updated_on
+    they were read with. Those dining tables are only updated if they
+    have not been written since, see query_utils.apply_version_check.
+    """
+    return await _update_by_ids(
+        async_session,
+        {
+            dining_table_id: request.model_dump(exclude_none=True)
+            for dining_table_id, request in requests.items()
+            if request.model_dump(exclude_none=True)
+        },
+        expected_last_updated_on,
+    )
+
+
 async def update_size(
-    async_session: AsyncSession, dining_table_id, request: SchemaUpdateSize
+    async_session: AsyncSession,
+    dining_table_id,
+    request: SchemaUpdateSize,
+    expected_last_updated_on=None,
 ):
-    stmt = (
+    stmt = query_utils.apply_version_check(
         update(DbDiningTable)
         .where(DbDiningTable.id == dining_table_id)
-        .values(width=request.width, height=request.height)
-    )
+        .values(width=request.width, height=request.height),
+        DbDiningTable,
+        expected_last_updated_on,
+    ).returning(DbDiningTable)
     try:
-        return (await async_session.execute(stmt)).rowcount
+        return list((await async_session.scalars(stmt)).all())
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
 
 async def update_name(
-    async_session: AsyncSession, dining_table_id, request: SchemaUpdateName
+    async_session: AsyncSession,
+    dining_table_id,
+    request: SchemaUpdateName,
+    expected_last_updated_on=None,
 ):
-    stmt = (
+    stmt = query_utils.apply_version_check(
         update(DbDiningTable)
         .where(DbDiningTable.id == dining_table_id)
-        .values(name=request.name)
-    )
+        .values(name=request.name),
+        DbDiningTable,
+        expected_last_updated_on,
+    ).returning(DbDiningTable)
     try:
-        return (await async_session.execute(stmt)).rowcount
+        return list((await async_session.scalars(stmt)).all())
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
 
+async def delete_dining_tables(async_session: AsyncSession, dining_table_ids: list):
+    """
+    Deletes all the specified dining tables and returns the ids
+    of the rows that were deleted.
+    """
+    deleted_ids = []
+    for chunk in _chunks(list(dining_table_ids)):
+        stmt = (
+            delete(DbDiningTable)
+            .where(DbDiningTable.id.in_(chunk))
+            .returning(DbDiningTable.id)
+        )
+        try:
+            deleted_ids.extend((await async_session.scalars(stmt)).all())
+        except SQLAlchemyError as sqlae:
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+    return deleted_ids
+
+
 async def select_dining_table_list(
-    async_session: AsyncSession, page_index: int, page_size: int, sort_by: str
+    async_session: AsyncSession,
+    page_index: int,
+    page_size: int,
+    sort_by: str,
+    after: str = None,
 ):
     query = select(DbDiningTable)
-    query = query_utils.apply_sorting_and_paging_to_list_query(
-        query, DbDiningTable, page_index, page_size, sort_by
-    )
+    try:
+        query = query_utils.apply_sorting_and_paging_to_list_query(
+            query, DbDiningTable, page_index, page_size, sort_by, after
+        )
+    except ValueError as ve:
+        raise PersistenceOpsBaseError(ve) from ve
     try:
         results = await async_session.execute(query)
         dining_tables = results.scalars().all()
         return dining_tables
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
+
+
+def _chunks(items: list, chunk_size: int = BATCH_CHUNK_SIZE):
+    for start in range(0, len(items), chunk_size):
+        yield items[start : start + chunk_size]
+
+
+async def _update_by_ids(
+    async_session: AsyncSession,
+    values_by_id: dict,
+    expected_last_updated_on: dict = None,
+):
+    """
+    Applies the column values specified per dining table id using one
+    UPDATE ... SET column = CASE id WHEN ... END ... RETURNING statement
+    per chunk, and returns the updated rows.
+    Columns not specified for a given id keep their current value.
+    Ids with an expected last_updated_on are matched with
+    id = :id AND last_updated_on = :expected instead of by id alone.
+    """
+    expected_last_updated_on = expected_last_updated_on or {}
+    updated_records = []
+    for chunk in _chunks(list(values_by_id)):
+        assignments = {}
+        for column_name in sorted(
+            {column_name for key in chunk for column_name in values_by_id[key]}
+        ):
+            column = getattr(DbDiningTable, column_name)
+            assignments[column_name] = case(
+                {
+                    key: values_by_id[key][column_name]
+                    for key in chunk
+                    if column_name in values_by_id[key]
+                },
+                value=DbDiningTable.id,
+                else_=column,
+            )
+        conditions = [
+            and_(
+                DbDiningTable.id == key,
+                DbDiningTable.last_updated_on == expected_last_updated_on[key],
+            )
+            for key in chunk
+            if key in expected_last_updated_on
+        ]
+        unchecked_keys = [key for key in chunk if key not in expected_last_updated_on]
+        if unchecked_keys:
+            conditions.append(DbDiningTable.id.in_(unchecked_keys))
+        stmt = (
+            update(DbDiningTable)
+            .where(or_(*conditions))
+            .values(**assignments)
+            .returning(DbDiningTable)
+        )
+        try:
+            updated_records.extend((await async_session.scalars(stmt)).all())
+        except SQLAlchemyError as sqlae:
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+    return updated_records
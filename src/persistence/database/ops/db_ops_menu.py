@@ -7,23 +7,48 @@ These functions are meant to be called by the persistence_batch_ops layer.
 
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.persistence.database.models.db_menu import DbMenu
-from src.persistence.database.utils import query_utils
+from src.persistence.database.utils import query_utils, upsert_utils
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
-from src.schemas.schema_menu import SchemaMenuCreate, SchemaUpdateName
+from src.schemas.schema_menu import (
+    SchemaMenuCreate,
+    SchemaMenuUpsert,
+    SchemaUpdateName,
+)
 
 
 async def insert_menu(async_session: AsyncSession, request: SchemaMenuCreate):
-    new_record = DbMenu(name=request.name)
+    stmt = insert(DbMenu).values(name=request.name).returning(DbMenu)
     try:
-        async_session.add(new_record)
-        return new_record
+        return (await async_session.scalars(stmt)).one()
+    except SQLAlchemyError as sqlae:
+        raise PersistenceOpsBaseError(sqlae) from sqlae
+
+
+async def upsert_menus(async_session: AsyncSession, requests: list[SchemaMenuUpsert]):
+    """
+    Inserts the menus whose id does not exist yet and renames the existing
+    ones whose name differs, with one statement per chunk of requests.
+    Returns the records that were inserted or updated.
+    """
+    if not requests:
+        return []
+    try:
+        return await upsert_utils.upsert_rows(
+            async_session,
+            DbMenu,
+            [request.model_dump() for request in requests],
+            index_elements=["id"],
+            update_columns=["name"],
+        )
+    except ValueError as ve:
+        raise PersistenceOpsBaseError(ve) from ve
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
@@ -36,21 +61,37 @@ async def delete_menu(async_session: AsyncSession, menu_id):
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
 
-async def update_name(async_session: AsyncSession, menu_id, request: SchemaUpdateName):
-    stmt = update(DbMenu).where(DbMenu.id == menu_id).values(name=request.name)
+async def update_name(
+    async_session: AsyncSession,
+    menu_id,
+    request: SchemaUpdateName,
+    expected_last_updated_on=None,
+):
+    stmt = query_utils.apply_version_check(
+        update(DbMenu).where(DbMenu.id == menu_id).values(name=request.name),
+        DbMenu,
+        expected_last_updated_on,
+    ).returning(DbMenu)
     try:
-        return (await async_session.execute(stmt)).rowcount
+        return list((await async_session.scalars(stmt)).all())
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
 
 async def select_menu_list(
-    async_session: AsyncSession, page_index: int, page_size: int, sort_by: str
+    async_session: AsyncSession,
+    page_index: int,
+    page_size: int,
+    sort_by: str,
+    after: str = None,
 ):
     query = select(DbMenu)
-    query = query_utils.apply_sorting_and_paging_to_list_query(
-        query, DbMenu, page_index, page_size, sort_by
-    )
+    try:
+        query = query_utils.apply_sorting_and_paging_to_list_query(
+            query, DbMenu, page_index, page_size, sort_by, after
+        )
+    except ValueError as ve:
+        raise PersistenceOpsBaseError(ve) from ve
     try:
         results = await async_session.execute(query)
         menus = results.scalars().all()
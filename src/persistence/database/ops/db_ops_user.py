@@ -5,12 +5,12 @@ These functions are meant to be called by the persistence_batch_ops layer.
 
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.persistence.database.models.db_user import DbUser
-from src.persistence.database.utils import query_utils
+from src.persistence.database.utils import query_utils, upsert_utils
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
@@ -19,16 +19,74 @@ from src.utils import bcrypt_hash
 
 
 async def insert_user(async_session: AsyncSession, request: SchemaUserCreate):
-    new_record = DbUser(
-        username=request.username, password_hash=bcrypt_hash.bcrypt(request.password)
+    stmt = (
+        insert(DbUser)
+        .values(
+            username=request.username,
+            password_hash=await bcrypt_hash.bcrypt_async(request.password),
+        )
+        .returning(DbUser)
     )
     try:
-        async_session.add(new_record)
-        return new_record
+        return (await async_session.scalars(stmt)).one()
+    except SQLAlchemyError as sqlae:
+        raise PersistenceOpsBaseError(sqlae) from sqlae
+
+
+async def upsert_users(
+    async_session: AsyncSession,
+    password_hashes: dict[str, str],
+    update_passwords: bool = False,
+):
+    """
+    Inserts the users whose username does not exist yet, with one
+    statement per chunk of users, and returns the inserted records.
+    password_hashes maps the usernames to their hashed passwords, which
+    are hashed by the caller so that the transaction is not held open
+    while hashing.
+
+    Existing users are left untouched unless update_passwords is set,
+    in which case their password is set and their records are returned too.
+    """
+    if not password_hashes:
+        return []
+    try:
+        return await upsert_utils.upsert_rows(
+            async_session,
+            DbUser,
+            [
+                {"username": username, "password_hash": password_hash}
+                for username, password_hash in password_hashes.items()
+            ],
+            index_elements=["username"],
+            update_columns=["password_hash"] if update_passwords else [],
+            # Every hash has a new salt, so the stored one always differs.
+            only_if_changed=False,
+        )
+    except ValueError as ve:
+        raise PersistenceOpsBaseError(ve) from ve
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
 
+async def select_existing_usernames(async_session: AsyncSession, usernames: list):
+    """
+    Returns the set of the specified usernames that exist.
+    """
+    existing_usernames = set()
+    for start in range(0, len(usernames), upsert_utils.UPSERT_CHUNK_SIZE):
+        stmt = select(DbUser.username).where(
+            DbUser.username.in_(
+                usernames[start : start + upsert_utils.UPSERT_CHUNK_SIZE]
+            )
+        )
+        try:
+            existing_usernames.update((await async_session.scalars(stmt)).all())
+        except SQLAlchemyError as sqlae:
+            raise PersistenceOpsBaseError(sqlae) from sqlae
+    return existing_usernames
+
+
 async def delete_user(async_session: AsyncSession, user_id):
     stmt = delete(DbUser).where(DbUser.id == user_id)
     try:
@@ -38,26 +96,38 @@ async def delete_user(async_session: AsyncSession, user_id):
 
 
 async def update_password(
-    async_session: AsyncSession, user_id, request: SchemaChangePassword
+    async_session: AsyncSession,
+    user_id,
+    request: SchemaChangePassword,
+    expected_last_updated_on=None,
 ):
-    stmt = (
+    stmt = query_utils.apply_version_check(
         update(DbUser)
         .where(DbUser.id == user_id)
-        .values(password_hash=bcrypt_hash.bcrypt(request.new_password))
-    )
+        .values(password_hash=await bcrypt_hash.bcrypt_async(request.new_password)),
+        DbUser,
+        expected_last_updated_on,
+    ).returning(DbUser)
     try:
-        return (await async_session.execute(stmt)).rowcount
+        return list((await async_session.scalars(stmt)).all())
     except SQLAlchemyError as sqlae:
         raise PersistenceOpsBaseError(sqlae) from sqlae
 
 
 async def select_user_list(
-    async_session: AsyncSession, page_index: int, page_size: int, sort_by: str
+    async_session: AsyncSession,
+    page_index: int,
+    page_size: int,
+    sort_by: str,
+    after: str = None,
 ):
     query = select(DbUser)
-    query = query_utils.apply_sorting_and_paging_to_list_query(
-        query, DbUser, page_index, page_size, sort_by
-    )
+    try:
+        query = query_utils.apply_sorting_and_paging_to_list_query(
+            query, DbUser, page_index, page_size, sort_by, after
+        )
+    except ValueError as ve:
+        raise PersistenceOpsBaseError(ve) from ve
     try:
         results = await async_session.execute(query)
         users = results.scalars().all()
@@ -1,15 +1,53 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import QueuePool
 
 from src.configuration import Configuration
+from src.persistence.database.utils.sql_timing import default_sql_timing
+from src.persistence.database.utils.sql_tracing import default_sql_tracing
+from src.utils.tracing import default_tracer
 
 DATABASE_URL = Configuration.PERSISTENCE__DATABASE__DATABASE_URL
 
+
+def build_engine_options(database_url: str, configuration=Configuration):
+    """
+    Returns the connection pool settings to create the engine for the
+    specified database URL with, as read from the specified configuration.
+    The sizing settings are only returned if the dialect uses a QueuePool,
+    as e.g. the StaticPool and NullPool of SQLite reject them.
+    """
+    options = {
+        "pool_recycle": configuration.PERSISTENCE__DATABASE__POOL_RECYCLE,
+        "pool_pre_ping": configuration.PERSISTENCE__DATABASE__POOL_PRE_PING,
+    }
+    url = make_url(database_url)
+    if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        options.update(
+            pool_size=configuration.PERSISTENCE__DATABASE__POOL_SIZE,
+            max_overflow=configuration.PERSISTENCE__DATABASE__MAX_OVERFLOW,
+            pool_timeout=configuration.PERSISTENCE__DATABASE__POOL_TIMEOUT,
+        )
+    return options
+
+
 # Create a database engine
-engine = create_async_engine(DATABASE_URL)
+engine = create_async_engine(DATABASE_URL, **build_engine_options(DATABASE_URL))
+if Configuration.PERSISTENCE__DATABASE__SQL_TIMING:
+    default_sql_timing.attach(engine)
+if default_tracer.enabled:
+    default_sql_tracing.attach(engine)
+    default_sql_tracing.attach_sessions(Session)
 
 # Declare a sessionmaker with autocommit and autoflush settings
 SessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
@@ -26,10 +64,41 @@ async def create_database_tables():
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_connection_pool(
+    connection_count: int, async_engine: AsyncEngine = engine
+) -> int:
+    """
+    Opens the specified number of connections concurrently and returns
+    them to the pool, so that the first queries do not pay for the
+    connection setup. Only up to pool_size connections stay in the pool.
+
+    Connection errors are not raised, as the application can still start
+    and connect lazily. Returns the number of connections opened.
+    """
+
+    async def open_connection():
+        return await async_engine.connect()
+
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(connection_count)),
+        return_exceptions=True,
+    )
+    connections = [result for result in results if not isinstance(result, Exception)]
+    for connection in connections:
+        await connection.close()
+    return len(connections)
+
+
 @asynccontextmanager
 async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
-    async with SessionLocal() as async_session:
-        try:
-            yield async_session
-        finally:
-            await async_session.close()
+    with default_tracer.span("db.session"):
+        async with SessionLocal() as async_session:
+            try:
+                if default_tracer.enabled:
+                    # The connection is otherwise only checked out by the
+                    # first statement, whose span would include the wait.
+                    with default_tracer.span("db.session.acquire"):
+                        await async_session.connection()
+                yield async_session
+            finally:
+                await async_session.close()
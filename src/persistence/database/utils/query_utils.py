@@ -1,20 +1,91 @@
-def _build_sort_criteria(entity_type, sort_by: str):
-    """EXAMPLE sort_by string: sort_by = \"created_on DESC, username\" """
-    sort_criteria = []
+import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy import and_, inspect, or_, tuple_
+
+from src.utils import paging_cursor
+
+SORT_SPEC_CACHE_SIZE = 256
+SORT_DIRECTIONS = ("ASC", "DESC")
+
+
+@dataclass(frozen=True)
+class CompiledSortSpec:
+    """
+    The validated form of a sort_by string for a given entity type.
+
+    - *sort_spec* (column, is_descending) pairs, ending with the tiebreaker
+    - *criteria* The matching order_by clauses
+    """
+
+    sort_spec: tuple
+    criteria: tuple
+
+    @property
+    def column_names(self):
+        return [column.key for column, _ in self.sort_spec]
+
+
+def _parse_column_sort(column_sort: str):
+    column, *direction = column_sort.split()
+    if len(direction) > 1 or (
+        direction and direction[0].upper() not in SORT_DIRECTIONS
+    ):
+        raise ValueError(f"Invalid sort direction: {column_sort.strip()}.")
+    return column, bool(direction) and direction[0].upper() == "DESC"
+
+
+@lru_cache(maxsize=SORT_SPEC_CACHE_SIZE)
+def compile_sort_spec(entity_type, sort_by: str):
+    """
+    Parses and validates the specified sort_by string against the columns
+    mapped by entity_type and returns a CompiledSortSpec. Results are
+    memoized per (entity_type, sort_by), so repeated list queries skip
+    the parsing entirely.
+
+    The tiebreaker column (ascending) is appended if sort_by does not
+    already include it, so that the order is total and a cursor
+    identifies exactly one position.
+
+    Raises ValueError if sort_by references an unknown column,
+    references a column more than once or has an invalid direction.
+
+    EXAMPLE sort_by string: sort_by = \"created_on DESC, username\" """
+    mapped_columns = inspect(entity_type).columns
+
+    sort_spec = []
     if sort_by:
         for column_sort in sort_by.split(","):
-            column, *direction = column_sort.strip().split()
-            if direction and direction[0].upper() == "DESC":
-                sort_criteria.append(getattr(entity_type, column).desc())
-            else:
-                sort_criteria.append(getattr(entity_type, column))
-    return sort_criteria
+            if not column_sort.strip():
+                raise ValueError(f"Invalid sort_by: {sort_by}.")
+            column_name, is_descending = _parse_column_sort(column_sort)
+            if column_name not in mapped_columns:
+                raise ValueError(f"Invalid sort column: {column_name}.")
+            if any(column.key == column_name for column, _ in sort_spec):
+                raise ValueError(f"Duplicate sort column: {column_name}.")
+            sort_spec.append((getattr(entity_type, column_name), is_descending))
+
+    tiebreaker = getattr(entity_type, paging_cursor.CURSOR_TIEBREAKER_COLUMN)
+    if not any(column.key == tiebreaker.key for column, _ in sort_spec):
+        sort_spec.append((tiebreaker, False))
+
+    return CompiledSortSpec(
+        sort_spec=tuple(sort_spec),
+        criteria=tuple(
+            column.desc() if is_descending else column
+            for column, is_descending in sort_spec
+        ),
+    )
+
+
+def _build_sort_criteria(entity_type, sort_by: str):
+    """EXAMPLE sort_by string: sort_by = \"created_on DESC, username\" """
+    return compile_sort_spec(entity_type, sort_by).criteria
 
 
 def _add_sort_criteria_to_query(query, sort_criteria):
-    for criterion in sort_criteria:
-        query = query.order_by(criterion)
-    return query
+    return query.order_by(*sort_criteria)
 
 
 def _apply_sorting_criteria(query, entity_type, sort_by: str):
@@ -27,12 +98,98 @@ def _apply_paging(query, page_index: int, page_size: int):
     return query.offset(page_index * page_size).limit(page_size)
 
 
+def _coerce_cursor_value(entity_type, column_name: str, value):
+    if value is None:
+        return None
+    python_type = inspect(entity_type).columns[column_name].type.python_type
+    if python_type is datetime.datetime:
+        return datetime.datetime.fromisoformat(value)
+    return python_type(value)
+
+
+def _decode_cursor_values(entity_type, compiled: CompiledSortSpec, after: str):
+    raw_values = paging_cursor.decode_cursor(after)
+    column_names = compiled.column_names
+    if list(raw_values) != column_names:
+        raise ValueError("Cursor does not match the sort order.")
+    try:
+        return [
+            _coerce_cursor_value(entity_type, column_name, raw_values[column_name])
+            for column_name in column_names
+        ]
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+
+
+def _build_keyset_criterion(sort_spec, values):
+    """
+    Returns the criterion selecting the rows that come after the
+    specified values in the order described by sort_spec.
+    When all columns share a direction this is a single row-value
+    comparison, which the database can satisfy with an index range scan.
+    """
+    columns = [column for column, _ in sort_spec]
+    directions = {is_descending for _, is_descending in sort_spec}
+
+    if len(directions) == 1:
+        if directions.pop():
+            return tuple_(*columns) < tuple_(*values)
+        return tuple_(*columns) > tuple_(*values)
+
+    criteria = []
+    for index, (column, is_descending) in enumerate(sort_spec):
+        equal_prefix = [
+            prefix_column == prefix_value
+            for prefix_column, prefix_value in zip(columns[:index], values[:index])
+        ]
+        if is_descending:
+            criteria.append(and_(*equal_prefix, column < values[index]))
+        else:
+            criteria.append(and_(*equal_prefix, column > values[index]))
+    return or_(*criteria)
+
+
+def _apply_keyset_paging(query, entity_type, page_size: int, sort_by: str, after):
+    compiled = compile_sort_spec(entity_type, sort_by)
+    values = _decode_cursor_values(entity_type, compiled, after)
+    return query.where(_build_keyset_criterion(compiled.sort_spec, values)).limit(
+        page_size
+    )
+
+
+def apply_version_check(stmt, entity_type, expected_last_updated_on=None):
+    """
+    Restricts the specified update or delete statement to rows whose
+    last_updated_on still equals expected_last_updated_on, i.e. rows that
+    have not been written since the caller read them, so that concurrent
+    edits are detected without locking the row.
+    The statement is returned unchanged if expected_last_updated_on is None.
+    """
+    if expected_last_updated_on is None:
+        return stmt
+    return stmt.where(entity_type.last_updated_on == expected_last_updated_on)
+
+
 def apply_sorting_and_paging_to_list_query(
-    query, entity_type, page_index: int = 0, page_size: int = 10, sort_by: str = None
+    query,
+    entity_type,
+    page_index: int = 0,
+    page_size: int = 10,
+    sort_by: str = None,
+    after: str = None,
 ):
     """entity_type: This is the class reference
-    to the entity that extends DeclarativeBase"""
+    to the entity that extends DeclarativeBase
 
-    return _apply_paging(
-        _apply_sorting_criteria(query, entity_type, sort_by), page_index, page_size
-    )
+    after: The cursor of the last row of the previous page, as created by
+    paging_cursor.encode_cursor with the same sort_by. When provided,
+    keyset paging is used instead of OFFSET and page_index is ignored,
+    so every page costs the same as the first one.
+    Raises ValueError if the cursor is invalid."""
+
+    query = _apply_sorting_criteria(query, entity_type, sort_by)
+
+    if after is not None:
+        return _apply_keyset_paging(query, entity_type, page_size, sort_by, after)
+
+    return _apply_paging(query, page_index, page_size)
@@ -0,0 +1,212 @@
+import logging
+import re
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+from greenlet import getcurrent
+from sqlalchemy import event
+
+from src.configuration import Configuration
+from src.utils.latency_histogram import LatencyHistogram
+
+NORMALIZED_SQL_CACHE_SIZE = 1024
+CALLER_MODULE_PREFIX = "src.persistence.database.ops.db_ops_"
+_STARTED_ON_ATTRIBUTE = "_sql_timing_started_on"
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|\$\d+|(?<![:\w]):\w+|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \(\?(?:, \?)*\)", re.IGNORECASE)
+_REPEATED_ROWS = re.compile(r"(\(\?(?:, \?)*\))(?:, \1)+")
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    """
+    - *sql* The normalized statement
+    - *seconds* How long the statement took to execute
+    - *parameters* The shape of the parameters, without their values
+    - *caller* The db_ops function that executed the statement, if known
+    """
+
+    sql: str
+    seconds: float
+    parameters: str
+    caller: Optional[str]
+
+
+@lru_cache(maxsize=NORMALIZED_SQL_CACHE_SIZE)
+def normalize_sql(statement: str):
+    """
+    Returns the specified statement with its literals and bound parameters
+    replaced by ?, IN lists and multi-row VALUES collapsed to a single
+    entry and whitespace collapsed, so that executions that only differ
+    by their values share the same key.
+    """
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (?)", sql)
+    return _REPEATED_ROWS.sub(r"\1", sql)
+
+
+def describe_parameters(parameters, executemany: bool = False):
+    """
+    Returns the shape of the specified statement parameters, i.e. the
+    parameter names or count, without their values, which may be secret.
+    """
+    if executemany:
+        rows = list(parameters or [])
+        shape = describe_parameters(rows[0]) if rows else "none"
+        return f"{len(rows)} x {shape}"
+    if not parameters:
+        return "none"
+    if isinstance(parameters, dict):
+        return "(" + ", ".join(sorted(parameters)) + ")"
+    return f"{len(parameters)} positional"
+
+
+def find_calling_function(module_prefix: str = CALLER_MODULE_PREFIX):
+    """
+    Returns the qualified name of the innermost function on the call stack
+    whose module starts with module_prefix, or None.
+
+    The async engine runs the cursor in a greenlet of its own, so the stack
+    of the greenlet that awaited the statement is searched after the
+    current one.
+    """
+    frame = sys._getframe(1)
+    current = getcurrent()
+    while True:
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith(module_prefix):
+                return f"{module}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        current = current.parent
+        if current is None:
+            return None
+        frame = current.gr_frame
+
+
+def log_slow_query(slow_query: SlowQuery):
+    logger.warning(
+        "Slow query (%.1f ms) from %s with parameters %s: %s",
+        slow_query.seconds * 1000,
+        slow_query.caller or "unknown caller",
+        slow_query.parameters,
+        slow_query.sql,
+    )
+
+
+class SqlTimingRecorder:
+    """
+    Records the latency of every statement executed by the engines it is
+    attached to, in a histogram per normalized statement.
+
+    Statements that take slow_query_threshold seconds or longer are passed
+    to on_slow_query, which logs them by default. A slow_query_threshold
+    of None disables the slow-query log.
+    """
+
+    def __init__(
+        self,
+        slow_query_threshold: Optional[float] = None,
+        on_slow_query: Callable[[SlowQuery], None] = log_slow_query,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.slow_query_threshold = slow_query_threshold
+        self.on_slow_query = on_slow_query
+        self.clock = clock
+        self.histograms: dict[str, LatencyHistogram] = {}
+
+    def attach(self, engine):
+        """
+        Starts timing the statements of the specified engine,
+        which may be an AsyncEngine.
+        """
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+
+    def detach(self, engine):
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.remove(sync_engine, "before_cursor_execute", self._before_execute)
+        event.remove(sync_engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        # Kept on the execution context, which is discarded with it
+        # if the statement fails.
+        setattr(context, _STARTED_ON_ATTRIBUTE, self.clock())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_on = getattr(context, _STARTED_ON_ATTRIBUTE, None)
+        if started_on is None:
+            return
+        seconds = self.clock() - started_on
+        sql = normalize_sql(statement)
+        histogram = self.histograms.get(sql)
+        if histogram is None:
+            histogram = self.histograms[sql] = LatencyHistogram()
+        histogram.record(seconds)
+
+        if (
+            self.slow_query_threshold is not None
+            and seconds >= self.slow_query_threshold
+        ):
+            self.on_slow_query(
+                SlowQuery(
+                    sql=sql,
+                    seconds=seconds,
+                    parameters=describe_parameters(parameters, executemany),
+                    caller=find_calling_function(),
+                )
+            )
+
+    def stats(self):
+        """
+        Returns the statistics, in seconds, of every normalized statement,
+        the statements taking the most time in total first.
+        """
+        return {
+            sql: histogram.as_dict()
+            for sql, histogram in sorted(
+                self.histograms.items(), key=lambda item: -item[1].total
+            )
+        }
+
+    def dump(self, limit: int = None):
+        """
+        Returns the statistics of the statements taking the most time
+        in total, formatted as a table.
+        """
+        lines = [f"{'count':>7} {'total':>10} {'mean':>9} {'p95':>9} {'max':>9}  sql"]
+        for sql, stats in list(self.stats().items())[:limit]:
+            lines.append(
+                f"{stats['count']:>7} {stats['total'] * 1000:>8.1f}ms "
+                f"{stats['mean'] * 1000:>7.2f}ms {stats['p95'] * 1000:>7.2f}ms "
+                f"{stats['max'] * 1000:>7.2f}ms  {sql}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        self.histograms.clear()
+
+
+def _slow_query_threshold(threshold_ms: int):
+    return None if threshold_ms < 0 else threshold_ms / 1000
+
+
+# Attached to the application engine by the session module.
+default_sql_timing = SqlTimingRecorder(
+    slow_query_threshold=_slow_query_threshold(
+        Configuration.PERSISTENCE__DATABASE__SLOW_QUERY_THRESHOLD_MS
+    )
+)
@@ -0,0 +1,92 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.persistence.database.utils.sql_timing import (
+    find_calling_function,
+    normalize_sql,
+)
+from src.utils.tracing import Tracer, default_tracer
+
+_SPAN_ATTRIBUTE = "_sql_tracing_span"
+_COMMIT_SPAN_KEY = "sql_tracing_commit_span"
+
+
+class SqlTracing:
+    """
+    Adds a span for every statement executed by the engines it is attached
+    to, and for every commit of the sessions it is attached to, as children
+    of the span current when the statement or commit was awaited.
+    """
+
+    def __init__(self, tracer: Tracer = default_tracer):
+        self.tracer = tracer
+
+    def attach(self, engine):
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+    def detach(self, engine):
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.remove(sync_engine, "before_cursor_execute", self._before_execute)
+        event.remove(sync_engine, "after_cursor_execute", self._after_execute)
+        event.remove(sync_engine, "handle_error", self._handle_error)
+
+    def attach_sessions(self, session_class=Session):
+        """
+        Starts tracing the commits of the sessions of the specified class.
+        The sync session class is the one to pass for an AsyncSession.
+        """
+        event.listen(session_class, "before_commit", self._before_commit)
+        event.listen(session_class, "after_commit", self._after_commit)
+        event.listen(session_class, "after_rollback", self._after_rollback)
+
+    def detach_sessions(self, session_class=Session):
+        event.remove(session_class, "before_commit", self._before_commit)
+        event.remove(session_class, "after_commit", self._after_commit)
+        event.remove(session_class, "after_rollback", self._after_rollback)
+
+    def _before_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        if not self.tracer.enabled:
+            return
+        setattr(
+            context,
+            _SPAN_ATTRIBUTE,
+            self.tracer.start_span(
+                "db.sql",
+                sql=normalize_sql(statement),
+                caller=find_calling_function(),
+            ),
+        )
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.tracer.end_span(getattr(context, _SPAN_ATTRIBUTE, None))
+
+    def _handle_error(self, exception_context):
+        execution_context = exception_context.execution_context
+        if execution_context is not None:
+            self.tracer.end_span(
+                getattr(execution_context, _SPAN_ATTRIBUTE, None),
+                exception_context.original_exception,
+            )
+
+    def _before_commit(self, session):
+        if self.tracer.enabled:
+            session.info[_COMMIT_SPAN_KEY] = self.tracer.start_span("db.commit")
+
+    def _after_commit(self, session):
+        self.tracer.end_span(session.info.pop(_COMMIT_SPAN_KEY, None))
+
+    def _after_rollback(self, session):
+        # A commit that failed is followed by a rollback.
+        span = session.info.pop(_COMMIT_SPAN_KEY, None)
+        if span is not None:
+            span.error = "Rollback"
+            self.tracer.end_span(span)
+
+
+# Attached to the application engine by the session module.
+default_sql_tracing = SqlTracing()
@@ -0,0 +1,116 @@
+from sqlalchemy import or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Maximum number of rows written by a single upsert statement,
+# which keeps the number of bound parameters within the driver limits.
+UPSERT_CHUNK_SIZE = 500
+
+# INSERT ... ON CONFLICT is dialect specific. SQLite supports the same
+# syntax, which lets the tests run the upserts against an in-memory database.
+_INSERT_FUNCS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def build_upsert_statement(
+    dialect_name: str,
+    entity_type,
+    index_elements: list[str],
+    update_columns: list[str],
+    only_if_changed: bool = True,
+):
+    """
+    Returns an INSERT ... ON CONFLICT (index_elements) DO UPDATE ... RETURNING
+    statement for entity_type, to be executed with a list of rows.
+
+    On conflict, update_columns and last_updated_on are set to the values
+    of the row being inserted. With only_if_changed, rows whose
+    update_columns already hold those values are left untouched,
+    so their last_updated_on does not change and they are not returned.
+    Without update_columns, the statement is INSERT ... ON CONFLICT
+    (index_elements) DO NOTHING, which only returns the inserted rows.
+
+    Raises ValueError if the dialect has no ON CONFLICT support.
+    """
+    try:
+        insert_func = _INSERT_FUNCS[dialect_name]
+    except KeyError as ke:
+        raise ValueError(f"Upsert is not supported for {dialect_name}.") from ke
+
+    stmt = insert_func(entity_type)
+    if not update_columns:
+        return (
+            stmt.on_conflict_do_nothing(index_elements=index_elements)
+            .returning(entity_type)
+            .execution_options(populate_existing=True)
+        )
+
+    set_ = {column_name: stmt.excluded[column_name] for column_name in update_columns}
+    set_["last_updated_on"] = stmt.excluded.last_updated_on
+    where = (
+        or_(
+            *(
+                getattr(entity_type, column_name) != stmt.excluded[column_name]
+                for column_name in update_columns
+            )
+        )
+        if only_if_changed
+        else None
+    )
+    # populate_existing refreshes the records of updated rows that are
+    # already loaded in the session, instead of returning them stale.
+    return (
+        stmt.on_conflict_do_update(
+            index_elements=index_elements, set_=set_, where=where
+        )
+        .returning(entity_type)
+        .execution_options(populate_existing=True)
+    )
+
+
+def dedupe_rows(rows: list[dict], index_elements: list[str]):
+    """
+    Returns the specified rows with only the last row kept for each key,
+    as a single ON CONFLICT DO UPDATE statement cannot affect a row twice.
+    """
+    return list(
+        {
+            tuple(row[column_name] for column_name in index_elements): row
+            for row in rows
+        }.values()
+    )
+
+
+async def upsert_rows(
+    async_session: AsyncSession,
+    entity_type,
+    rows: list[dict],
+    index_elements: list[str],
+    update_columns: list[str],
+    only_if_changed: bool = True,
+):
+    """
+    Inserts or updates the specified rows with one statement per chunk of
+    UPSERT_CHUNK_SIZE rows and returns the records that were inserted
+    or updated. See build_upsert_statement.
+    """
+    stmt = build_upsert_statement(
+        async_session.bind.dialect.name,
+        entity_type,
+        index_elements,
+        update_columns,
+        only_if_changed,
+    )
+    rows = dedupe_rows(rows, index_elements)
+    upserted_records = []
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        upserted_records.extend(
+            (
+                await async_session.scalars(
+                    stmt, rows[start : start + UPSERT_CHUNK_SIZE]
+                )
+            ).all()
+        )
+    return upserted_records
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -53,3 +54,27 @@ class SchemaUpdateName(BaseModel):
     name: str = Field(description="name", min_length=1, max_length=30)
 
     model_config = ConfigDict(json_schema_extra={"examples": [{"name": "name"}]})
+
+
+class SchemaUpdateDiningTable(BaseModel):
+    name: Optional[str] = Field(
+        default=None, description="name", min_length=1, max_length=30
+    )
+    x: Optional[int] = Field(default=None, description="x", ge=0)
+    y: Optional[int] = Field(default=None, description="y", ge=0)
+    width: Optional[int] = Field(default=None, description="width", ge=10)
+    height: Optional[int] = Field(default=None, description="height", ge=10)
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [{"x": 30, "y": 50, "name": "name"}]}
+    )
+
+
+class SchemaDiningTableBatchResult(BaseModel):
+    dining_table_id: Optional[UUID] = None
+    dining_table: Optional[SchemaDiningTableDisplay] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self):
+        return self.error is None
@@ -10,6 +10,17 @@ class SchemaTagCreate(BaseModel):
     model_config = ConfigDict(json_schema_extra={"examples": [{"name": "name"}]})
 
 
+class SchemaTagUpsert(BaseModel):
+    id: UUID
+    name: str = Field(description="name", min_length=1, max_length=50)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [{"id": "8b0b2f3e-8c4a-4c8e-9f0e-3d6f1a2b4c5d", "name": "name"}]
+        }
+    )
+
+
 class SchemaTagDisplay(BaseModel):
     id: UUID
     name: str
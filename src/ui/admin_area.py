@@ -2,10 +2,10 @@ from PySide6.QtCore import Signal, Slot
 from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout, QWidget
 from qasync import asyncSlot
 
+from src.ui.components.screen_manager import ScreenManager
 from src.ui.menus import Menus
 from src.ui.tables import Tables
 from src.ui.tags import Tags
-from src.ui.ui_utils import clear_layout
 
 
 class AdminArea(QWidget):
@@ -34,34 +34,31 @@ class AdminArea(QWidget):
         v_box_left.addWidget(menus_button)
         v_box_left.addWidget(tables_button)
 
-        self.main_content_layout = QVBoxLayout()
+        # Screens are built on first use and kept alive between visits.
+        self.screen_manager = ScreenManager()
+        self.screen_manager.register("tags", Tags)
+        self.screen_manager.register("items", QWidget)
+        self.screen_manager.register("menus", Menus)
+        self.screen_manager.register("tables", Tables)
+
         h_box = QHBoxLayout()
         h_box.addLayout(v_box_left, 1)
-        h_box.addLayout(self.main_content_layout, 5)
+        h_box.addWidget(self.screen_manager, 5)
 
         self.setLayout(h_box)
 
     @Slot()
     def on_tags_button_clicked_handler(self):
-        clear_layout(self.main_content_layout)
-        tags = Tags()
-        self.main_content_layout.addWidget(tags)
+        self.screen_manager.show_screen("tags")
 
     @Slot()
     def on_items_button_clicked_handler(self):
-        clear_layout(self.main_content_layout)
-        pass
-        # menus = Menus()
-        # self.main_content_layout.addWidget(menus)
+        self.screen_manager.show_screen("items")
 
     @Slot()
     def on_menus_button_clicked_handler(self):
-        clear_layout(self.main_content_layout)
-        menus = Menus()
-        self.main_content_layout.addWidget(menus)
+        self.screen_manager.show_screen("menus")
 
     @Slot()
     def on_tables_button_clicked_handler(self):
-        clear_layout(self.main_content_layout)
-        tables = Tables()
-        self.main_content_layout.addWidget(tables)
+        self.screen_manager.show_screen("tables")
@@ -0,0 +1,32 @@
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
+)
+
+ITEM_HEIGHT = 32
+ITEM_SPACING = 2
+
+
+class ButtonItemDelegate(QStyledItemDelegate):
+    """
+    Paints each row of a list view as a push button, so long lists keep
+    the look of a column of buttons without creating a widget per row.
+    """
+
+    def paint(self, painter, option: QStyleOptionViewItem, index):
+        button_option = QStyleOptionButton()
+        button_option.rect = option.rect.adjusted(0, ITEM_SPACING, 0, -ITEM_SPACING)
+        button_option.text = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        button_option.state = option.state | QStyle.StateFlag.State_Raised
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            button_option.state |= QStyle.StateFlag.State_Sunken
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button_option, painter)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index):
+        return QSize(option.rect.width(), ITEM_HEIGHT + 2 * ITEM_SPACING)
@@ -1,11 +1,18 @@
 from dataclasses import dataclass
 
 from PySide6.QtCore import QPoint, QRect, Qt, Signal
-from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 
+from src.ui.components.spatial_index import GridSpatialIndex
 
-@dataclass
+# Covers the outline drawn outside of a shape's rect by the widest pen,
+# plus antialiasing.
+REPAINT_MARGIN = 3
+LABEL_PIXMAP_CACHE_SIZE = 1024
+
+
+@dataclass(eq=False)
 class ShapeInfo:
     id: object
     name: str
@@ -52,59 +59,103 @@ class DragDrop(QWidget):
     def __init__(self, parent):
         super().__init__(parent=parent)
         self.shape_infos: list[ShapeInfo] = []
+        self.spatial_index = GridSpatialIndex()
 
         self.dragging = False
         self.drag_offset = QPoint()
-        self.dragged_shape_index = -1
-        self.selected_index = -1
+        self.dragged_shape: ShapeInfo = None
+        self.selected_shape: ShapeInfo = None
         self.shaped_moved = False
 
-    def paintEvent(self, _):
+        # Created once rather than on every paint.
+        self.border_pen = QPen(QColor(0, 0, 0))
+        self.selected_pen = QPen(QColor(0, 255, 0), 2)
+        self.unselected_pen = QPen(QColor(0, 0, 255), 1)
+        self.shape_brush = QColor(255, 0, 0)
+        self.label_font = QFont("Arial", 12)
+        self._label_pixmaps: dict = {}
+
+    def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw border around the drawing area
         border_rect = QRect(0, 0, self.width(), self.height())
-        painter.setPen(QColor(0, 0, 0))
+        painter.setPen(self.border_pen)
         painter.drawRect(border_rect)
 
         # Draw rectangles
-        painter.setBrush(QColor(255, 0, 0))
+        painter.setBrush(self.shape_brush)
 
-        for index, shape_info in enumerate(self.shape_infos):
-            if index == self.selected_index:
+        # Only the shapes within the area being repainted need drawing.
+        dirty_rect = event.rect().adjusted(
+            -REPAINT_MARGIN, -REPAINT_MARGIN, REPAINT_MARGIN, REPAINT_MARGIN
+        )
+        for shape_info in self.shapes_in(dirty_rect):
+            is_selected = shape_info is self.selected_shape
+            if is_selected:
                 # Set pen color and width for selected rectangle
-                painter.setPen(QPen(QColor(0, 255, 0), 2))
+                painter.setPen(self.selected_pen)
             else:
                 # Set pen color and width for unselected rectangles
-                painter.setPen(QPen(QColor(0, 0, 255), 1))
+                painter.setPen(self.unselected_pen)
             # Draw rectangle outline
             painter.drawRect(shape_info.rect)
 
             # Draw label inside the rectangle
-            label_text = shape_info.name
-            label_font = QFont("Arial", 12)
-            painter.setFont(label_font)
-            painter.drawText(shape_info.rect, Qt.AlignmentFlag.AlignCenter, label_text)
+            painter.drawPixmap(
+                shape_info.rect.topLeft(),
+                self._get_label_pixmap(shape_info, is_selected),
+            )
 
         painter.end()
 
     def add_shapes(self, shape_infos: list[ShapeInfo]):
         for shape_info in shape_infos:
             self.shape_infos.append(shape_info)
-        self.update()
+            self.spatial_index.insert(shape_info, shape_info.rect)
+            self.update_shape_area(shape_info.rect)
+
+    def update_shape(self, shape_info: ShapeInfo):
+        """
+        Must be called after the rect or name of the specified shape
+        is changed from outside of this widget.
+        """
+        self._move_shape(shape_info)
+
+    def update_shape_area(self, rect: QRect):
+        """
+        Schedules a repaint of the specified shape rect, including its outline.
+        """
+        self.update(
+            rect.adjusted(
+                -REPAINT_MARGIN, -REPAINT_MARGIN, REPAINT_MARGIN, REPAINT_MARGIN
+            )
+        )
+
+    def shape_at(self, point: QPoint):
+        """
+        Returns the first shape containing the specified point, or None.
+        """
+        shape_infos = self.spatial_index.items_at(point)
+        return shape_infos[0] if shape_infos else None
+
+    def shapes_in(self, rect: QRect):
+        """
+        Returns the shapes intersecting the specified rect, in list order.
+        """
+        return self.spatial_index.items_in(rect)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             mouse_pos = event.pos()
-            for index, shape_info in enumerate(self.shape_infos):
-                if shape_info.rect.contains(mouse_pos):
-                    # print("Clicked inside rectangle")
-                    self.dragging = True
-                    self.dragged_shape_index = index
-                    self.selected_index = index
-                    self.drag_offset = mouse_pos - shape_info.rect.topLeft()
-                    break
+            shape_info = self.shape_at(mouse_pos)
+            if shape_info is not None:
+                # print("Clicked inside rectangle")
+                self.dragging = True
+                self.dragged_shape = shape_info
+                self._select_shape(shape_info)
+                self.drag_offset = mouse_pos - shape_info.rect.topLeft()
 
     def mouseMoveEvent(self, event):
         if self.dragging:
@@ -112,32 +163,31 @@ class DragDrop(QWidget):
             # print(f"{event.pos()=} {self.drag_offset=} {new_pos=}")
 
             # Get the currently moved shape
-            shape_info = self.shape_infos[self.dragged_shape_index]
+            shape_info = self.dragged_shape
 
             container_rect = self._calculate_movable_area(shape_info.rect)
 
             if container_rect.contains(new_pos):
                 self.shaped_moved = True
-                self.shape_infos[self.dragged_shape_index].rect.moveTopLeft(new_pos)
-
-            # Redraw widget with new rectangle position
-            self.update()
+                shape_info.rect.moveTopLeft(new_pos)
+                # Redraw only where the rectangle was and now is
+                self._move_shape(shape_info)
 
     def mouseReleaseEvent(self, event):
         # print("Mouse Release Event")
         if event.button() == Qt.MouseButton.LeftButton:
 
-            # -1 means no shapes on there.
-            if self.dragged_shape_index > -1:
+            # None means no shapes on there.
+            if self.dragged_shape is not None:
 
                 # Get the currently moved shape
-                shape_info = self.shape_infos[self.dragged_shape_index]
+                shape_info = self.dragged_shape
 
                 self.dragging = False
-                self.dragged_shape_index = -1
+                self.dragged_shape = None
 
                 # Redraw widget with new rectangle position
-                self.update()
+                self.update_shape_area(shape_info.rect)
 
                 self.on_shape_clicked.emit(shape_info)
 
@@ -163,9 +213,78 @@ class DragDrop(QWidget):
         )
 
     def clear_selection(self):
-        self.selected_index = -1
+        self._select_shape(None)
 
     def remove_selected_shape(self):
-        self.shape_infos.pop(self.selected_index)
-        self.selected_index = -1
-        self.update()
+        if self.selected_shape is None:
+            return
+        self.remove_shape(self.selected_shape)
+
+    def remove_shape(self, shape_info: ShapeInfo):
+        self.shape_infos.remove(shape_info)
+        self.spatial_index.remove(shape_info)
+        self.update_shape_area(shape_info.rect)
+        if shape_info is self.selected_shape:
+            self.selected_shape = None
+        if shape_info is self.dragged_shape:
+            self.dragging = False
+            self.dragged_shape = None
+
+    def _select_shape(self, shape_info: ShapeInfo):
+        if shape_info is self.selected_shape:
+            return
+        for changed_shape_info in (self.selected_shape, shape_info):
+            if changed_shape_info is not None:
+                self.update_shape_area(changed_shape_info.rect)
+        self.selected_shape = shape_info
+
+    def _move_shape(self, shape_info: ShapeInfo):
+        """
+        Syncs the spatial index with the shape's rect and repaints the
+        union of its previous and current rects.
+        """
+        old_rect = self.spatial_index.rect_of(shape_info)
+        self.spatial_index.move(shape_info, shape_info.rect)
+        self.update_shape_area(old_rect.united(shape_info.rect))
+
+    def _get_label_pixmap(self, shape_info: ShapeInfo, is_selected: bool):
+        """
+        Returns the label of the specified shape rendered to a transparent
+        pixmap the size of the shape, rendering it only when the name,
+        size or selection changed.
+        """
+        device_pixel_ratio = self.devicePixelRatioF()
+        key = (
+            shape_info.name,
+            shape_info.width,
+            shape_info.height,
+            is_selected,
+            device_pixel_ratio,
+        )
+        label_pixmap = self._label_pixmaps.get(key)
+        if label_pixmap is not None:
+            return label_pixmap
+
+        if len(self._label_pixmaps) >= LABEL_PIXMAP_CACHE_SIZE:
+            self._label_pixmaps.clear()
+
+        label_pixmap = QPixmap(
+            round(shape_info.width * device_pixel_ratio),
+            round(shape_info.height * device_pixel_ratio),
+        )
+        label_pixmap.setDevicePixelRatio(device_pixel_ratio)
+        label_pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(label_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.selected_pen if is_selected else self.unselected_pen)
+        painter.setFont(self.label_font)
+        painter.drawText(
+            QRect(0, 0, shape_info.width, shape_info.height),
+            Qt.AlignmentFlag.AlignCenter,
+            shape_info.name,
+        )
+        painter.end()
+
+        self._label_pixmaps[key] = label_pixmap
+        return label_pixmap
@@ -0,0 +1,294 @@
+import asyncio
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Awaitable, Callable
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+
+from src.app.ops.exceptions.app_ops_exceptions import OpsBaseError
+from src.app.ops.utils import app_ops_utils
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_MAX_CACHED_PAGES = 10
+LOADING_TEXT = "Loading..."
+
+# Role returning the key of the item, i.e. its id.
+KEY_ROLE = Qt.ItemDataRole.UserRole
+
+
+class PagedListModel(QAbstractListModel):
+    """
+    List model that fetches its rows a page at a time, as the view
+    scrolls towards the end (canFetchMore/fetchMore).
+
+    Only max_cached_pages pages are held in memory; the least recently
+    used page is dropped when another is loaded, and fetched again if
+    its rows are shown. Pages are fetched with keyset paging, using the
+    cursor of the page before, so every page costs the same to fetch.
+
+    After a row is created or updated, reload applies the changes as row
+    insertions, removals and updates, keyed by key_func, so that the view
+    keeps its scroll position and selection. Only a change of the sort
+    resets the model.
+
+    fetch_page_func has the signature of the app_ops get_*_list functions:
+    (page_index, page_size, sort_by, after=None) -> list.
+    """
+
+    on_fetch_failed = Signal(object)
+
+    def __init__(
+        self,
+        fetch_page_func: Callable[..., Awaitable[list]],
+        sort_by: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_cached_pages: int = DEFAULT_MAX_CACHED_PAGES,
+        label_func: Callable = lambda item: item.name,
+        key_func: Callable = lambda item: item.id,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.fetch_page_func = fetch_page_func
+        self.sort_by = sort_by
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self.label_func = label_func
+        self.key_func = key_func
+        self._reset_state()
+
+    def _reset_state(self):
+        self._pages: OrderedDict = OrderedDict()
+        # page index -> cursor to fetch it with, None for the first page.
+        self._page_cursors: dict = {0: None}
+        self._loading_pages: set = set()
+        self._row_count = 0
+        self._reached_end = False
+        self._fetching_more = False
+        self._reloading = False
+        self._reload_requested = False
+        self._generation = getattr(self, "_generation", 0) + 1
+
+    @property
+    def cached_page_count(self):
+        return len(self._pages)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._row_count:
+            return None
+        if role not in (Qt.ItemDataRole.DisplayRole, KEY_ROLE):
+            return None
+
+        item = self.item_at(index.row())
+        if item is None:
+            return LOADING_TEXT if role == Qt.ItemDataRole.DisplayRole else None
+        if role == KEY_ROLE:
+            return self.key_func(item)
+        return self.label_func(item)
+
+    def item_at(self, row: int):
+        """
+        Returns the item shown at the specified row, or None if its page
+        is not in memory, in which case the page is fetched again.
+        """
+        page_index, offset = divmod(row, self.page_size)
+        page = self._pages.get(page_index)
+        if page is None:
+            self._schedule_load(page_index)
+            return None
+
+        self._pages.move_to_end(page_index)
+        return page[offset] if offset < len(page) else None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not (self._reached_end or self._fetching_more)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        next_page_index = self._row_count // self.page_size
+        if next_page_index not in self._page_cursors:
+            return
+        self._fetching_more = True
+        self._schedule_load(next_page_index)
+
+    def refresh(self):
+        """
+        Drops every row and fetches the first page again.
+        Resets the view, so prefer reload unless the sort changed.
+        """
+        self.beginResetModel()
+        self._reset_state()
+        self.endResetModel()
+        self.fetchMore()
+
+    def set_sort_by(self, sort_by: str):
+        self.sort_by = sort_by
+        self.refresh()
+
+    def reload(self):
+        """
+        Fetches the rows shown again in the background, e.g. after a row
+        was created or updated, and applies the differences by key as row
+        insertions, removals and updates.
+        Falls back to refresh if the rows shown span more pages than
+        are held in memory.
+        """
+        page_count = max(1, -(-self._row_count // self.page_size))
+        if page_count > self.max_cached_pages:
+            self.refresh()
+            return
+        if self._reloading:
+            self._reload_requested = True
+            return
+        self._reloading = True
+        asyncio.ensure_future(self._reload(page_count, self._generation))
+
+    async def _reload(self, page_count: int, generation: int):
+        pages = []
+        after = None
+        try:
+            for page_index in range(page_count):
+                page = await self.fetch_page_func(
+                    page_index, self.page_size, self.sort_by, after=after
+                )
+                pages.append(page)
+                if len(page) < self.page_size:
+                    break
+                after = app_ops_utils.get_next_cursor(page, self.sort_by)
+        except OpsBaseError as e:
+            if generation == self._generation:
+                self._reloading = False
+                self.on_fetch_failed.emit(e)
+            return
+
+        # The model was refreshed while the rows were being fetched.
+        if generation != self._generation:
+            return
+
+        self._reloading = False
+        self._apply_reloaded_pages(pages)
+        if self._reload_requested:
+            self._reload_requested = False
+            self.reload()
+
+    def _apply_reloaded_pages(self, pages: list[list]):
+        page_count = -(-self._row_count // self.page_size)
+        if any(page_index not in self._pages for page_index in range(page_count)):
+            # Pages shown were evicted meanwhile, so there is nothing to diff.
+            self.refresh()
+            return
+        old_rows = [
+            item for page_index in range(page_count) for item in self._pages[page_index]
+        ]
+        new_rows = [item for page in pages for item in page]
+
+        # Pages fetched meanwhile used cursors that may have moved.
+        self._generation += 1
+        self._loading_pages.clear()
+        self._fetching_more = False
+        self._reached_end = len(pages[-1]) < self.page_size
+
+        opcodes = SequenceMatcher(
+            a=[self.key_func(item) for item in old_rows],
+            b=[self.key_func(item) for item in new_rows],
+            autojunk=False,
+        ).get_opcodes()
+        # Applied from the end, so that the old row numbers stay valid.
+        rows = list(old_rows)
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag in ("delete", "replace"):
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del rows[i1:i2]
+                self._set_rows(rows)
+                self.endRemoveRows()
+            if tag in ("insert", "replace"):
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                rows[i1:i1] = new_rows[j1:j2]
+                self._set_rows(rows)
+                self.endInsertRows()
+
+        self._set_rows(new_rows)
+        for tag, i1, _, j1, j2 in opcodes:
+            if tag != "equal":
+                continue
+            for offset in range(j2 - j1):
+                if self.label_func(old_rows[i1 + offset]) != self.label_func(
+                    new_rows[j1 + offset]
+                ):
+                    index = self.index(j1 + offset)
+                    self.dataChanged.emit(index, index)
+
+    def _set_rows(self, rows: list):
+        self._pages = OrderedDict(
+            (page_index, rows[first_row : first_row + self.page_size])
+            for page_index, first_row in enumerate(range(0, len(rows), self.page_size))
+        )
+        self._page_cursors = {0: None}
+        for page_index, page in self._pages.items():
+            if len(page) == self.page_size:
+                self._page_cursors[page_index + 1] = app_ops_utils.get_next_cursor(
+                    page, self.sort_by
+                )
+        self._row_count = len(rows)
+
+    def _schedule_load(self, page_index: int):
+        if page_index in self._loading_pages:
+            return
+        self._loading_pages.add(page_index)
+        asyncio.ensure_future(self._load_page(page_index, self._generation))
+
+    async def _load_page(self, page_index: int, generation: int):
+        try:
+            page = await self.fetch_page_func(
+                page_index,
+                self.page_size,
+                self.sort_by,
+                after=self._page_cursors[page_index],
+            )
+        except OpsBaseError as e:
+            if generation == self._generation:
+                self._loading_pages.discard(page_index)
+                self._fetching_more = False
+                self.on_fetch_failed.emit(e)
+            return
+
+        # The model was refreshed while the page was being fetched.
+        if generation != self._generation:
+            return
+
+        self._loading_pages.discard(page_index)
+        self._pages[page_index] = page
+        if len(page) == self.page_size:
+            self._page_cursors[page_index + 1] = app_ops_utils.get_next_cursor(
+                page, self.sort_by
+            )
+
+        first_row = page_index * self.page_size
+        if first_row >= self._row_count:
+            self._append_page(first_row, page)
+        elif len(page) != min(self.page_size, self._row_count - first_row):
+            # Rows were added or removed, so the following pages shifted.
+            self.refresh()
+            return
+        elif page:
+            self.dataChanged.emit(
+                self.index(first_row), self.index(first_row + len(page) - 1)
+            )
+        self._evict_pages()
+
+    def _append_page(self, first_row: int, page: list):
+        self._fetching_more = False
+        if len(page) < self.page_size:
+            self._reached_end = True
+        if not page:
+            return
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(page) - 1)
+        self._row_count = first_row + len(page)
+        self.endInsertRows()
+
+    def _evict_pages(self):
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
@@ -0,0 +1,109 @@
+from typing import Awaitable, Callable
+
+from PySide6.QtCore import QModelIndex
+from PySide6.QtWidgets import QListView, QMessageBox, QPushButton, QVBoxLayout, QWidget
+from qasync import asyncSlot
+
+from src.ui.components.button_item_delegate import ButtonItemDelegate
+from src.ui.components.paged_list_model import KEY_ROLE, PagedListModel
+
+
+class PagedListScreen(QWidget):
+    """
+    Lists records as buttons, fetched a page at a time as the list
+    scrolls, above a button to create a record.
+
+    Clicking a record or the create button shows the form returned by
+    create_edit_form or create_new_form in place of the list. The form
+    must call on_form_saved_handler once saved, which shows the list again.
+
+    - *fetch_page_func* One of the app_ops get_*_list functions
+    - *title* Shown in the title of error messages, e.g. "Menus"
+    """
+
+    def __init__(
+        self,
+        fetch_page_func: Callable[..., Awaitable[list]],
+        sort_by: str,
+        page_size: int,
+        create_button_text: str,
+        title: str,
+    ):
+        super().__init__()
+        self.title = title
+        self.init_ui(fetch_page_func, sort_by, page_size, create_button_text)
+
+    def init_ui(
+        self,
+        fetch_page_func: Callable[..., Awaitable[list]],
+        sort_by: str,
+        page_size: int,
+        create_button_text: str,
+    ):
+        self.base_layout = QVBoxLayout()
+        self.setLayout(self.base_layout)
+
+        # Rows are fetched a page at a time as the list scrolls.
+        self.list_container = QWidget()
+        list_container_layout = QVBoxLayout()
+        list_container_layout.setContentsMargins(0, 0, 0, 0)
+        self.list_container.setLayout(list_container_layout)
+
+        self.list_model = PagedListModel(fetch_page_func, sort_by, page_size=page_size)
+        self.list_model.on_fetch_failed.connect(self.on_fetch_failed_handler)
+        self.list_view = QListView()
+        self.list_view.setModel(self.list_model)
+        self.list_view.setItemDelegate(ButtonItemDelegate(self.list_view))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.clicked.connect(self.on_list_clicked_handler)
+        list_container_layout.addWidget(self.list_view)
+
+        create_button = QPushButton(create_button_text)
+        create_button.clicked.connect(self.on_create_requested_handler)
+        list_container_layout.addWidget(create_button)
+
+        self.base_layout.addWidget(self.list_container)
+        self.form = None
+        self.list_model.fetchMore()
+
+    def create_new_form(self) -> QWidget:
+        raise NotImplementedError
+
+    def create_edit_form(self, key) -> QWidget:
+        raise NotImplementedError
+
+    def on_create_requested_handler(self):
+        self._show_form(self.create_new_form())
+
+    def on_list_clicked_handler(self, index: QModelIndex):
+        key = index.data(KEY_ROLE)
+        if key is not None:
+            self._show_form(self.create_edit_form(key))
+
+    @asyncSlot()
+    async def on_form_saved_handler(self):
+        self._close_form()
+        self.list_model.reload()
+
+    def refresh(self):
+        # Called by the screen manager when the screen is shown again.
+        if self.form is None:
+            self.list_model.reload()
+
+    def on_fetch_failed_handler(self, error: Exception):
+        QMessageBox.warning(
+            self, self.title, f"Could not load {self.title.lower()}: {error}"
+        )
+
+    def _show_form(self, form: QWidget):
+        self._close_form()
+        self.list_container.hide()
+        self.form = form
+        self.base_layout.addWidget(form)
+
+    def _close_form(self):
+        if self.form is not None:
+            self.base_layout.removeWidget(self.form)
+            self.form.deleteLater()
+            self.form = None
+        self.list_container.show()
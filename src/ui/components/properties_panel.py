@@ -141,6 +141,7 @@ class PropertiesPanel(QWidget):
         self.programmatic_change = False
 
     def clear_shape_info(self):
+        self.programmatic_change = True
         self.width_spinbox.setValue(50)
         self.height_spinbox.setValue(50)
         self.x_spinbox.setValue(0)
@@ -148,3 +149,4 @@ class PropertiesPanel(QWidget):
         self.table_name_edit.setText("")
         self.table_id_edit.setText("")
         self.shape_info = None
+        self.programmatic_change = False
@@ -0,0 +1,128 @@
+import time
+from typing import Callable, Collection, Optional
+
+from PySide6.QtWidgets import QStackedWidget, QWidget
+
+DEFAULT_MAX_SCREENS = 4
+
+
+def select_screens_to_evict(
+    last_shown_on: dict,
+    current_name: str,
+    max_screens: int,
+    idle_timeout: Optional[float],
+    now: float,
+    pinned_names: Collection[str] = (),
+):
+    """
+    Returns the names of the screens to evict, least recently shown first:
+    those idle for longer than idle_timeout, then as many of the least
+    recently shown as needed to keep max_screens. The current screen and
+    the pinned screens are never evicted, so more than max_screens
+    screens are kept while too many of them are pinned.
+    """
+    candidates = sorted(
+        (
+            name
+            for name in last_shown_on
+            if name != current_name and name not in pinned_names
+        ),
+        key=last_shown_on.get,
+    )
+    evicted = []
+    if idle_timeout is not None:
+        evicted = [
+            name for name in candidates if now - last_shown_on[name] > idle_timeout
+        ]
+
+    excess = len(last_shown_on) - len(evicted) - max_screens
+    for name in candidates:
+        if excess <= 0:
+            break
+        if name not in evicted:
+            evicted.append(name)
+            excess -= 1
+    return evicted
+
+
+def has_unsaved_changes(screen) -> bool:
+    """
+    Returns whether the specified screen reports unsaved changes
+    through its has_unsaved_changes method, if it has one.
+    """
+    has_unsaved_changes_func = getattr(screen, "has_unsaved_changes", None)
+    return callable(has_unsaved_changes_func) and has_unsaved_changes_func()
+
+
+class ScreenManager(QStackedWidget):
+    """
+    Shows one screen at a time, building each on first use and keeping
+    it alive afterwards, with its loaded data.
+
+    When a kept screen is shown again, its refresh method is called if it
+    has one, so that it can update itself in the background.
+
+    At most max_screens screens are kept, counted regardless of their
+    size, and screens not shown for idle_timeout seconds are dropped;
+    evicted screens are built again the next time they are shown.
+    Screens whose has_unsaved_changes method returns True are never
+    evicted, so that their edits are not lost.
+    """
+
+    def __init__(
+        self,
+        max_screens: int = DEFAULT_MAX_SCREENS,
+        idle_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.max_screens = max_screens
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self._factories: dict = {}
+        self._screens: dict = {}
+        self._last_shown_on: dict = {}
+        self._current_name = None
+
+    def register(self, name: str, factory: Callable[[], QWidget]):
+        self._factories[name] = factory
+
+    def screen(self, name: str) -> Optional[QWidget]:
+        """Returns the screen with the specified name if it is built."""
+        return self._screens.get(name)
+
+    def show_screen(self, name: str) -> QWidget:
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._factories[name]()
+            self._screens[name] = screen
+            self.addWidget(screen)
+        elif name != self._current_name:
+            refresh = getattr(screen, "refresh", None)
+            if callable(refresh):
+                refresh()
+
+        self.setCurrentWidget(screen)
+        self._current_name = name
+        self._last_shown_on[name] = self.clock()
+        self._evict_screens()
+        return screen
+
+    def _evict_screens(self):
+        for name in select_screens_to_evict(
+            self._last_shown_on,
+            self._current_name,
+            self.max_screens,
+            self.idle_timeout,
+            self.clock(),
+            pinned_names={
+                name
+                for name, screen in self._screens.items()
+                if has_unsaved_changes(screen)
+            },
+        ):
+            screen = self._screens.pop(name)
+            del self._last_shown_on[name]
+            self.removeWidget(screen)
+            screen.deleteLater()
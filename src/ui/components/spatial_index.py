@@ -0,0 +1,123 @@
+from collections import defaultdict
+
+from PySide6.QtCore import QPoint, QRect
+
+DEFAULT_CELL_SIZE = 64
+
+
+class GridSpatialIndex:
+    """
+    Uniform grid over the items' bounding rects, so that point and rect
+    queries only test the items registered in the cells they touch,
+    instead of every item.
+
+    Results are returned in insertion order, so callers that resolve
+    overlaps by list order keep the same behaviour as a linear scan.
+
+    Rects are copied on insert and move, so the index must be told
+    through move when an item's rect changes.
+    """
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: defaultdict = defaultdict(set)
+        # item -> (order, rect, cells)
+        self._entries: dict = {}
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def insert(self, item, rect: QRect):
+        if item in self._entries:
+            self.move(item, rect)
+            return
+
+        cells = self._cells_for(rect)
+        for cell in cells:
+            self._cells[cell].add(item)
+        self._entries[item] = (self._next_order, QRect(rect), cells)
+        self._next_order += 1
+
+    def remove(self, item):
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return
+
+        _, _, cells = entry
+        self._discard_from_cells(item, cells)
+
+    def move(self, item, rect: QRect):
+        """
+        Updates the rect of an item already in the index,
+        keeping its insertion order.
+        """
+        order, _, old_cells = self._entries[item]
+        new_cells = self._cells_for(rect)
+        if new_cells != old_cells:
+            self._discard_from_cells(item, old_cells - new_cells)
+            for cell in new_cells - old_cells:
+                self._cells[cell].add(item)
+        self._entries[item] = (order, QRect(rect), new_cells)
+
+    def rect_of(self, item):
+        """
+        Returns a copy of the rect the specified item was indexed with.
+        """
+        return QRect(self._entries[item][1])
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+
+    def items_at(self, point: QPoint):
+        """
+        Returns the items whose rect contains the specified point.
+        """
+        cell = (point.x() // self.cell_size, point.y() // self.cell_size)
+        return self._sorted(
+            item
+            for item in self._cells.get(cell, ())
+            if self._entries[item][1].contains(point)
+        )
+
+    def items_in(self, rect: QRect):
+        """
+        Returns the items whose rect intersects the specified rect.
+        """
+        candidates = set()
+        for cell in self._cells_for(rect):
+            candidates.update(self._cells.get(cell, ()))
+        return self._sorted(
+            item for item in candidates if self._entries[item][1].intersects(rect)
+        )
+
+    def _sorted(self, items):
+        return sorted(items, key=lambda item: self._entries[item][0])
+
+    def _cells_for(self, rect: QRect):
+        if rect.isEmpty():
+            return frozenset()
+
+        rect = rect.normalized()
+        left = rect.left() // self.cell_size
+        right = rect.right() // self.cell_size
+        top = rect.top() // self.cell_size
+        bottom = rect.bottom() // self.cell_size
+        return frozenset(
+            (column, row)
+            for column in range(left, right + 1)
+            for row in range(top, bottom + 1)
+        )
+
+    def _discard_from_cells(self, item, cells):
+        for cell in cells:
+            cell_items = self._cells.get(cell)
+            if cell_items is None:
+                continue
+            cell_items.discard(item)
+            if not cell_items:
+                del self._cells[cell]
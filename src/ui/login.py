@@ -2,14 +2,13 @@ from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QComboBox, QLineEdit, QVBoxLayout, QWidget
 from qasync import asyncSlot
 
-from src.app.ops.app_ops_user import login
-from src.schemas.schema_user import SchemaUserDisplay
 from src.ui.components.pinpad import PinPad
 from src.ui.user_type import UserType
 
 
 class Login(QWidget):
-    on_credentials_success = Signal(SchemaUserDisplay)
+    # Emits the SchemaUserDisplay of the user logged in.
+    on_credentials_success = Signal(object)
 
     def __init__(self):
         super().__init__()
@@ -43,6 +42,10 @@ class Login(QWidget):
             self.display.setText(current_text + clicked_text)
 
     async def _login(self):
+        # Imported here so that the PIN pad shows without waiting for
+        # the persistence layer to load.
+        from src.app.ops.app_ops_user import login
+
         user = await login(self.user_selection.currentText(), self.display.text())
         if user:
             self.on_credentials_success.emit(user)
@@ -1,21 +1,36 @@
-import asyncio
-
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QMainWindow
 
-from src.app.ops.app_ops_dining_table import get_dining_table_list
-from src.ui.admin_area import AdminArea
 from src.ui.login import Login
 from src.ui.user_type import UserType
+from src.ui.warm_up import WarmUp, describe_status
 
 
 class OrderItMainWindow(QMainWindow):
+    # Emitted once the window has been painted for the first time.
+    # The warm-up is started from here, so that the window shows
+    # without waiting for it.
+    on_first_paint = Signal()
+
     def __init__(self, app):
         super().__init__()
 
         self.app = app
-        asyncio.ensure_future(get_dining_table_list(0, 10, None))
+        self.painted = False
+        self.warm_up = WarmUp(parent=self)
+        self.warm_up.on_status.connect(self.on_warm_up_status_handler)
+        self.on_first_paint.connect(self.warm_up.start)
         self.init_ui()
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.on_first_paint.emit()
+
+    def on_warm_up_status_handler(self, name, status):
+        self.statusBar().showMessage(describe_status(name, status))
+
     def init_ui(self):
         self.setWindowTitle("Order It!")
         self.setGeometry(100, 100, 800, 600)
@@ -47,6 +62,9 @@ class OrderItMainWindow(QMainWindow):
         self.setCentralWidget(login)
 
     def display_area_admin(self):
+        # Loaded by the warm-up, unless an admin logs in before it gets there.
+        from src.ui.admin_area import AdminArea
+
         admin_area = AdminArea()
         self.setCentralWidget(admin_area)
 
@@ -1,10 +1,20 @@
 import asyncio
 
 from PySide6.QtCore import QRect
-from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout, QWidget
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QMessageBox,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
 from qasync import asyncSlot
 
 from src.app.ops import app_ops_dining_table
+from src.app.ops.exceptions.app_ops_exceptions import (
+    ConcurrentUpdateError,
+    OpsBaseError,
+)
 from src.schemas.schema_dining_table import (
     SchemaDiningTableCreate,
     SchemaUpdateName,
@@ -13,10 +23,12 @@ from src.schemas.schema_dining_table import (
 )
 from src.ui.components.drag_drop import DragDrop, ShapeInfo
 from src.ui.components.properties_panel import PropertiesPanel
+from src.utils.tracing import default_tracer
 
 DEFAULT_TABLE_NAME = "No name"
 DEFAULT_TABLE_X = DEFAULT_TABLE_Y = 1
 DEFAULT_TABLE_WIDTH = DEFAULT_TABLE_HEIGHT = 100
+TABLES_PAGE_SIZE = 500
 
 
 class Tables(QWidget):
@@ -26,6 +38,11 @@ class Tables(QWidget):
 
     def init_ui(self):
 
+        # Layout edits apply in memory and are written together on save.
+        # They are kept while the screen is hidden, until saved or reverted.
+        self.edit_session = app_ops_dining_table.DiningTableEditSession()
+        self._commit_lock = asyncio.Lock()
+
         self.drag_drop = DragDrop(self)
         self.drag_drop.on_shape_move_finished.connect(
             self.on_table_move_finished_handler
@@ -34,9 +51,19 @@ class Tables(QWidget):
 
         self.create_table_button = QPushButton("Create Table")
         self.create_table_button.clicked.connect(self.on_create_table_handler)
+        self.save_button = QPushButton("Save")
+        self.save_button.clicked.connect(self.on_save_handler)
+        self.revert_button = QPushButton("Revert")
+        self.revert_button.clicked.connect(self.on_revert_handler)
+        self.update_edit_buttons()
+
+        buttons_box = QHBoxLayout()
+        buttons_box.addWidget(self.create_table_button)
+        buttons_box.addWidget(self.save_button)
+        buttons_box.addWidget(self.revert_button)
         v_box = QVBoxLayout()
         v_box.addWidget(self.drag_drop)
-        v_box.addWidget(self.create_table_button)
+        v_box.addLayout(buttons_box)
 
         self.properties_panel = PropertiesPanel()
         self.properties_panel.on_delete_shape_confirmed.connect(
@@ -61,21 +88,74 @@ class Tables(QWidget):
         asyncio.ensure_future(self._load_existing_tables())
 
     async def _load_existing_tables(self):
-        tables = await app_ops_dining_table.get_dining_table_list(0, 500, None)
-        self.drag_drop.add_shapes(
-            ShapeInfo(
-                table.id,
+        """
+        Loads the tables and syncs the floor plan with them: new tables
+        are added, deleted ones removed and changed ones updated in place.
+        Tables with unsaved edits are left as they are.
+        """
+        with default_tracer.span("ui.tables.load"):
+            self._sync_tables(
+                await app_ops_dining_table.get_dining_table_list(
+                    0, TABLES_PAGE_SIZE, None
+                )
+            )
+
+    def _sync_tables(self, tables):
+        shape_infos_by_id = {
+            shape_info.id: shape_info for shape_info in self.drag_drop.shape_infos
+        }
+        edited_ids = set(self.edit_session.diff())
+
+        new_shape_infos = []
+        for table in tables:
+            if table.id in edited_ids:
+                continue
+            self.track_table(table)
+            shape_info = shape_infos_by_id.get(table.id)
+            if shape_info is None:
+                new_shape_infos.append(
+                    ShapeInfo(
+                        table.id,
+                        table.name,
+                        QRect(table.x, table.y, table.width, table.height),
+                    )
+                )
+            elif (shape_info.name, shape_info.rect) != (
                 table.name,
                 QRect(table.x, table.y, table.width, table.height),
-            )
-            for table in tables
-        )
+            ):
+                shape_info.name = table.name
+                shape_info.rect.setRect(table.x, table.y, table.width, table.height)
+                self.drag_drop.update_shape(shape_info)
+                if self.properties_panel.shape_info is shape_info:
+                    self.properties_panel.set_shape_info(shape_info)
+        self.drag_drop.add_shapes(new_shape_infos)
+
+        loaded_ids = {table.id for table in tables}
+        for shape_id, shape_info in shape_infos_by_id.items():
+            if shape_id not in loaded_ids and shape_id not in edited_ids:
+                if self.properties_panel.shape_info is shape_info:
+                    self.properties_panel.clear_shape_info()
+                self.drag_drop.remove_shape(shape_info)
+                self.edit_session.untrack(shape_id)
+
+    def refresh(self):
+        # Called by the screen manager when the screen is shown again.
+        asyncio.ensure_future(self._load_existing_tables())
+
+    def has_unsaved_changes(self):
+        # Called by the screen manager, which keeps the screen until saved.
+        return self.edit_session.has_changes() or self._commit_lock.locked()
 
     def on_table_clicked_handler(self, shape_info: ShapeInfo):
         self.properties_panel.set_shape_info(shape_info)
 
     @asyncSlot()
     async def on_create_table_handler(self):
+        with default_tracer.span("ui.tables.create_table"):
+            await self._create_table()
+
+    async def _create_table(self):
         new_record = await app_ops_dining_table.create_dining_table(
             SchemaDiningTableCreate(
                 name=DEFAULT_TABLE_NAME,
@@ -86,6 +166,7 @@ class Tables(QWidget):
             )
         )
 
+        self.track_table(new_record)
         self.drag_drop.add_shapes(
             [
                 ShapeInfo(
@@ -98,44 +179,99 @@ class Tables(QWidget):
             ]
         )
 
-    @asyncSlot()
-    async def on_properties_panel_table_position_changed_handler(
-        self, shape_info: ShapeInfo
-    ):
-        self.drag_drop.update()
-        await self.update_table_position(shape_info)
+    def on_properties_panel_table_position_changed_handler(self, shape_info: ShapeInfo):
+        self.drag_drop.update_shape(shape_info)
+        self.update_table_position(shape_info)
 
-    @asyncSlot()
-    async def on_properties_panel_table_size_changed_handler(
-        self, shape_info: ShapeInfo
-    ):
-        self.drag_drop.update()
-        await app_ops_dining_table.update_size(
+    def on_properties_panel_table_size_changed_handler(self, shape_info: ShapeInfo):
+        self.drag_drop.update_shape(shape_info)
+        self.edit_session.update_size(
             shape_info.id,
             SchemaUpdateSize(width=shape_info.width, height=shape_info.height),
         )
+        self.update_edit_buttons()
 
-    @asyncSlot()
-    async def on_properties_panel_table_name_changed_handler(
-        self, shape_info: ShapeInfo
-    ):
-        self.drag_drop.update()
-        await app_ops_dining_table.update_name(
+    def on_properties_panel_table_name_changed_handler(self, shape_info: ShapeInfo):
+        self.drag_drop.update_shape(shape_info)
+        self.edit_session.update_name(
             shape_info.id, SchemaUpdateName(name=shape_info.name)
         )
+        self.update_edit_buttons()
 
     @asyncSlot()
     async def on_properties_panel_delete_confirmed_handler(self, shape_id):
-        await app_ops_dining_table.delete_dining_table(shape_id)
+        dining_table_id = self.properties_panel.shape_info.id
+        with default_tracer.span("ui.tables.delete_table"):
+            await app_ops_dining_table.delete_dining_table(shape_id)
+        self.edit_session.untrack(dining_table_id)
         self.properties_panel.clear_shape_info()
         self.drag_drop.remove_selected_shape()
+        self.update_edit_buttons()
 
-    @asyncSlot()
-    async def on_table_move_finished_handler(self, shape_info: ShapeInfo):
-        await self.update_table_position(shape_info)
+    def on_table_move_finished_handler(self, shape_info: ShapeInfo):
+        self.update_table_position(shape_info)
 
-    async def update_table_position(self, shape_info: ShapeInfo):
-        await app_ops_dining_table.update_position(
+    def update_table_position(self, shape_info: ShapeInfo):
+        self.edit_session.update_position(
             shape_info.id,
             SchemaUpdatePosition(x=shape_info.x, y=shape_info.y),
         )
+        self.update_edit_buttons()
+
+    def track_table(self, table):
+        self.edit_session.track_dining_table(
+            table.id,
+            table.name,
+            table.x,
+            table.y,
+            table.width,
+            table.height,
+            last_updated_on=table.last_updated_on,
+        )
+
+    def update_edit_buttons(self):
+        has_changes = self.edit_session.has_changes
+        self.save_button.setEnabled(has_changes)
+        self.revert_button.setEnabled(has_changes)
+
+    @asyncSlot()
+    async def on_save_handler(self):
+        await self._commit_edit_session()
+
+    def on_revert_handler(self):
+        shape_infos_by_id = {
+            shape_info.id: shape_info for shape_info in self.drag_drop.shape_infos
+        }
+        for shape_id, values in self.edit_session.revert().items():
+            shape_info = shape_infos_by_id.get(shape_id)
+            if shape_info is None:
+                continue
+            for field, value in values.items():
+                setattr(shape_info, field, value)
+            self.drag_drop.update_shape(shape_info)
+            if self.properties_panel.shape_info is shape_info:
+                self.properties_panel.set_shape_info(shape_info)
+        self.update_edit_buttons()
+
+    async def _commit_edit_session(self):
+        # Commits run one at a time, so the same edits are never sent twice.
+        async with self._commit_lock:
+            try:
+                with default_tracer.span("ui.tables.save"):
+                    await self.edit_session.commit()
+            except ConcurrentUpdateError:
+                # The edit session dropped the changes to these tables,
+                # so reloading shows their current version.
+                await self._load_existing_tables()
+                QMessageBox.warning(
+                    self,
+                    "Tables",
+                    "Some tables were changed or deleted on another terminal. "
+                    "Their latest version is shown and your changes to them "
+                    "were not saved.",
+                )
+            except OpsBaseError as e:
+                QMessageBox.warning(
+                    self, "Tables", f"Could not save table changes: {e}"
+                )
+        self.update_edit_buttons()
@@ -0,0 +1,103 @@
+import asyncio
+import importlib
+
+from PySide6.QtCore import QObject, Signal
+
+from src.app.ops.utils.warm_up import WarmUpStatus, WarmUpStep, run_warm_up
+from src.configuration import Configuration
+
+# The persistence layer and the admin screens are imported by the steps,
+# so that importing this module does not hold up the first paint.
+
+
+async def load_admin_screens():
+    # Imported in a worker thread, as the import takes close to a second,
+    # which would freeze the PIN entry. The import still holds the GIL in
+    # bursts, e.g. while loading extension modules, which delays the loop
+    # by tens of milliseconds at worst. A login meanwhile waits for the
+    # import to finish.
+    await asyncio.to_thread(importlib.import_module, "src.ui.admin_area")
+
+
+async def open_connection_pool():
+    from src.persistence.database import session
+
+    await session.warm_up_connection_pool(
+        Configuration.PERSISTENCE__DATABASE__POOL_WARM_UP_CONNECTIONS
+    )
+
+
+# The preload steps fetch the same pages as the admin screens do when they
+# open, so that the screens are served from the list cache for up to
+# list_cache.ttl seconds. Running the queries also compiles their
+# statements into SQLAlchemy's statement cache.
+
+
+async def preload_floor_plan():
+    from src.app.ops import app_ops_dining_table
+    from src.ui.tables import TABLES_PAGE_SIZE
+
+    await app_ops_dining_table.get_dining_table_list(0, TABLES_PAGE_SIZE, None)
+
+
+async def preload_menus():
+    from src.app.ops import app_ops_menu
+    from src.ui.menus import MENUS_PAGE_SIZE, MENUS_SORT_BY
+
+    await app_ops_menu.get_menu_list(0, MENUS_PAGE_SIZE, MENUS_SORT_BY)
+
+
+async def preload_tags():
+    from src.app.ops import app_ops_tag
+    from src.ui.tags import TAGS_PAGE_SIZE, TAGS_SORT_BY
+
+    await app_ops_tag.get_tag_list(0, TAGS_PAGE_SIZE, TAGS_SORT_BY)
+
+
+def build_warm_up_steps():
+    return [
+        WarmUpStep("Loading screens", load_admin_screens),
+        WarmUpStep("Connecting to the database", open_connection_pool),
+        WarmUpStep("Loading the floor plan", preload_floor_plan),
+        WarmUpStep("Loading menus", preload_menus),
+        WarmUpStep("Loading tags", preload_tags),
+    ]
+
+
+class WarmUp(QObject):
+    """
+    Runs the warm-up steps in the background, e.g. while the login
+    screen is shown, so that the admin screens open with warm data.
+    """
+
+    # Emits the step name and its WarmUpStatus.
+    on_status = Signal(str, object)
+    # Emits the dict of step name to the error it raised, or None.
+    on_finished = Signal(object)
+
+    def __init__(self, steps: list[WarmUpStep] = None, parent=None):
+        super().__init__(parent)
+        self.steps = build_warm_up_steps() if steps is None else steps
+        self.is_running = False
+        self.results = None
+
+    def start(self):
+        if self.is_running:
+            return
+        self.is_running = True
+        asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        try:
+            self.results = await run_warm_up(self.steps, self.on_status.emit)
+        finally:
+            self.is_running = False
+        self.on_finished.emit(self.results)
+
+
+def describe_status(name: str, status: WarmUpStatus):
+    if status == WarmUpStatus.RUNNING:
+        return f"{name}..."
+    if status == WarmUpStatus.FAILED:
+        return f"{name} failed."
+    return ""
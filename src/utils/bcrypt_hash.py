@@ -1,6 +1,25 @@
-from passlib.context import CryptContext
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 
-pwd_cxt = CryptContext(schemes="bcrypt", deprecated="auto")
+from src.configuration import Configuration
+
+_pwd_cxt = None
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_pwd_cxt():
+    """
+    Returns the passlib context, importing passlib on first use
+    so that it is not loaded at startup.
+    """
+    global _pwd_cxt
+    if _pwd_cxt is None:
+        from passlib.context import CryptContext
+
+        _pwd_cxt = CryptContext(schemes="bcrypt", deprecated="auto")
+    return _pwd_cxt
 
 
 def bcrypt(password: str):
@@ -9,7 +28,7 @@ def bcrypt(password: str):
 
     - *password* The string to hash
     """
-    return pwd_cxt.hash(password)
+    return get_pwd_cxt().hash(password)
 
 
 def verify_bcrypt(password: str, password_hash: str):
@@ -19,4 +38,62 @@ def verify_bcrypt(password: str, password_hash: str):
     - *password* The plain password
     - *hashed_password* The hashed string to check with the plain password
     """
-    return pwd_cxt.verify(password, password_hash)
+    return get_pwd_cxt().verify(password, password_hash)
+
+
+def get_executor() -> Executor:
+    """
+    Returns the bounded thread pool that bcrypt work is offloaded to,
+    creating it on first use. The bcrypt package releases the GIL while
+    hashing, so threads are enough to keep the event loop responsive.
+    passlib falls back to backends that hold the GIL if it is missing.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=Configuration.BCRYPT__MAX_WORKERS,
+                thread_name_prefix="bcrypt",
+            )
+        return _executor
+
+
+def shutdown_executor():
+    """
+    Shuts down the bcrypt thread pool, waiting for queued work to finish.
+    A new pool is created if bcrypt work is requested afterwards.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def bcrypt_async(password: str, executor: Executor = None):
+    """
+    Performs bcrypt hash on the specified password string in the
+    bcrypt thread pool, without blocking the event loop.
+
+    - *password* The string to hash
+    - *executor* The executor to run the hash in, the shared pool by default
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        executor or get_executor(), bcrypt, password
+    )
+
+
+async def verify_bcrypt_async(
+    password: str, password_hash: str, executor: Executor = None
+):
+    """
+    Checks if the plain password and the hashed password is a match in the
+    bcrypt thread pool, without blocking the event loop.
+
+    - *password* The plain password
+    - *hashed_password* The hashed string to check with the plain password
+    - *executor* The executor to run the check in, the shared pool by default
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        executor or get_executor(), verify_bcrypt, password, password_hash
+    )
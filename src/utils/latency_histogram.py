@@ -0,0 +1,76 @@
+import bisect
+import math
+
+# Upper bounds, in seconds, of the histogram buckets.
+# The last bucket holds everything slower than the last bound.
+DEFAULT_BUCKET_BOUNDS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+class LatencyHistogram:
+    """
+    Counts latencies into fixed buckets, so that recording is cheap and
+    the memory used does not grow with the number of latencies recorded.
+    Percentiles are estimated as the upper bound of the bucket they fall in,
+    capped by the slowest latency recorded.
+    """
+
+    def __init__(self, bucket_bounds: tuple = DEFAULT_BUCKET_BOUNDS):
+        self.bucket_bounds = tuple(bucket_bounds)
+        self.bucket_counts = [0] * (len(self.bucket_bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float):
+        """
+        Returns the estimated latency, in seconds, below which the
+        specified percentage of the recorded latencies fall.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                break
+        if index == len(self.bucket_bounds):
+            return self.max
+        return min(self.bucket_bounds[index], self.max)
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip([*self.bucket_bounds, math.inf], self.bucket_counts)),
+        }
@@ -0,0 +1,169 @@
+import asyncio
+import contextlib
+import json
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from src.utils.latency_histogram import LatencyHistogram
+
+DEFAULT_STALL_THRESHOLD = 0.1
+DEFAULT_HEARTBEAT_INTERVAL = 0.05
+DEFAULT_SAMPLE_INTERVAL = 0.01
+DEFAULT_MAX_STACK_DEPTH = 40
+
+
+@dataclass
+class Stall:
+    """
+    A period during which the event loop did not run its callbacks.
+
+    - *started_on* When the loop stopped responding, as a UTC datetime
+    - *seconds* How long the loop did not respond
+    - *stacks* The stacks sampled from the loop thread meanwhile,
+    with the number of times each was sampled
+    """
+
+    started_on: datetime
+    seconds: float = 0.0
+    stacks: Counter = field(default_factory=Counter)
+
+    def as_dict(self):
+        return {
+            "started_on": self.started_on.isoformat(),
+            "seconds": self.seconds,
+            "samples": [
+                {"count": count, "stack": list(stack)}
+                for stack, count in self.stacks.most_common()
+            ],
+        }
+
+
+class LoopWatchdog:
+    """
+    Detects the calls that block the event loop.
+
+    A heartbeat coroutine wakes up every heartbeat_interval seconds and
+    records how late it was woken, i.e. the loop lag. A background thread
+    checks the heartbeat and, once it is late by stall_threshold seconds
+    or more, samples the stack of the loop thread every sample_interval
+    seconds until the loop runs again. The stacks most sampled are those
+    of the blocking code.
+
+    Every stall is passed to on_stall and appended as a line of JSON
+    to report_path, if provided.
+    """
+
+    def __init__(
+        self,
+        stall_threshold: float = DEFAULT_STALL_THRESHOLD,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        report_path: Optional[str] = None,
+        on_stall: Optional[Callable[[Stall], None]] = None,
+        max_stack_depth: int = DEFAULT_MAX_STACK_DEPTH,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.stall_threshold = stall_threshold
+        self.heartbeat_interval = heartbeat_interval
+        self.sample_interval = sample_interval
+        self.report_path = report_path
+        self.on_stall = on_stall
+        self.max_stack_depth = max_stack_depth
+        self.clock = clock
+        self.lag = LatencyHistogram()
+        self.stalls: list[Stall] = []
+        self._last_beat = None
+        self._loop_thread_id = None
+        self._heartbeat_task = None
+        self._thread = None
+        self._stopping = threading.Event()
+
+    @property
+    def is_running(self):
+        return self._thread is not None
+
+    def start(self, loop: asyncio.AbstractEventLoop = None):
+        """
+        Starts watching the specified loop, the current one by default.
+        Must be called from the thread running the loop.
+        """
+        if self.is_running:
+            return
+        loop = loop or asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = self.clock()
+        self._stopping.clear()
+        self._heartbeat_task = loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self):
+        """
+        Stops the background thread, then cancels the heartbeat
+        and waits for it to finish.
+        Must be awaited on the loop being watched.
+        """
+        if not self.is_running:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        heartbeat_task, self._heartbeat_task = self._heartbeat_task, None
+        heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await heartbeat_task
+
+    async def _heartbeat(self):
+        while True:
+            expected_on = self.clock() + self.heartbeat_interval
+            await asyncio.sleep(self.heartbeat_interval)
+            now = self.clock()
+            self.lag.record(max(0.0, now - expected_on))
+            self._last_beat = now
+
+    def _watch(self):
+        stall = None
+        blocked_since = None
+        while not self._stopping.wait(self.sample_interval):
+            last_beat = self._last_beat
+            due_on = last_beat + self.heartbeat_interval
+            if self.clock() - due_on >= self.stall_threshold:
+                if stall is None:
+                    stall = Stall(
+                        started_on=datetime.now(timezone.utc)
+                        - timedelta(seconds=self.clock() - due_on)
+                    )
+                    blocked_since = due_on
+                stack = self._sample_loop_thread()
+                if stack:
+                    stall.stacks[stack] += 1
+            elif stall is not None:
+                stall.seconds = last_beat - blocked_since
+                self._report(stall)
+                stall = None
+
+    def _sample_loop_thread(self):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        return tuple(
+            f"{summary.filename}:{summary.lineno} in {summary.name}"
+            for summary in traceback.extract_stack(frame, limit=self.max_stack_depth)
+        )
+
+    def _report(self, stall: Stall):
+        self.stalls.append(stall)
+        if self.report_path:
+            with open(self.report_path, "a", encoding="utf-8") as report_file:
+                report_file.write(json.dumps(stall.as_dict()))
+                report_file.write("\n")
+        if self.on_stall is not None:
+            self.on_stall(stall)
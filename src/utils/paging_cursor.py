@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+
+CURSOR_TIEBREAKER_COLUMN = "id"
+
+
+def sort_column_names(sort_by: str):
+    """
+    Returns the column names referenced by the specified sort_by string,
+    in order, with the tiebreaker column appended if it is not present.
+
+    - *sort_by* The sort string, e.g. "created_on DESC, name"
+    """
+    column_names = []
+    if sort_by:
+        for column_sort in sort_by.split(","):
+            column, *_ = column_sort.strip().split()
+            column_names.append(column)
+    if CURSOR_TIEBREAKER_COLUMN not in column_names:
+        column_names.append(CURSOR_TIEBREAKER_COLUMN)
+    return column_names
+
+
+def encode_cursor(record, sort_by: str):
+    """
+    Builds an opaque cursor pointing just after the specified record.
+
+    - *record* The last record of the current page. Any object exposing
+    the sort columns as attributes, i.e. a model or a display schema.
+    - *sort_by* The sort string used to fetch the current page
+    """
+    values = {column: getattr(record, column) for column in sort_column_names(sort_by)}
+    payload = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str):
+    """
+    Returns the dict of column name to raw value held by the specified cursor.
+    Values are returned as they were serialised, i.e. not yet converted
+    back to the column types.
+
+    - *cursor* A cursor created by encode_cursor
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor.")
+
+    return values
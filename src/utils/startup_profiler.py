@@ -0,0 +1,56 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+
+class StartupProfiler:
+    """
+    Records how long each startup phase takes and how many modules it
+    imported, and the time from start to the first paint of the window.
+
+    When disabled, phases and marks are not recorded,
+    so the profiler can be left in place.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.enabled = enabled
+        self.clock = clock
+        self.started_on = clock()
+        # (name, seconds, modules imported)
+        self.phases: list[tuple] = []
+        # (name, seconds since start)
+        self.marks: list[tuple] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        started_on = self.clock()
+        module_count = len(sys.modules)
+        try:
+            yield
+        finally:
+            self.phases.append(
+                (name, self.clock() - started_on, len(sys.modules) - module_count)
+            )
+
+    def mark(self, name: str):
+        if self.enabled:
+            self.marks.append((name, self.clock() - self.started_on))
+
+    def report(self):
+        lines = ["Startup profile:"]
+        for name, seconds, module_count in self.phases:
+            lines.append(
+                f"  {name:<40} {seconds * 1000:>9.1f}ms {module_count:>6} modules"
+            )
+        for name, seconds in self.marks:
+            lines.append(f"  {name:<40} {seconds * 1000:>9.1f}ms since start")
+        return "\n".join(lines)
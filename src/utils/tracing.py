@@ -0,0 +1,237 @@
+"""
+In-process tracing of user actions across the layers of the application.
+
+A span times one step, e.g. a Qt slot, an app ops call, the acquisition
+of a database connection, an SQL statement or a commit. Spans started
+while another span is current become its children and share its trace id,
+which is propagated with contextvars, so it follows the action across
+awaits and into the greenlet running the SQL of the async engine.
+
+Print the traces written by FileSpanExporter with:
+
+python -m src.utils.tracing traces.jsonl
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from src.configuration import Configuration
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """
+    - *name* The step timed, e.g. "ui.tables.save" or "db.commit"
+    - *trace_id* Shared by all the spans of one user action
+    - *parent_id* The span_id of the enclosing span, None for the root span
+    - *started_on* When the span started, as a UTC datetime
+    - *seconds* How long the span took, set once it ends
+    - *error* The type of the exception that ended the span, if any
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    started_on: datetime
+    attributes: dict = field(default_factory=dict)
+    seconds: float = 0.0
+    error: Optional[str] = None
+    _started_at: float = field(default=0.0, repr=False)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "started_on": self.started_on.isoformat(),
+            "seconds": self.seconds,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class FileSpanExporter:
+    """
+    Appends spans to a file as lines of JSON. Spans are buffered and
+    written once the root span of their trace ends, so that tracing does
+    not write to the file in the middle of a user action.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._buffer: list[Span] = []
+
+    def export(self, span: Span):
+        self._buffer.append(span)
+        if span.parent_id is None:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as spans_file:
+            for span in self._buffer:
+                spans_file.write(json.dumps(span.as_dict(), default=str))
+                spans_file.write("\n")
+        self._buffer.clear()
+
+
+class Tracer:
+    """
+    Creates spans and passes them to the exporter once they end.
+    Without an exporter, tracing is disabled and spans cost next to nothing.
+    """
+
+    def __init__(
+        self,
+        exporter=None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.exporter = exporter
+        self.clock = clock
+
+    @property
+    def enabled(self):
+        return self.exporter is not None
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _current_span.get()
+
+    def start_span(self, name: str, **attributes) -> Optional[Span]:
+        """
+        Starts a child of the current span, or a new trace if there is none,
+        without making it the current span. Returns None if disabled.
+        """
+        if not self.enabled:
+            return None
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(8).hex(),
+            span_id=os.urandom(4).hex(),
+            parent_id=parent.span_id if parent else None,
+            started_on=datetime.now(timezone.utc),
+            attributes=attributes,
+            _started_at=self.clock(),
+        )
+
+    def end_span(self, span: Optional[Span], error: Exception = None):
+        if span is None:
+            return
+        span.seconds = self.clock() - span._started_at
+        if error is not None:
+            span.error = type(error).__name__
+        self.exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """
+        Times the enclosed block as a span, which is the current span
+        within the block. Yields None if disabled.
+        """
+        span = self.start_span(name, **attributes)
+        if span is None:
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            _current_span.reset(token)
+
+    def traced(self, name: str):
+        """
+        Decorates a coroutine function so that every call is a span.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            async def traced_func(*args, **kwargs):
+                if not self.enabled:
+                    return await func(*args, **kwargs)
+                with self.span(name):
+                    return await func(*args, **kwargs)
+
+            return traced_func
+
+        return decorator
+
+
+def _build_default_exporter():
+    if not Configuration.TRACING__ENABLED:
+        return None
+    return FileSpanExporter(Configuration.TRACING__PATH)
+
+
+# Shared by the layers of the application.
+# Enabled with tracing.enabled in the configuration.
+default_tracer = Tracer(exporter=_build_default_exporter())
+
+
+def load_spans(path: str):
+    with open(path, encoding="utf-8") as spans_file:
+        return [json.loads(line) for line in spans_file if line.strip()]
+
+
+def format_traces(spans: list[dict]):
+    """
+    Returns the specified spans as one indented tree per trace,
+    with the duration of every span, in the order the traces started.
+    """
+    children = {}
+    roots = []
+    for span in sorted(spans, key=lambda span: span["started_on"]):
+        if span["parent_id"] is None:
+            roots.append(span)
+        else:
+            children.setdefault(span["parent_id"], []).append(span)
+
+    lines = []
+
+    def add_lines(span, depth):
+        error = f" !{span['error']}" if span["error"] else ""
+        attributes = " ".join(
+            f"{key}={value}" for key, value in span["attributes"].items()
+        )
+        lines.append(
+            f"{span['seconds'] * 1000:>9.2f}ms {'  ' * depth}{span['name']}"
+            f"{error}{' ' + attributes if attributes else ''}"
+        )
+        for child in children.get(span["span_id"], []):
+            add_lines(child, depth + 1)
+
+    for root in roots:
+        lines.append(f"trace {root['trace_id']} at {root['started_on']}")
+        add_lines(root, 0)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print(__doc__.strip())
+        return 2
+    print(format_traces(load_spans(argv[0])))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
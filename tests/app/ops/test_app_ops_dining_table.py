@@ -1,22 +1,32 @@
 import uuid
 from datetime import datetime
+from functools import partial
 from unittest.mock import AsyncMock
 
 import pytest
 
 from src.app.ops import app_ops_dining_table
 from src.app.ops.exceptions.app_ops_exceptions import (
+    ConcurrentUpdateError,
     CreateDiningTableError,
     DeleteDiningTableError,
     GetDiningTableListError,
+    UpdateDiningTablesError,
     UpdateNameError,
     UpdatePositionError,
     UpdateSizeError,
 )
+from src.persistence.database.ops import db_batch_ops_dining_table
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_dining_table
+from src.utils.tracing import FileSpanExporter, default_tracer, load_spans
+from tests.persistence.database.ops.mock_utils import (
+    async_testing_session_scope,
+    reset_test_database,
+    setup_test_database,
+)
 
 
 def test_validate_dining_table_name():
@@ -140,6 +150,32 @@ async def test_update_position():
     mock_update_position_func.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_update_position_traced(monkeypatch, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(default_tracer, "exporter", FileSpanExporter(str(path)))
+    request = schema_dining_table.SchemaUpdatePosition(x=5, y=10)
+    with default_tracer.span("ui.tables.save"):
+        await app_ops_dining_table.update_position(
+            uuid.uuid4(), request, update_position_func=AsyncMock(return_value=1)
+        )
+
+    spans = {span["name"]: span for span in load_spans(str(path))}
+    assert list(spans) == [
+        "app_ops_utils.affect_existing_row",
+        "app_ops_dining_table.update_position",
+        "ui.tables.save",
+    ]
+    assert (
+        spans["app_ops_utils.affect_existing_row"]["parent_id"]
+        == spans["app_ops_dining_table.update_position"]["span_id"]
+    )
+    assert (
+        spans["app_ops_dining_table.update_position"]["parent_id"]
+        == spans["ui.tables.save"]["span_id"]
+    )
+
+
 @pytest.mark.asyncio
 async def test_update_position_persistence_error():
     request = schema_dining_table.SchemaUpdatePosition(x=5, y=10)
@@ -359,3 +395,406 @@ async def test_get_dining_table_list_persistence_error():
             select_dining_table_list_func=mock_select_dining_table_list_func,
         )
     mock_select_dining_table_list_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_dining_tables():
+    requests = [
+        schema_dining_table.SchemaDiningTableCreate(
+            name=name, x=2, y=3, width=50, height=60
+        )
+        for name in ["table1", "    ", "table3"]
+    ]
+
+    async def insert_dining_tables(valid_requests):
+        return [
+            schema_dining_table.SchemaDiningTableDisplay(
+                id=uuid.uuid4(),
+                created_on=datetime.now(),
+                last_updated_on=datetime.now(),
+                **request.model_dump(),
+            )
+            for request in valid_requests
+        ]
+
+    mock_insert_dining_tables_func = AsyncMock(side_effect=insert_dining_tables)
+    results = await app_ops_dining_table.create_dining_tables(
+        requests, insert_dining_tables_func=mock_insert_dining_tables_func
+    )
+    mock_insert_dining_tables_func.assert_awaited_once_with([requests[0], requests[2]])
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert results[0].dining_table.name == "table1"
+    assert results[0].dining_table_id == results[0].dining_table.id
+    assert results[1].error == "Invalid dining table name format."
+    assert results[1].dining_table is None
+    assert results[2].dining_table.name == "table3"
+
+
+@pytest.mark.asyncio
+async def test_create_dining_tables_all_invalid():
+    mock_insert_dining_tables_func = AsyncMock()
+    results = await app_ops_dining_table.create_dining_tables(
+        [
+            schema_dining_table.SchemaDiningTableCreate(
+                name="   ", x=2, y=3, width=50, height=60
+            )
+        ],
+        insert_dining_tables_func=mock_insert_dining_tables_func,
+    )
+    mock_insert_dining_tables_func.assert_not_called()
+    assert not results[0].succeeded
+
+
+@pytest.mark.asyncio
+async def test_create_dining_tables_persistence_error():
+    mock_insert_dining_tables_func = AsyncMock()
+    mock_insert_dining_tables_func.side_effect = PersistenceOpsBaseError()
+    with pytest.raises(CreateDiningTableError):
+        await app_ops_dining_table.create_dining_tables(
+            [
+                schema_dining_table.SchemaDiningTableCreate(
+                    name="table1", x=2, y=3, width=50, height=60
+                )
+            ],
+            insert_dining_tables_func=mock_insert_dining_tables_func,
+        )
+    mock_insert_dining_tables_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_positions():
+    dining_table_ids = [uuid.uuid4(), uuid.uuid4()]
+    requests = {
+        dining_table_id: schema_dining_table.SchemaUpdatePosition(x=2, y=3)
+        for dining_table_id in dining_table_ids
+    }
+    mock_update_positions_func = AsyncMock(return_value=[dining_table_ids[1]])
+    results = await app_ops_dining_table.update_positions(
+        requests, update_positions_func=mock_update_positions_func
+    )
+    mock_update_positions_func.assert_awaited_once_with(requests)
+    assert [result.dining_table_id for result in results] == dining_table_ids
+    assert results[0].error == "No rows were affected."
+    assert results[1].succeeded
+
+
+@pytest.mark.asyncio
+async def test_update_positions_persistence_error():
+    mock_update_positions_func = AsyncMock()
+    mock_update_positions_func.side_effect = PersistenceOpsBaseError()
+    with pytest.raises(UpdatePositionError):
+        await app_ops_dining_table.update_positions(
+            {uuid.uuid4(): schema_dining_table.SchemaUpdatePosition(x=2, y=3)},
+            update_positions_func=mock_update_positions_func,
+        )
+    mock_update_positions_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_dining_tables():
+    dining_table_ids = [uuid.uuid4(), uuid.uuid4()]
+    mock_delete_dining_tables_func = AsyncMock(return_value=dining_table_ids)
+    results = await app_ops_dining_table.delete_dining_tables(
+        [str(dining_table_id) for dining_table_id in dining_table_ids],
+        delete_dining_tables_func=mock_delete_dining_tables_func,
+    )
+    mock_delete_dining_tables_func.assert_awaited_once()
+    assert all(result.succeeded for result in results)
+    assert [result.dining_table_id for result in results] == dining_table_ids
+
+
+@pytest.mark.asyncio
+async def test_delete_dining_tables_none():
+    mock_delete_dining_tables_func = AsyncMock()
+    results = await app_ops_dining_table.delete_dining_tables(
+        [], delete_dining_tables_func=mock_delete_dining_tables_func
+    )
+    mock_delete_dining_tables_func.assert_not_called()
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_delete_dining_tables_persistence_error():
+    mock_delete_dining_tables_func = AsyncMock()
+    mock_delete_dining_tables_func.side_effect = PersistenceOpsBaseError()
+    with pytest.raises(DeleteDiningTableError):
+        await app_ops_dining_table.delete_dining_tables(
+            [uuid.uuid4()], delete_dining_tables_func=mock_delete_dining_tables_func
+        )
+    mock_delete_dining_tables_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables():
+    dining_table_ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+    requests = {
+        dining_table_ids[0]: schema_dining_table.SchemaUpdateDiningTable(x=2, y=3),
+        dining_table_ids[1]: schema_dining_table.SchemaUpdateDiningTable(name="   "),
+        dining_table_ids[2]: schema_dining_table.SchemaUpdateDiningTable(name="t3"),
+    }
+    mock_update_dining_tables_func = AsyncMock(return_value=[dining_table_ids[0]])
+    results = await app_ops_dining_table.update_dining_tables(
+        requests, update_dining_tables_func=mock_update_dining_tables_func
+    )
+    mock_update_dining_tables_func.assert_awaited_once_with(
+        {
+            dining_table_ids[0]: requests[dining_table_ids[0]],
+            dining_table_ids[2]: requests[dining_table_ids[2]],
+        }
+    )
+    assert [result.dining_table_id for result in results] == dining_table_ids
+    assert results[0].succeeded
+    assert results[1].error == "Invalid dining table name format."
+    assert results[2].error == "No rows were affected."
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables_returns_updated_dining_tables():
+    updated_dining_table = schema_dining_table.SchemaDiningTableDisplay(
+        id=uuid.uuid4(),
+        name="table1",
+        x=2,
+        y=3,
+        width=50,
+        height=60,
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+    mock_update_dining_tables_func = AsyncMock(return_value=[updated_dining_table])
+    results = await app_ops_dining_table.update_dining_tables(
+        {
+            updated_dining_table.id: schema_dining_table.SchemaUpdateDiningTable(
+                x=2, y=3
+            )
+        },
+        update_dining_tables_func=mock_update_dining_tables_func,
+    )
+    assert results[0].succeeded
+    assert results[0].dining_table == updated_dining_table
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables_persistence_error():
+    mock_update_dining_tables_func = AsyncMock()
+    mock_update_dining_tables_func.side_effect = PersistenceOpsBaseError()
+    with pytest.raises(UpdateDiningTablesError):
+        await app_ops_dining_table.update_dining_tables(
+            {uuid.uuid4(): schema_dining_table.SchemaUpdateDiningTable(x=2)},
+            update_dining_tables_func=mock_update_dining_tables_func,
+        )
+    mock_update_dining_tables_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables_expected_last_updated_on():
+    dining_table_ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+    read_version = datetime.now()
+    requests = {
+        dining_table_ids[0]: schema_dining_table.SchemaUpdateDiningTable(x=2),
+        dining_table_ids[1]: schema_dining_table.SchemaUpdateDiningTable(name="   "),
+        dining_table_ids[2]: schema_dining_table.SchemaUpdateDiningTable(x=3),
+    }
+    mock_update_dining_tables_func = AsyncMock(return_value=[dining_table_ids[2]])
+    results = await app_ops_dining_table.update_dining_tables(
+        requests,
+        expected_last_updated_on={
+            dining_table_id: read_version for dining_table_id in dining_table_ids[:2]
+        },
+        update_dining_tables_func=mock_update_dining_tables_func,
+    )
+    mock_update_dining_tables_func.assert_awaited_once_with(
+        {
+            dining_table_ids[0]: requests[dining_table_ids[0]],
+            dining_table_ids[2]: requests[dining_table_ids[2]],
+        },
+        expected_last_updated_on={dining_table_ids[0]: read_version},
+    )
+    assert results[0].error == app_ops_dining_table.CHANGED_SINCE_READ
+    assert results[1].error == "Invalid dining table name format."
+    assert results[2].succeeded
+
+
+@pytest.mark.asyncio
+async def test_dining_table_edit_session():
+    dining_table_id = uuid.uuid4()
+    mock_update_dining_tables_func = AsyncMock(return_value=[dining_table_id])
+    edit_session = app_ops_dining_table.DiningTableEditSession(
+        update_dining_tables_func=mock_update_dining_tables_func
+    )
+    edit_session.track_dining_table(dining_table_id, "table1", 0, 0, 50, 50)
+
+    edit_session.update_position(
+        dining_table_id, schema_dining_table.SchemaUpdatePosition(x=1, y=2)
+    )
+    edit_session.update_size(
+        dining_table_id, schema_dining_table.SchemaUpdateSize(width=50, height=70)
+    )
+    edit_session.update_name(
+        dining_table_id, schema_dining_table.SchemaUpdateName(name="table2")
+    )
+    results = await edit_session.commit()
+
+    mock_update_dining_tables_func.assert_awaited_once_with(
+        {
+            dining_table_id: schema_dining_table.SchemaUpdateDiningTable(
+                name="table2", x=1, y=2, height=70
+            )
+        }
+    )
+    assert len(results) == 1
+    assert results[0].succeeded
+    assert not edit_session.has_changes
+
+
+@pytest.mark.asyncio
+async def test_dining_table_edit_session_revert():
+    dining_table_id = uuid.uuid4()
+    mock_update_dining_tables_func = AsyncMock()
+    edit_session = app_ops_dining_table.DiningTableEditSession(
+        update_dining_tables_func=mock_update_dining_tables_func
+    )
+    edit_session.track_dining_table(dining_table_id, "table1", 0, 0, 50, 50)
+    edit_session.update_position(
+        dining_table_id, schema_dining_table.SchemaUpdatePosition(x=1, y=2)
+    )
+
+    assert edit_session.revert() == {dining_table_id: {"x": 0, "y": 0}}
+    assert await edit_session.commit() == []
+    mock_update_dining_tables_func.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_dining_table_edit_session_invalid_name():
+    dining_table_id = uuid.uuid4()
+    edit_session = app_ops_dining_table.DiningTableEditSession(
+        update_dining_tables_func=AsyncMock()
+    )
+    edit_session.track_dining_table(dining_table_id, "table1", 0, 0, 50, 50)
+
+    with pytest.raises(UpdateNameError, match="Invalid dining table name format."):
+        edit_session.update_name(
+            dining_table_id, schema_dining_table.SchemaUpdateName(name="   ")
+        )
+    assert not edit_session.has_changes
+
+
+@pytest.mark.asyncio
+async def test_dining_table_edit_session_no_rows_affected():
+    dining_table_id = uuid.uuid4()
+    edit_session = app_ops_dining_table.DiningTableEditSession(
+        update_dining_tables_func=AsyncMock(return_value=[])
+    )
+    edit_session.track_dining_table(dining_table_id, "table1", 0, 0, 50, 50)
+    edit_session.update_position(
+        dining_table_id, schema_dining_table.SchemaUpdatePosition(x=1, y=2)
+    )
+
+    with pytest.raises(UpdateDiningTablesError, match="No rows were affected."):
+        await edit_session.commit()
+    # The dining table no longer exists, so it is no longer tracked.
+    assert not edit_session.has_changes
+    with pytest.raises(KeyError):
+        edit_session.update_position(
+            dining_table_id, schema_dining_table.SchemaUpdatePosition(x=1, y=2)
+        )
+
+
+@pytest.mark.asyncio
+async def test_dining_table_edit_session_persistence_error():
+    dining_table_id = uuid.uuid4()
+    mock_update_dining_tables_func = AsyncMock()
+    mock_update_dining_tables_func.side_effect = PersistenceOpsBaseError()
+    edit_session = app_ops_dining_table.DiningTableEditSession(
+        update_dining_tables_func=mock_update_dining_tables_func
+    )
+    edit_session.track_dining_table(dining_table_id, "table1", 0, 0, 50, 50)
+    edit_session.update_position(
+        dining_table_id, schema_dining_table.SchemaUpdatePosition(x=1, y=2)
+    )
+
+    with pytest.raises(UpdateDiningTablesError):
+        await edit_session.commit()
+    assert edit_session.diff() == {dining_table_id: {"x": 1, "y": 2}}
+
+
+@pytest.mark.asyncio
+async def test_dining_table_edit_session_concurrent_update():
+    dining_table_id = uuid.uuid4()
+    read_version = datetime.now()
+    mock_update_dining_tables_func = AsyncMock(return_value=[])
+    edit_session = app_ops_dining_table.DiningTableEditSession(
+        update_dining_tables_func=mock_update_dining_tables_func
+    )
+    edit_session.track_dining_table(
+        dining_table_id, "table1", 0, 0, 50, 50, last_updated_on=read_version
+    )
+    edit_session.update_position(
+        dining_table_id, schema_dining_table.SchemaUpdatePosition(x=1, y=2)
+    )
+
+    with pytest.raises(ConcurrentUpdateError, match="changed or deleted"):
+        await edit_session.commit()
+    assert mock_update_dining_tables_func.await_args.kwargs[
+        "expected_last_updated_on"
+    ] == {dining_table_id: read_version}
+    # Dropped, so that the current version can be loaded and tracked again.
+    assert not edit_session.has_changes
+
+
+@pytest.mark.asyncio
+async def test_dining_table_edit_sessions_editing_the_same_table():
+    update_dining_tables_func = partial(
+        db_batch_ops_dining_table.update_dining_tables,
+        async_session_scope_func=async_testing_session_scope,
+    )
+
+    await setup_test_database()
+    try:
+        dining_table = await db_batch_ops_dining_table.insert_dining_table(
+            schema_dining_table.SchemaDiningTableCreate(
+                name="table1", x=0, y=0, width=50, height=50
+            ),
+            async_session_scope_func=async_testing_session_scope,
+        )
+        edit_sessions = [
+            app_ops_dining_table.DiningTableEditSession(
+                update_dining_tables_func=update_dining_tables_func
+            )
+            for _ in range(2)
+        ]
+        for edit_session in edit_sessions:
+            edit_session.track_dining_table(
+                dining_table.id,
+                dining_table.name,
+                dining_table.x,
+                dining_table.y,
+                dining_table.width,
+                dining_table.height,
+                last_updated_on=dining_table.last_updated_on,
+            )
+
+        edit_sessions[0].update_position(
+            dining_table.id, schema_dining_table.SchemaUpdatePosition(x=10, y=20)
+        )
+        edit_sessions[1].update_name(
+            dining_table.id, schema_dining_table.SchemaUpdateName(name="table2")
+        )
+        await edit_sessions[0].commit()
+        with pytest.raises(ConcurrentUpdateError):
+            await edit_sessions[1].commit()
+
+        # The first session tracks the version it wrote, so it can commit again.
+        edit_sessions[0].update_size(
+            dining_table.id, schema_dining_table.SchemaUpdateSize(width=60, height=70)
+        )
+        await edit_sessions[0].commit()
+
+        dining_tables = await db_batch_ops_dining_table.select_dining_table_list(
+            0, 10, None, async_session_scope_func=async_testing_session_scope
+        )
+        assert [
+            (table.name, table.x, table.y, table.width, table.height)
+            for table in dining_tables
+        ] == [("table1", 10, 20, 60, 70)]
+    finally:
+        await reset_test_database()
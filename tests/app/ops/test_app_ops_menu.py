@@ -1,21 +1,28 @@
 import uuid
 from datetime import datetime
+from functools import partial
 from unittest.mock import AsyncMock
 
 import pytest
 
 from src.app.ops import app_ops_menu
 from src.app.ops.exceptions.app_ops_exceptions import (
+    ConcurrentUpdateError,
     CreateMenuError,
     DeleteMenuError,
     GetMenuByIdError,
     GetMenuListError,
     UpdateNameError,
+    UpsertMenusError,
 )
+from src.app.ops.utils.list_cache import ListCache
+from src.persistence.database.ops import db_batch_ops_menu
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
 from src.schemas import schema_menu
+from src.utils.tracing import FileSpanExporter, default_tracer, load_spans
+from tests.persistence.database.ops.mock_utils import mock_async_session_scope_factory
 
 
 def test_validate_menu_name():
@@ -121,6 +128,22 @@ async def test_update_name():
     mock_update_name_func.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_update_name_returns_updated_menu():
+    request = schema_menu.SchemaUpdateName(name="NewMenuName")
+    updated_menu = schema_menu.SchemaMenuDisplay(
+        id=uuid.uuid4(),
+        name=request.name,
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+    mock_update_name_func = AsyncMock(return_value=[updated_menu])
+    menu = await app_ops_menu.update_name(
+        updated_menu.id, request, update_name_func=mock_update_name_func
+    )
+    assert menu == updated_menu
+
+
 @pytest.mark.asyncio
 async def test_update_name_invalid_name_format():
     request = schema_menu.SchemaUpdateName(name="     ")
@@ -155,6 +178,24 @@ async def test_update_name_no_rows_affected():
     mock_update_name_func.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_update_name_concurrent_update():
+    request = schema_menu.SchemaUpdateName(name="NewMenuName")
+    mock_update_name_func = AsyncMock(return_value=0)
+    last_updated_on = datetime.now()
+    with pytest.raises(ConcurrentUpdateError):
+        await app_ops_menu.update_name(
+            uuid.uuid4(),
+            request,
+            expected_last_updated_on=last_updated_on,
+            update_name_func=mock_update_name_func,
+        )
+    assert (
+        mock_update_name_func.await_args.kwargs["expected_last_updated_on"]
+        == last_updated_on
+    )
+
+
 @pytest.mark.asyncio
 async def test_update_name_multiple_rows_affected():
     request = schema_menu.SchemaUpdateName(name="NewMenuName")
@@ -200,6 +241,117 @@ async def test_get_menu_list():
     assert all(isinstance(item, schema_menu.SchemaMenuDisplay) for item in results)
 
 
+@pytest.mark.asyncio
+async def test_get_menu_list_cached():
+    mock_select_menu_list_func = AsyncMock(return_value=[])
+
+    for _ in range(2):
+        await app_ops_menu.get_menu_list(
+            0,
+            10,
+            "created_on DESC, name",
+            select_menu_list_func=mock_select_menu_list_func,
+        )
+    mock_select_menu_list_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_menu_list_invalidated_by_create_menu():
+    mock_select_menu_list_func = AsyncMock(return_value=[])
+    mock_insert_menu_func = AsyncMock(
+        return_value=schema_menu.SchemaMenuDisplay(
+            id=uuid.uuid4(),
+            name="menu1",
+            created_on=datetime.now(),
+            last_updated_on=datetime.now(),
+        )
+    )
+
+    await app_ops_menu.get_menu_list(
+        0, 10, "name", select_menu_list_func=mock_select_menu_list_func
+    )
+    await app_ops_menu.create_menu(
+        schema_menu.SchemaMenuCreate(name="menu1"),
+        insert_menu_func=mock_insert_menu_func,
+    )
+    await app_ops_menu.get_menu_list(
+        0, 10, "name", select_menu_list_func=mock_select_menu_list_func
+    )
+    assert mock_select_menu_list_func.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_menu_list_separate_list_caches():
+    mock_select_menu_list_func = AsyncMock(return_value=[])
+    list_caches = [ListCache(), ListCache()]
+
+    for list_cache in list_caches * 2:
+        await app_ops_menu.get_menu_list(
+            0,
+            10,
+            "name",
+            select_menu_list_func=mock_select_menu_list_func,
+            list_cache=list_cache,
+        )
+    assert mock_select_menu_list_func.await_count == 2
+    assert all(list_cache.stats()["hits"] == 1 for list_cache in list_caches)
+
+
+@pytest.mark.asyncio
+async def test_update_name_invalidates_injected_list_cache():
+    mock_update_name_func = AsyncMock(
+        return_value=[
+            schema_menu.SchemaMenuDisplay(
+                id=uuid.uuid4(),
+                name="menu1",
+                created_on=datetime.now(),
+                last_updated_on=datetime.now(),
+            )
+        ]
+    )
+    list_cache = ListCache()
+    await list_cache.get_or_load(
+        app_ops_menu.LIST_CACHE_ENTITY, ("key",), AsyncMock(return_value=[])
+    )
+
+    await app_ops_menu.update_name(
+        uuid.uuid4(),
+        schema_menu.SchemaUpdateName(name="menu1"),
+        update_name_func=mock_update_name_func,
+        list_cache=list_cache,
+    )
+    assert list_cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_menu_list_traced(monkeypatch, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(default_tracer, "exporter", FileSpanExporter(str(path)))
+    mock_async_session_scope, _ = mock_async_session_scope_factory()
+    with default_tracer.span("ui.menus.load"):
+        await app_ops_menu.get_menu_list(
+            0,
+            10,
+            "name",
+            select_menu_list_func=partial(
+                db_batch_ops_menu.select_menu_list,
+                async_session_scope_func=mock_async_session_scope,
+                select_menu_list_func=AsyncMock(return_value=[]),
+            ),
+            list_cache=ListCache(),
+        )
+
+    spans = {span["name"]: span for span in load_spans(str(path))}
+    assert list(spans) == [
+        "db_batch_ops_menu.select_menu_list",
+        "app_ops_utils.get_data_list",
+        "app_ops_menu.get_menu_list",
+        "ui.menus.load",
+    ]
+    for child, parent in zip(list(spans), list(spans)[1:]):
+        assert spans[child]["parent_id"] == spans[parent]["span_id"]
+
+
 @pytest.mark.asyncio
 async def test_get_menu_list_invalid_page_index():
 
@@ -285,3 +437,48 @@ async def test_get_menu_by_id_persistence_error():
             uuid.uuid4(), select_menu_by_id_func=mock_select_menu_by_id_func
         )
     mock_select_menu_by_id_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus():
+    requests = [
+        schema_menu.SchemaMenuUpsert(id=uuid.uuid4(), name="menu1"),
+        schema_menu.SchemaMenuUpsert(id=uuid.uuid4(), name="menu2"),
+    ]
+    upserted_menu = schema_menu.SchemaMenuDisplay(
+        id=requests[0].id,
+        name=requests[0].name,
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+    mock_upsert_menus_func = AsyncMock(return_value=[upserted_menu])
+    upserted_menus = await app_ops_menu.upsert_menus(
+        requests, upsert_menus_func=mock_upsert_menus_func
+    )
+    assert upserted_menus == [upserted_menu]
+    mock_upsert_menus_func.assert_awaited_once_with(requests)
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus_invalid_name_format():
+    requests = [
+        schema_menu.SchemaMenuUpsert(id=uuid.uuid4(), name="menu1"),
+        schema_menu.SchemaMenuUpsert(id=uuid.uuid4(), name="     "),
+    ]
+    mock_upsert_menus_func = AsyncMock(return_value=[])
+    with pytest.raises(UpsertMenusError, match="Invalid menu name format."):
+        await app_ops_menu.upsert_menus(
+            requests, upsert_menus_func=mock_upsert_menus_func
+        )
+    mock_upsert_menus_func.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus_persistence_error():
+    mock_upsert_menus_func = AsyncMock(side_effect=PersistenceOpsBaseError())
+    with pytest.raises(UpsertMenusError):
+        await app_ops_menu.upsert_menus(
+            [schema_menu.SchemaMenuUpsert(id=uuid.uuid4(), name="menu1")],
+            upsert_menus_func=mock_upsert_menus_func,
+        )
+    mock_upsert_menus_func.assert_awaited_once()
@@ -9,7 +9,8 @@ from src.app.ops.exceptions.app_ops_exceptions import (CreateTagError,
                                                        DeleteTagError,
                                                        GetTagByIdError,
                                                        GetTagListError,
-                                                       UpdateNameError)
+                                                       UpdateNameError,
+                                                       UpsertTagsError)
 from src.persistence.interface.ops.exceptions.ops_exceptions import \
     PersistenceOpsBaseError
 from src.schemas import schema_tag
@@ -276,3 +277,46 @@ async def test_get_tag_by_id_persistence_error():
             uuid.uuid4(), select_tag_by_id_func=mock_select_tag_by_id_func
         )
     mock_select_tag_by_id_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_tags():
+    requests = [
+        schema_tag.SchemaTagUpsert(id=uuid.uuid4(), name="tag1"),
+        schema_tag.SchemaTagUpsert(id=uuid.uuid4(), name="tag2"),
+    ]
+    upserted_tag = schema_tag.SchemaTagDisplay(
+        id=requests[0].id,
+        name=requests[0].name,
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+    mock_upsert_tags_func = AsyncMock(return_value=[upserted_tag])
+    upserted_tags = await app_ops_tag.upsert_tags(
+        requests, upsert_tags_func=mock_upsert_tags_func
+    )
+    assert upserted_tags == [upserted_tag]
+    mock_upsert_tags_func.assert_awaited_once_with(requests)
+
+
+@pytest.mark.asyncio
+async def test_upsert_tags_invalid_name_format():
+    requests = [
+        schema_tag.SchemaTagUpsert(id=uuid.uuid4(), name="tag1"),
+        schema_tag.SchemaTagUpsert(id=uuid.uuid4(), name="     "),
+    ]
+    mock_upsert_tags_func = AsyncMock(return_value=[])
+    with pytest.raises(UpsertTagsError, match="Invalid tag name format."):
+        await app_ops_tag.upsert_tags(requests, upsert_tags_func=mock_upsert_tags_func)
+    mock_upsert_tags_func.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_tags_persistence_error():
+    mock_upsert_tags_func = AsyncMock(side_effect=PersistenceOpsBaseError())
+    with pytest.raises(UpsertTagsError):
+        await app_ops_tag.upsert_tags(
+            [schema_tag.SchemaTagUpsert(id=uuid.uuid4(), name="tag1")],
+            upsert_tags_func=mock_upsert_tags_func,
+        )
+    mock_upsert_tags_func.assert_awaited_once()
@@ -13,7 +13,9 @@ from src.app.ops.exceptions.app_ops_exceptions import (
     GetUserByUsernameError,
     GetUserListError,
     LoginError,
+    UpsertUsersError,
 )
+from src.app.ops.utils.credential_cache import CredentialCache
 from src.persistence.interface.ops.exceptions.ops_exceptions import (
     PersistenceOpsBaseError,
 )
@@ -463,3 +465,165 @@ async def test_login_persistence_error():
             select_user_by_username_and_password_func=mock_select_user_by_username_and_password_func,
         )
     mock_select_user_by_username_and_password_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_login_cached():
+    returned_user1 = schema_user.SchemaUserDisplay(
+        id=uuid.uuid4(),
+        username="testuser1",
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    mock_select_user_by_username_and_password_func = AsyncMock(
+        return_value=returned_user1
+    )
+
+    for _ in range(2):
+        user = await app_ops_user.login(
+            "testuser1",
+            "testuser1",
+            select_user_by_username_and_password_func=mock_select_user_by_username_and_password_func,
+            credential_cache=credential_cache,
+        )
+        assert user.id == returned_user1.id
+    mock_select_user_by_username_and_password_func.assert_awaited_once()
+
+    await app_ops_user.login(
+        "testuser1",
+        "wrongpassword",
+        select_user_by_username_and_password_func=mock_select_user_by_username_and_password_func,
+        credential_cache=credential_cache,
+    )
+    assert mock_select_user_by_username_and_password_func.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_login_incorrect_creds_not_cached():
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    mock_select_user_by_username_and_password_func = AsyncMock(return_value=None)
+
+    for _ in range(2):
+        await app_ops_user.login(
+            "testuser1",
+            "testuser1",
+            select_user_by_username_and_password_func=mock_select_user_by_username_and_password_func,
+            credential_cache=credential_cache,
+        )
+    assert mock_select_user_by_username_and_password_func.await_count == 2
+    assert len(credential_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_change_password_invalidates_cached_login():
+    user_id = uuid.uuid4()
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    credential_cache.put(
+        "testuser1",
+        "testuser1",
+        schema_user.SchemaUserDisplay(
+            id=user_id,
+            username="testuser1",
+            created_on=datetime.now(),
+            last_updated_on=datetime.now(),
+        ),
+    )
+
+    await app_ops_user.change_password(
+        user_id,
+        schema_user.SchemaChangePassword(new_password="newpassword"),
+        update_password_func=AsyncMock(return_value=1),
+        credential_cache=credential_cache,
+    )
+    assert credential_cache.get("testuser1", "testuser1") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_user_invalidates_cached_login():
+    user_id = uuid.uuid4()
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    credential_cache.put(
+        "testuser1",
+        "testuser1",
+        schema_user.SchemaUserDisplay(
+            id=user_id,
+            username="testuser1",
+            created_on=datetime.now(),
+            last_updated_on=datetime.now(),
+        ),
+    )
+
+    await app_ops_user.delete_user(
+        user_id,
+        delete_user_func=AsyncMock(return_value=1),
+        credential_cache=credential_cache,
+    )
+    assert credential_cache.get("testuser1", "testuser1") is None
+
+
+@pytest.mark.asyncio
+async def test_upsert_users():
+    requests = [
+        schema_user.SchemaUserCreate(username="testuser1", password="testpassword1"),
+        schema_user.SchemaUserCreate(username="testuser2", password="testpassword2"),
+    ]
+    upserted_users = [
+        schema_user.SchemaUserDisplay(
+            id=uuid.uuid4(),
+            username=request.username,
+            created_on=datetime.now(),
+            last_updated_on=datetime.now(),
+        )
+        for request in requests
+    ]
+    mock_upsert_users_func = AsyncMock(return_value=upserted_users)
+    users = await app_ops_user.upsert_users(
+        requests, upsert_users_func=mock_upsert_users_func
+    )
+    assert users == upserted_users
+    mock_upsert_users_func.assert_awaited_once_with(requests, update_passwords=False)
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_invalid_password_format():
+    requests = [
+        schema_user.SchemaUserCreate(username="testuser1", password="testpassword1"),
+        schema_user.SchemaUserCreate(username="testuser2", password="     "),
+    ]
+    mock_upsert_users_func = AsyncMock(return_value=[])
+    with pytest.raises(UpsertUsersError, match="testuser2: Invalid password format."):
+        await app_ops_user.upsert_users(
+            requests, upsert_users_func=mock_upsert_users_func
+        )
+    mock_upsert_users_func.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_persistence_error():
+    mock_upsert_users_func = AsyncMock(side_effect=PersistenceOpsBaseError())
+    with pytest.raises(UpsertUsersError):
+        await app_ops_user.upsert_users(
+            [schema_user.SchemaUserCreate(username="testuser", password="password")],
+            upsert_users_func=mock_upsert_users_func,
+        )
+    mock_upsert_users_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_invalidates_cached_login():
+    user = schema_user.SchemaUserDisplay(
+        id=uuid.uuid4(),
+        username="testuser1",
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    credential_cache.put("testuser1", "oldpassword", user)
+
+    await app_ops_user.upsert_users(
+        [schema_user.SchemaUserCreate(username="testuser1", password="newpassword")],
+        upsert_users_func=AsyncMock(return_value=[user]),
+        credential_cache=credential_cache,
+    )
+    assert credential_cache.get("testuser1", "oldpassword") is None
@@ -1,9 +1,14 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
 
-from src.app.ops.exceptions.app_ops_exceptions import OpsBaseError
+from src.app.ops.exceptions.app_ops_exceptions import (
+    ConcurrentUpdateError,
+    OpsBaseError,
+)
 from src.app.ops.utils import app_ops_utils
+from src.utils import paging_cursor
 
 
 @pytest.mark.asyncio
@@ -44,6 +49,33 @@ async def test_affect_existing_row_multiple_rows_affected():
     mock_affect_existing_row_func.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_affect_existing_row_expected_last_updated_on():
+    mock_affect_existing_row_func = AsyncMock(return_value=1)
+    await app_ops_utils.affect_existing_row(
+        mock_affect_existing_row_func,
+        OpsBaseError,
+        expected_last_updated_on="version",
+        my_arg1="Hello",
+    )
+    mock_affect_existing_row_func.assert_called_with(
+        my_arg1="Hello", expected_last_updated_on="version"
+    )
+
+
+@pytest.mark.asyncio
+async def test_affect_existing_row_concurrent_update():
+    mock_affect_existing_row_func = AsyncMock(return_value=0)
+    with pytest.raises(ConcurrentUpdateError):
+        await app_ops_utils.affect_existing_row(
+            mock_affect_existing_row_func,
+            OpsBaseError,
+            expected_last_updated_on="version",
+            my_arg1="Hello",
+        )
+    mock_affect_existing_row_func.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_affect_existing_row_persistence_error():
     mock_affect_existing_row_func = AsyncMock(return_value=1)
@@ -135,3 +167,37 @@ async def test_get_data_list_persistence_error():
         my_arg1="Hello",
         my_arg2="There",
     )
+
+
+@pytest.mark.asyncio
+async def test_get_data_list_after():
+    mock_select_data_list_func = AsyncMock(return_value=[4, 5])
+
+    results = await app_ops_utils.get_data_list(
+        0,
+        10,
+        "created_on",
+        mock_select_data_list_func,
+        OpsBaseError,
+        after="cursor",
+        my_arg1="Hello",
+    )
+
+    mock_select_data_list_func.assert_called_with(
+        page_index=0,
+        page_size=10,
+        sort_by="created_on",
+        after="cursor",
+        my_arg1="Hello",
+    )
+    assert results == [4, 5]
+
+
+def test_get_next_cursor():
+    first = SimpleNamespace(id=1, name="a")
+    last = SimpleNamespace(id=2, name="b")
+
+    cursor = app_ops_utils.get_next_cursor([first, last], "name")
+
+    assert cursor == paging_cursor.encode_cursor(last, "name")
+    assert app_ops_utils.get_next_cursor([], "name") is None
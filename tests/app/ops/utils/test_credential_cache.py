@@ -0,0 +1,99 @@
+import uuid
+from datetime import datetime
+
+from src.app.ops.utils.credential_cache import CredentialCache
+from src.schemas import schema_user
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_user(username="testuser1"):
+    return schema_user.SchemaUserDisplay(
+        id=uuid.uuid4(),
+        username=username,
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+
+
+def test_get_after_put():
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    user = create_user()
+
+    assert credential_cache.get("testuser1", "123456") is None
+    credential_cache.put("testuser1", "123456", user)
+    assert credential_cache.get("testuser1", "123456") is user
+
+
+def test_get_wrong_password():
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    credential_cache.put("testuser1", "123456", create_user())
+
+    assert credential_cache.get("testuser1", "654321") is None
+    assert credential_cache.get("testuser2", "123456") is None
+
+
+def test_password_not_stored():
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    credential_cache.put("testuser1", "123456", create_user())
+
+    assert "123456" not in repr(credential_cache._entries)
+
+
+def test_get_expired():
+    clock = FakeClock()
+    credential_cache = CredentialCache(max_size=10, ttl=60, clock=clock)
+    credential_cache.put("testuser1", "123456", create_user())
+
+    clock.now = 59
+    assert credential_cache.get("testuser1", "123456") is not None
+    clock.now = 60
+    assert credential_cache.get("testuser1", "123456") is None
+    assert len(credential_cache) == 0
+
+
+def test_put_evicts_least_recently_used():
+    credential_cache = CredentialCache(max_size=2, ttl=60)
+    credential_cache.put("testuser1", "1", create_user("testuser1"))
+    credential_cache.put("testuser2", "2", create_user("testuser2"))
+    credential_cache.get("testuser1", "1")
+    credential_cache.put("testuser3", "3", create_user("testuser3"))
+
+    assert credential_cache.get("testuser1", "1") is not None
+    assert credential_cache.get("testuser2", "2") is None
+    assert credential_cache.get("testuser3", "3") is not None
+
+
+def test_disabled():
+    credential_cache = CredentialCache(max_size=10, ttl=0)
+    credential_cache.put("testuser1", "123456", create_user())
+
+    assert not credential_cache.enabled
+    assert credential_cache.get("testuser1", "123456") is None
+
+
+def test_invalidate_user():
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    user1 = create_user("testuser1")
+    credential_cache.put("testuser1", "1", user1)
+    credential_cache.put("testuser2", "2", create_user("testuser2"))
+
+    credential_cache.invalidate_user(str(user1.id))
+
+    assert credential_cache.get("testuser1", "1") is None
+    assert credential_cache.get("testuser2", "2") is not None
+
+
+def test_put_stale_generation():
+    credential_cache = CredentialCache(max_size=10, ttl=60)
+    generation = credential_cache.generation
+    credential_cache.invalidate_user(uuid.uuid4())
+
+    credential_cache.put("testuser1", "1", create_user(), generation=generation)
+    assert credential_cache.get("testuser1", "1") is None
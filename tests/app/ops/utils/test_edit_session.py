@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.app.ops.exceptions.app_ops_exceptions import OpsBaseError
+from src.app.ops.utils.edit_session import EditSession
+
+
+def test_edit_tracks_diff():
+    edit_session = EditSession(AsyncMock())
+    edit_session.track("a", x=1, y=2, name="a")
+    edit_session.track("b", x=1, y=2, name="b")
+
+    edit_session.edit("a", x=5)
+    edit_session.edit("a", x=6, y=2)
+    edit_session.edit("b", name="b")
+
+    assert edit_session.has_changes
+    assert edit_session.diff() == {"a": {"x": 6}}
+
+
+def test_edit_back_to_committed_value():
+    edit_session = EditSession(AsyncMock())
+    edit_session.track("a", x=1, y=2)
+
+    edit_session.edit("a", x=5)
+    edit_session.edit("a", x=1)
+
+    assert not edit_session.has_changes
+    assert edit_session.diff() == {}
+
+
+def test_edit_untracked_key():
+    edit_session = EditSession(AsyncMock())
+    with pytest.raises(KeyError):
+        edit_session.edit("a", x=1)
+
+
+@pytest.mark.asyncio
+async def test_commit():
+    mock_commit_func = AsyncMock(return_value=["result"])
+    edit_session = EditSession(mock_commit_func)
+    edit_session.track("a", x=1, y=2)
+    edit_session.track("b", x=1, y=2)
+    edit_session.edit("a", x=5)
+
+    assert await edit_session.commit() == ["result"]
+    mock_commit_func.assert_awaited_once_with({"a": {"x": 5}})
+    assert not edit_session.has_changes
+
+    # The committed value is the new baseline.
+    edit_session.edit("a", x=1)
+    assert edit_session.diff() == {"a": {"x": 1}}
+
+
+@pytest.mark.asyncio
+async def test_commit_nothing_changed():
+    mock_commit_func = AsyncMock()
+    edit_session = EditSession(mock_commit_func)
+    edit_session.track("a", x=1)
+
+    assert await edit_session.commit() == []
+    mock_commit_func.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_commit_error_keeps_edits():
+    mock_commit_func = AsyncMock(side_effect=OpsBaseError("Database unavailable."))
+    edit_session = EditSession(mock_commit_func)
+    edit_session.track("a", x=1)
+    edit_session.edit("a", x=5)
+
+    with pytest.raises(OpsBaseError):
+        await edit_session.commit()
+    assert edit_session.diff() == {"a": {"x": 5}}
+
+
+@pytest.mark.asyncio
+async def test_commit_keeps_edits_made_during_write():
+    commit_started = asyncio.Event()
+    release_commit = asyncio.Event()
+
+    async def slow_commit_func(_):
+        commit_started.set()
+        await release_commit.wait()
+        return []
+
+    edit_session = EditSession(slow_commit_func)
+    edit_session.track("a", x=1, y=1)
+    edit_session.edit("a", x=5)
+
+    task = asyncio.create_task(edit_session.commit())
+    await commit_started.wait()
+    edit_session.edit("a", x=6, y=7)
+    release_commit.set()
+    await task
+
+    assert edit_session.diff() == {"a": {"x": 6, "y": 7}}
+
+
+def test_revert():
+    edit_session = EditSession(AsyncMock())
+    edit_session.track("a", x=1, y=2, name="a")
+    edit_session.track("b", x=1, y=2, name="b")
+    edit_session.edit("a", x=5, name="c")
+
+    assert edit_session.revert() == {"a": {"x": 1, "name": "a"}}
+    assert not edit_session.has_changes
+
+
+def test_untrack():
+    edit_session = EditSession(AsyncMock())
+    edit_session.track("a", x=1)
+    edit_session.edit("a", x=5)
+    edit_session.untrack("a")
+    edit_session.untrack("unknown")
+
+    assert not edit_session.has_changes
+    assert edit_session.revert() == {}
@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.app.ops.exceptions.app_ops_exceptions import OpsBaseError
+from src.app.ops.utils.list_cache import ListCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_hit_and_miss():
+    list_cache = ListCache()
+    mock_load_func = AsyncMock(return_value=["a", "b"])
+
+    assert await list_cache.get_or_load("menu", (0, 10), mock_load_func) == ["a", "b"]
+    assert await list_cache.get_or_load("menu", (0, 10), mock_load_func) == ["a", "b"]
+    mock_load_func.assert_awaited_once()
+
+    await list_cache.get_or_load("menu", (1, 10), mock_load_func)
+    assert mock_load_func.await_count == 2
+    assert list_cache.stats() == {"size": 2, "hits": 1, "misses": 2, "evictions": 0}
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_returns_copy():
+    list_cache = ListCache()
+    mock_load_func = AsyncMock(return_value=["a"])
+
+    results = await list_cache.get_or_load("menu", (0, 10), mock_load_func)
+    results.append("b")
+
+    assert await list_cache.get_or_load("menu", (0, 10), mock_load_func) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_expired():
+    clock = FakeClock()
+    list_cache = ListCache(ttl=5, clock=clock)
+    mock_load_func = AsyncMock(return_value=["a"])
+
+    await list_cache.get_or_load("menu", (0, 10), mock_load_func)
+    clock.now = 4.9
+    await list_cache.get_or_load("menu", (0, 10), mock_load_func)
+    mock_load_func.assert_awaited_once()
+
+    clock.now = 5
+    await list_cache.get_or_load("menu", (0, 10), mock_load_func)
+    assert mock_load_func.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_evicts_least_recently_used():
+    list_cache = ListCache(max_size=2)
+    mock_load_func = AsyncMock(return_value=[])
+
+    await list_cache.get_or_load("menu", (0,), mock_load_func)
+    await list_cache.get_or_load("menu", (1,), mock_load_func)
+    await list_cache.get_or_load("menu", (0,), mock_load_func)
+    await list_cache.get_or_load("menu", (2,), mock_load_func)
+    assert mock_load_func.await_count == 3
+    assert list_cache.stats()["evictions"] == 1
+
+    await list_cache.get_or_load("menu", (0,), mock_load_func)
+    assert mock_load_func.await_count == 3
+    await list_cache.get_or_load("menu", (1,), mock_load_func)
+    assert mock_load_func.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_error_not_cached():
+    list_cache = ListCache()
+    mock_load_func = AsyncMock(side_effect=OpsBaseError("Database unavailable."))
+
+    with pytest.raises(OpsBaseError):
+        await list_cache.get_or_load("menu", (0, 10), mock_load_func)
+
+    mock_load_func.side_effect = None
+    mock_load_func.return_value = ["a"]
+    assert await list_cache.get_or_load("menu", (0, 10), mock_load_func) == ["a"]
+    assert list_cache.stats()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate():
+    list_cache = ListCache()
+    mock_menu_load_func = AsyncMock(return_value=["menu"])
+    mock_tag_load_func = AsyncMock(return_value=["tag"])
+
+    await list_cache.get_or_load("menu", (0, 10), mock_menu_load_func)
+    await list_cache.get_or_load("tag", (0, 10), mock_tag_load_func)
+    list_cache.invalidate("menu")
+
+    await list_cache.get_or_load("menu", (0, 10), mock_menu_load_func)
+    await list_cache.get_or_load("tag", (0, 10), mock_tag_load_func)
+    assert mock_menu_load_func.await_count == 2
+    mock_tag_load_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_load():
+    list_cache = ListCache()
+    load_started = asyncio.Event()
+    release_load = asyncio.Event()
+
+    async def slow_load_func():
+        load_started.set()
+        await release_load.wait()
+        return ["stale"]
+
+    task = asyncio.create_task(list_cache.get_or_load("menu", (0, 10), slow_load_func))
+    await load_started.wait()
+    list_cache.invalidate("menu")
+    release_load.set()
+
+    assert await task == ["stale"]
+    assert list_cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_clear():
+    list_cache = ListCache()
+    mock_load_func = AsyncMock(return_value=["a"])
+
+    await list_cache.get_or_load("menu", (0, 10), mock_load_func)
+    await list_cache.get_or_load("menu", (0, 10), mock_load_func)
+    list_cache.clear()
+
+    assert list_cache.stats() == {"size": 0, "hits": 0, "misses": 0, "evictions": 0}
@@ -0,0 +1,108 @@
+import json
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.app.ops import app_ops_menu
+from src.app.ops.exceptions.app_ops_exceptions import UpdateNameError
+from src.app.ops.utils import ops_metrics
+from src.app.ops.utils.ops_metrics import OpsMetrics
+from src.schemas import schema_menu
+
+
+def make_clock(*values):
+    clock_values = iter(values)
+    return lambda: next(clock_values)
+
+
+@pytest.mark.asyncio
+async def test_instrument():
+    metrics = OpsMetrics(clock=make_clock(1.0, 1.5))
+
+    async def get_value(value):
+        return value
+
+    instrumented = metrics.instrument(get_value, "module.get_value")
+    assert await instrumented(3) == 3
+    assert instrumented.__name__ == "get_value"
+
+    result = metrics.as_dict()["module.get_value"]
+    assert result["calls"] == 1
+    assert result["errors"] == {}
+    assert result["max"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_instrument_error():
+    metrics = OpsMetrics(clock=make_clock(1.0, 1.25))
+
+    async def fail():
+        raise UpdateNameError("No rows were affected.")
+
+    with pytest.raises(UpdateNameError):
+        await metrics.instrument(fail, "module.fail")()
+
+    result = metrics.as_dict()["module.fail"]
+    assert result["calls"] == 1
+    assert result["errors"] == {"UpdateNameError": 1}
+
+
+@pytest.mark.asyncio
+async def test_install():
+    original_update_name = app_ops_menu.update_name
+    original_validate_menu_name = app_ops_menu.validate_menu_name
+    metrics = OpsMetrics()
+    metrics.install([app_ops_menu])
+    try:
+        assert app_ops_menu.update_name is not original_update_name
+        # Only coroutines are entry points.
+        assert app_ops_menu.validate_menu_name is original_validate_menu_name
+
+        await app_ops_menu.update_name(
+            uuid.uuid4(),
+            schema_menu.SchemaUpdateName(name="menu"),
+            update_name_func=AsyncMock(return_value=1),
+        )
+        with pytest.raises(UpdateNameError):
+            await app_ops_menu.update_name(
+                uuid.uuid4(),
+                schema_menu.SchemaUpdateName(name="  "),
+                update_name_func=AsyncMock(return_value=[]),
+            )
+    finally:
+        metrics.uninstall()
+    assert app_ops_menu.update_name is original_update_name
+
+    result = metrics.as_dict()["app_ops_menu.update_name"]
+    assert result["calls"] == 2
+    assert result["errors"] == {"UpdateNameError": 1}
+
+
+def test_install_app_ops_metrics():
+    metrics = OpsMetrics()
+    ops_metrics.install_app_ops_metrics(metrics)
+    try:
+        installed = {f"{module.__name__}.{name}" for module, name in metrics._originals}
+        assert "src.app.ops.app_ops_dining_table.update_position" in installed
+        assert "src.app.ops.app_ops_menu.get_menu_list" in installed
+        assert "src.app.ops.app_ops_tag.upsert_tags" in installed
+        assert "src.app.ops.app_ops_user.login" in installed
+    finally:
+        metrics.uninstall()
+
+
+def test_to_json(tmp_path):
+    metrics = OpsMetrics()
+    metrics.record("app_ops_menu.get_menu_list", 0.002)
+    metrics.record("app_ops_menu.get_menu_list", 0.004, UpdateNameError())
+    path = tmp_path / "metrics.json"
+    metrics.write_json(str(path))
+
+    result = json.loads(path.read_text(encoding="utf-8"))
+    assert result["app_ops_menu.get_menu_list"]["calls"] == 2
+    assert result["app_ops_menu.get_menu_list"]["errors"] == {"UpdateNameError": 1}
+    assert result == json.loads(metrics.to_json())
+
+    metrics.reset()
+    assert metrics.as_dict() == {}
@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.app.ops.utils.warm_up import WarmUpStatus, WarmUpStep, run_warm_up
+
+
+@pytest.mark.asyncio
+async def test_run_warm_up_runs_steps_in_order():
+    calls = []
+
+    def make_step(name):
+        async def func():
+            calls.append(name)
+
+        return WarmUpStep(name, func)
+
+    results = await run_warm_up([make_step("a"), make_step("b")])
+
+    assert calls == ["a", "b"]
+    assert results == {"a": None, "b": None}
+
+
+@pytest.mark.asyncio
+async def test_run_warm_up_continues_after_failed_step():
+    error = RuntimeError()
+    later_step = AsyncMock()
+
+    results = await run_warm_up(
+        [
+            WarmUpStep("a", AsyncMock(side_effect=error)),
+            WarmUpStep("b", later_step),
+        ]
+    )
+
+    later_step.assert_awaited_once()
+    assert results == {"a": error, "b": None}
+
+
+@pytest.mark.asyncio
+async def test_run_warm_up_reports_status():
+    statuses = []
+
+    await run_warm_up(
+        [
+            WarmUpStep("a", AsyncMock()),
+            WarmUpStep("b", AsyncMock(side_effect=RuntimeError())),
+        ],
+        on_status=lambda name, status: statuses.append((name, status)),
+    )
+
+    assert statuses == [
+        ("a", WarmUpStatus.RUNNING),
+        ("a", WarmUpStatus.DONE),
+        ("b", WarmUpStatus.RUNNING),
+        ("b", WarmUpStatus.FAILED),
+    ]
@@ -0,0 +1,247 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncGenerator, Awaitable, Callable
+
+import sqlalchemy
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from src.persistence.database.models.db_dining_table import DbDiningTable
+from src.persistence.database.models.db_menu import DbMenu
+from src.persistence.database.models.db_tag import DbTag
+from src.persistence.database.models.db_user import DbUser
+from src.persistence.database.session import Base
+from src.utils import bcrypt_hash
+
+# Rows seeded per table at --benchmark-scale=1.
+BASE_VOLUMES = {
+    DbDiningTable: 2000,
+    DbMenu: 2000,
+    DbTag: 2000,
+    DbUser: 200,
+}
+SEED_CHUNK_SIZE = 500
+SEED_PASSWORD = "123456"
+DEFAULT_ROUNDS = 20
+
+
+# ===== in memory database setup =====
+# Unlike the engine in mock_utils, statements are not echoed,
+# so logging does not dominate the timings.
+
+engine = create_async_engine(
+    "sqlite+aiosqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+BenchmarkSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    autocommit=False, autoflush=False, bind=engine
+)
+
+
+@asynccontextmanager
+async def async_benchmark_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    async with BenchmarkSessionLocal() as async_session:
+        try:
+            yield async_session
+        finally:
+            await async_session.close()
+
+
+def seeded_usernames(count: int):
+    """
+    Returns the usernames of the specified number of seeded users.
+    """
+    return [f"user{index}" for index in range(count)]
+
+
+def _seed_rows(entity_type, count: int, password_hash: str):
+    if entity_type is DbDiningTable:
+        return [
+            {
+                "name": f"table{index}",
+                "x": (index % 50) * 20,
+                "y": (index // 50) * 20,
+                "width": 40,
+                "height": 40,
+            }
+            for index in range(count)
+        ]
+    if entity_type is DbUser:
+        return [
+            {"username": username, "password_hash": password_hash}
+            for username in seeded_usernames(count)
+        ]
+    prefix = entity_type.__tablename__
+    return [{"name": f"{prefix}{index}"} for index in range(count)]
+
+
+class DatabaseNotEmptyError(Exception):
+    """
+    Raised when the database to seed already contains some of the tables.
+    """
+
+
+def _existing_table_names(sync_conn):
+    inspector = sqlalchemy.inspect(sync_conn)
+    return [
+        table.name
+        for table in Base.metadata.sorted_tables
+        if inspector.has_table(table.name)
+    ]
+
+
+@asynccontextmanager
+async def seeded_database(scale: float = 1, async_engine: AsyncEngine = engine):
+    """
+    Creates the tables and seeds them with BASE_VOLUMES rows multiplied
+    by scale, then drops them on exit. Every seeded user has the password
+    SEED_PASSWORD. Yields the number of rows seeded per entity type.
+    Raises DatabaseNotEmptyError, without touching the database,
+    if any of the tables already exists.
+
+    - *async_engine* The engine of the database to seed,
+    the in-memory benchmark database by default
+    """
+    volumes = {
+        entity_type: max(1, int(count * scale))
+        for entity_type, count in BASE_VOLUMES.items()
+    }
+    # Hashed once, as a bcrypt round per seeded user would dwarf the setup.
+    password_hash = bcrypt_hash.bcrypt(SEED_PASSWORD)
+
+    # Only the tables created here are dropped on exit, so that a run
+    # against a real database can never drop the data it already holds.
+    created_tables = list(Base.metadata.sorted_tables)
+    async with async_engine.begin() as conn:
+        existing_table_names = await conn.run_sync(_existing_table_names)
+        if existing_table_names:
+            raise DatabaseNotEmptyError(
+                "The database already contains the tables "
+                f"{', '.join(existing_table_names)}. Use an empty scratch database."
+            )
+        await conn.run_sync(Base.metadata.create_all, tables=created_tables)
+    try:
+        async with async_engine.begin() as conn:
+            for entity_type, count in volumes.items():
+                rows = _seed_rows(entity_type, count, password_hash)
+                for start in range(0, count, SEED_CHUNK_SIZE):
+                    await conn.execute(
+                        insert(entity_type), rows[start : start + SEED_CHUNK_SIZE]
+                    )
+        yield volumes
+    finally:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all, tables=created_tables)
+
+
+async def select_ids(entity_type, limit: int, async_engine: AsyncEngine = engine):
+    """
+    Returns the ids of up to limit seeded rows of the specified entity type.
+    """
+    async with async_engine.connect() as conn:
+        return list(
+            (
+                await conn.execute(
+                    select(entity_type.id).order_by(entity_type.id).limit(limit)
+                )
+            ).scalars()
+        )
+
+
+class BenchmarkRecorder:
+    """
+    Times async callables and collects the results into a report.
+    """
+
+    def __init__(self, rounds: int = DEFAULT_ROUNDS, metadata: dict = None):
+        self.rounds = rounds
+        self.metadata = metadata or {}
+        self.results = {}
+
+    async def measure(
+        self,
+        name: str,
+        func: Callable[[], Awaitable],
+        rounds: int = None,
+        warmup_rounds: int = 1,
+    ):
+        """
+        Awaits func warmup_rounds times untimed, then rounds times timed,
+        and records the statistics under the specified name.
+        Returns the recorded statistics.
+        """
+        rounds = rounds or self.rounds
+        for _ in range(warmup_rounds):
+            await func()
+
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await func()
+            timings.append(time.perf_counter() - start)
+
+        self.results[name] = summarise(timings)
+        return self.results[name]
+
+    def report(self):
+        return {"metadata": self.metadata, "benchmarks": self.results}
+
+    def write_report(self, path: str):
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(self.report(), report_file, indent=2, sort_keys=True)
+            report_file.write("\n")
+
+
+def summarise(timings: list[float]):
+    """
+    Returns the statistics, in seconds, of the specified timings.
+    """
+    mean = statistics.fmean(timings)
+    return {
+        "rounds": len(timings),
+        "min": min(timings),
+        "max": max(timings),
+        "mean": mean,
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "ops_per_second": 1 / mean if mean else None,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_metadata(scale: float, rounds: int):
+    return {
+        "commit": _git_commit(),
+        "created_on": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "rounds": rounds,
+        "scale": scale,
+        "sqlalchemy": sqlalchemy.__version__,
+    }
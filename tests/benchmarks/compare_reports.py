@@ -0,0 +1,56 @@
+"""
+Compares two benchmark reports written with --benchmark-json.
+
+python -m tests.benchmarks.compare_reports <baseline.json> <candidate.json>
+"""
+
+import json
+import sys
+
+STATISTIC = "median"
+
+
+def load_report(path: str):
+    with open(path, encoding="utf-8") as report_file:
+        return json.load(report_file)
+
+
+def compare_reports(baseline: dict, candidate: dict, statistic: str = STATISTIC):
+    """
+    Returns (name, baseline seconds, candidate seconds, relative change)
+    for every benchmark in either report, sorted by name. Values missing
+    from one of the reports are None.
+    """
+    baseline_results = baseline["benchmarks"]
+    candidate_results = candidate["benchmarks"]
+    rows = []
+    for name in sorted(set(baseline_results) | set(candidate_results)):
+        before = baseline_results.get(name, {}).get(statistic)
+        after = candidate_results.get(name, {}).get(statistic)
+        change = (after - before) / before if before and after is not None else None
+        rows.append((name, before, after, change))
+    return rows
+
+
+def _format_seconds(value):
+    return "-" if value is None else f"{value * 1000:.3f}ms"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print(__doc__.strip())
+        return 2
+
+    baseline, candidate = (load_report(path) for path in argv)
+    for name, before, after, change in compare_reports(baseline, candidate):
+        change_text = "-" if change is None else f"{change:+.1%}"
+        print(
+            f"{name:<60} {_format_seconds(before):>12} "
+            f"{_format_seconds(after):>12} {change_text:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
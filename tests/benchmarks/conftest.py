@@ -0,0 +1,28 @@
+import pytest
+
+from tests.benchmarks.bench_utils import (
+    DEFAULT_ROUNDS,
+    BenchmarkRecorder,
+    build_metadata,
+)
+
+
+@pytest.fixture(scope="session")
+def benchmark_scale(pytestconfig):
+    return pytestconfig.getoption("--benchmark-scale")
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder(pytestconfig, benchmark_scale):
+    """
+    Shared by all benchmarks of the session. The report is written to
+    --benchmark-json once the session ends, if the option was provided.
+    """
+    rounds = pytestconfig.getoption("--benchmark-rounds") or DEFAULT_ROUNDS
+    recorder = BenchmarkRecorder(
+        rounds=rounds, metadata=build_metadata(benchmark_scale, rounds)
+    )
+    yield recorder
+    report_path = pytestconfig.getoption("--benchmark-json")
+    if report_path and recorder.results:
+        recorder.write_report(report_path)
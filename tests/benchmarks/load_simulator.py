@@ -0,0 +1,448 @@
+"""
+Simulates POS terminals driving the app ops layer against one database
+and reports the throughput and latency of every operation.
+
+python -m tests.benchmarks.load_simulator --terminals 20 --duration 30
+python -m tests.benchmarks.load_simulator --database-url postgresql+asyncpg://...
+
+The database is seeded as for the benchmarks and its tables are dropped
+once the run ends. The run refuses to start if any of the tables already
+exists, so point --database-url at an empty scratch database.
+Every terminal has its own credential cache and list cache, as every
+terminal is its own process.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.app.ops import app_ops_dining_table, app_ops_menu, app_ops_tag, app_ops_user
+from src.app.ops.exceptions.app_ops_exceptions import OpsBaseError
+from src.app.ops.utils.credential_cache import CredentialCache
+from src.app.ops.utils.list_cache import ListCache
+from src.configuration import Configuration
+from src.persistence.database.models.db_dining_table import DbDiningTable
+from src.persistence.database.models.db_menu import DbMenu
+from src.persistence.database.models.db_tag import DbTag
+from src.persistence.database.models.db_user import DbUser
+from src.persistence.database.ops import (
+    db_batch_ops_dining_table,
+    db_batch_ops_menu,
+    db_batch_ops_tag,
+    db_batch_ops_user,
+)
+from src.persistence.database.session import build_engine_options
+from src.schemas import schema_dining_table, schema_menu, schema_tag
+from tests.benchmarks.bench_utils import (
+    SEED_PASSWORD,
+    DatabaseNotEmptyError,
+    seeded_database,
+    seeded_usernames,
+    select_ids,
+)
+
+SQLITE_MEMORY_URL = "sqlite+aiosqlite:///:memory:"
+PAGE_SIZE = 20
+SORT_BY = "name"
+PERCENTILES = (50, 95, 99)
+
+# Relative weights of the operations run by every terminal.
+DEFAULT_OPERATION_MIX = {
+    "login": 1,
+    "get_dining_table_list": 4,
+    "update_position": 3,
+    "get_menu_list": 2,
+    "update_menu_name": 1,
+    "get_tag_list": 2,
+    "update_tag_name": 1,
+}
+
+
+@dataclass
+class LoadTarget:
+    """
+    The seeded database the terminals run against.
+
+    - *async_session_scope* The session scope passed to the batch ops
+    - *dining_table_ids*, *menu_ids*, *tag_ids* The ids of the seeded rows
+    - *usernames* The usernames of the seeded users
+    """
+
+    async_session_scope: Callable
+    dining_table_ids: list
+    menu_ids: list
+    tag_ids: list
+    usernames: list
+
+
+@dataclass
+class LoadReport:
+    """
+    The latencies, in seconds, and the error counts of every operation.
+    """
+
+    timings: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def record(self, name: str, seconds: float, error: Exception = None):
+        self.timings.setdefault(name, []).append(seconds)
+        if error is not None:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def summary(self):
+        """
+        Returns the statistics of every operation, sorted by name,
+        plus those of all operations together under "total".
+        """
+        results = {
+            name: summarise_latencies(timings, self.elapsed, self.errors.get(name, 0))
+            for name, timings in sorted(self.timings.items())
+        }
+        all_timings = [
+            seconds for timings in self.timings.values() for seconds in timings
+        ]
+        if all_timings:
+            results["total"] = summarise_latencies(
+                all_timings, self.elapsed, sum(self.errors.values())
+            )
+        return results
+
+    def format(self):
+        lines = [
+            f"{'operation':<24} {'count':>7} {'errors':>6} {'ops/s':>8} "
+            + " ".join(f"{f'p{percentile}':>9}" for percentile in PERCENTILES)
+        ]
+        for name, result in self.summary().items():
+            lines.append(
+                f"{name:<24} {result['count']:>7} {result['errors']:>6} "
+                f"{result['ops_per_second']:>8.1f} "
+                + " ".join(
+                    f"{result[f'p{percentile}'] * 1000:>7.2f}ms"
+                    for percentile in PERCENTILES
+                )
+            )
+        return "\n".join(lines)
+
+
+def percentile(sorted_timings: list[float], percent: float):
+    """
+    Returns the nearest-rank percentile of the specified sorted timings.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(sorted_timings)))
+    return sorted_timings[rank - 1]
+
+
+def summarise_latencies(timings: list[float], elapsed: float, errors: int = 0):
+    """
+    Returns the count, throughput and latency percentiles, in seconds,
+    of the specified timings recorded over elapsed seconds.
+    """
+    sorted_timings = sorted(timings)
+    result = {
+        "count": len(timings),
+        "errors": errors,
+        "ops_per_second": len(timings) / elapsed if elapsed else 0.0,
+        "max": sorted_timings[-1],
+    }
+    for percent in PERCENTILES:
+        result[f"p{percent}"] = percentile(sorted_timings, percent)
+    return result
+
+
+def parse_operation_mix(text: str):
+    """
+    Parses an operation mix such as "login=1,update_position=3".
+    Raises ValueError if an operation is unknown or a weight is invalid.
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in DEFAULT_OPERATION_MIX:
+            raise ValueError(f"Unknown operation: {name}.")
+        try:
+            mix[name] = float(weight)
+        except ValueError as ve:
+            raise ValueError(f"Invalid weight for {name}: {weight}.") from ve
+        if mix[name] < 0:
+            raise ValueError(f"Invalid weight for {name}: {weight}.")
+    if not any(mix.values()):
+        raise ValueError("No operation has a positive weight.")
+    return mix
+
+
+def build_operations(
+    target: LoadTarget, credential_cache: CredentialCache, list_cache: ListCache
+) -> dict[str, Callable[[random.Random], Awaitable]]:
+    """
+    Returns the operations of one terminal, each taking the random
+    generator of the terminal to pick the rows it works on.
+    The credential and list caches are per terminal, as every terminal
+    is its own process.
+    """
+    scope = {"async_session_scope_func": target.async_session_scope}
+
+    async def login(rng):
+        await app_ops_user.login(
+            rng.choice(target.usernames),
+            SEED_PASSWORD,
+            select_user_by_username_and_password_func=partial(
+                db_batch_ops_user.select_user_by_username_and_password, **scope
+            ),
+            credential_cache=credential_cache,
+        )
+
+    async def get_dining_table_list(rng):
+        await app_ops_dining_table.get_dining_table_list(
+            0,
+            PAGE_SIZE,
+            SORT_BY,
+            select_dining_table_list_func=partial(
+                db_batch_ops_dining_table.select_dining_table_list, **scope
+            ),
+            list_cache=list_cache,
+        )
+
+    async def update_position(rng):
+        await app_ops_dining_table.update_position(
+            rng.choice(target.dining_table_ids),
+            schema_dining_table.SchemaUpdatePosition(
+                x=rng.randrange(1000), y=rng.randrange(1000)
+            ),
+            update_position_func=partial(
+                db_batch_ops_dining_table.update_position, **scope
+            ),
+            list_cache=list_cache,
+        )
+
+    async def get_menu_list(rng):
+        await app_ops_menu.get_menu_list(
+            0,
+            PAGE_SIZE,
+            SORT_BY,
+            select_menu_list_func=partial(db_batch_ops_menu.select_menu_list, **scope),
+            list_cache=list_cache,
+        )
+
+    async def update_menu_name(rng):
+        await app_ops_menu.update_name(
+            rng.choice(target.menu_ids),
+            schema_menu.SchemaUpdateName(name=f"menu{rng.randrange(10000)}"),
+            update_name_func=partial(db_batch_ops_menu.update_name, **scope),
+            list_cache=list_cache,
+        )
+
+    async def get_tag_list(rng):
+        await app_ops_tag.get_tag_list(
+            0,
+            PAGE_SIZE,
+            SORT_BY,
+            select_tag_list_func=partial(db_batch_ops_tag.select_tag_list, **scope),
+            list_cache=list_cache,
+        )
+
+    async def update_tag_name(rng):
+        await app_ops_tag.update_name(
+            rng.choice(target.tag_ids),
+            schema_tag.SchemaUpdateName(name=f"tag{rng.randrange(10000)}"),
+            update_name_func=partial(db_batch_ops_tag.update_name, **scope),
+            list_cache=list_cache,
+        )
+
+    return {
+        "login": login,
+        "get_dining_table_list": get_dining_table_list,
+        "update_position": update_position,
+        "get_menu_list": get_menu_list,
+        "update_menu_name": update_menu_name,
+        "get_tag_list": get_tag_list,
+        "update_tag_name": update_tag_name,
+    }
+
+
+async def run_terminal(
+    operations: dict,
+    mix: dict,
+    think_time: float,
+    deadline: float,
+    rng: random.Random,
+    report: LoadReport,
+    clock: Callable[[], float] = time.perf_counter,
+):
+    """
+    Runs operations picked by weight from mix until the deadline passes,
+    pausing between them for a random think time averaging think_time.
+    Operations that raise an OpsBaseError are recorded as errors.
+    """
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    while clock() < deadline:
+        name = rng.choices(names, weights)[0]
+        start = clock()
+        try:
+            await operations[name](rng)
+        except OpsBaseError as ope:
+            report.record(name, clock() - start, ope)
+        else:
+            report.record(name, clock() - start)
+        if think_time:
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+
+
+def create_engine(database_url: str) -> AsyncEngine:
+    """
+    Returns the engine to run against. The in-memory SQLite database
+    lives in a single connection, while other databases use the
+    connection pool settings of the configuration.
+    """
+    if database_url == SQLITE_MEMORY_URL:
+        return create_async_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    return create_async_engine(
+        database_url, **build_engine_options(database_url, Configuration)
+    )
+
+
+def build_session_scope(async_engine: AsyncEngine):
+    """
+    Returns the session scope to pass to the batch ops. As all sessions
+    of an SQLite engine share the one in-memory connection, they are run
+    one at a time, much like SQLite serialises writers.
+    """
+    session_local = async_sessionmaker(
+        autocommit=False, autoflush=False, bind=async_engine
+    )
+    lock = asyncio.Lock() if async_engine.dialect.name == "sqlite" else None
+
+    @asynccontextmanager
+    async def async_session_scope():
+        async with lock or nullcontext():
+            async with session_local() as async_session:
+                yield async_session
+
+    return async_session_scope
+
+
+async def simulate(
+    terminals: int,
+    duration: float,
+    mix: dict = None,
+    think_time: float = 0.0,
+    database_url: str = SQLITE_MEMORY_URL,
+    scale: float = 0.1,
+    seed: int = None,
+) -> LoadReport:
+    """
+    Seeds the database, runs the specified number of terminals
+    concurrently for duration seconds and returns the report.
+
+    - *mix* The operation weights, DEFAULT_OPERATION_MIX by default
+    - *think_time* The mean pause, in seconds, between two operations
+    - *scale* Multiplier applied to the number of rows seeded
+    - *seed* Makes the sequence of operations of every terminal repeatable
+    """
+    mix = mix or DEFAULT_OPERATION_MIX
+    async_engine = create_engine(database_url)
+    try:
+        async with seeded_database(scale, async_engine) as volumes:
+            target = LoadTarget(
+                async_session_scope=build_session_scope(async_engine),
+                dining_table_ids=await select_ids(
+                    DbDiningTable, volumes[DbDiningTable], async_engine
+                ),
+                menu_ids=await select_ids(DbMenu, volumes[DbMenu], async_engine),
+                tag_ids=await select_ids(DbTag, volumes[DbTag], async_engine),
+                usernames=seeded_usernames(volumes[DbUser]),
+            )
+            report = LoadReport()
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    run_terminal(
+                        build_operations(
+                            target,
+                            CredentialCache(
+                                max_size=Configuration.CREDENTIAL_CACHE__MAX_SIZE,
+                                ttl=Configuration.CREDENTIAL_CACHE__TTL,
+                            ),
+                            ListCache(
+                                max_size=Configuration.LIST_CACHE__MAX_SIZE,
+                                ttl=Configuration.LIST_CACHE__TTL,
+                            ),
+                        ),
+                        mix,
+                        think_time,
+                        start + duration,
+                        random.Random(None if seed is None else seed + terminal),
+                        report,
+                    )
+                    for terminal in range(terminals)
+                )
+            )
+            report.elapsed = time.perf_counter() - start
+            return report
+    finally:
+        await async_engine.dispose()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.load_simulator",
+        description="Runs simulated POS terminals against one database.",
+    )
+    parser.add_argument("--terminals", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.1,
+        help="mean pause between two operations of a terminal, in seconds",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_operation_mix,
+        default=None,
+        help="operation weights, e.g. login=1,update_position=3. "
+        f"Operations: {', '.join(DEFAULT_OPERATION_MIX)}",
+    )
+    parser.add_argument("--database-url", default=SQLITE_MEMORY_URL)
+    parser.add_argument(
+        "--scale", type=float, default=0.1, help="multiplier of the rows seeded"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        report = asyncio.run(
+            simulate(
+                args.terminals,
+                args.duration,
+                mix=args.mix,
+                think_time=args.think_time,
+                database_url=args.database_url,
+                scale=args.scale,
+                seed=args.seed,
+            )
+        )
+    except DatabaseNotEmptyError as dnee:
+        print(dnee, file=sys.stderr)
+        return 1
+    print(report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
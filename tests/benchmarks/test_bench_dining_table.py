@@ -0,0 +1,166 @@
+from functools import partial
+
+import pytest
+
+from src.app.ops import app_ops_dining_table
+from src.app.ops.utils import app_ops_utils
+from src.persistence.database.models.db_dining_table import DbDiningTable
+from src.persistence.database.ops import db_batch_ops_dining_table
+from src.schemas import schema_dining_table
+from tests.benchmarks.bench_utils import (
+    async_benchmark_session_scope,
+    seeded_database,
+    select_ids,
+)
+
+PAGE_SIZE = 20
+SORT_BY = "name"
+BULK_SIZE = 100
+
+
+def _create_request(index: int):
+    return schema_dining_table.SchemaDiningTableCreate(
+        name=f"bench{index}", x=index % 500, y=index % 500, width=40, height=40
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_create_dining_table(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        insert_dining_table_func = partial(
+            db_batch_ops_dining_table.insert_dining_table,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+
+        async def create_dining_table():
+            await app_ops_dining_table.create_dining_table(
+                _create_request(0), insert_dining_table_func=insert_dining_table_func
+            )
+
+        await benchmark_recorder.measure(
+            "dining_table.create_dining_table", create_dining_table
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_create_dining_tables(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        insert_dining_tables_func = partial(
+            db_batch_ops_dining_table.insert_dining_tables,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+        requests = [_create_request(index) for index in range(BULK_SIZE)]
+
+        async def create_dining_tables():
+            await app_ops_dining_table.create_dining_tables(
+                requests, insert_dining_tables_func=insert_dining_tables_func
+            )
+
+        await benchmark_recorder.measure(
+            f"dining_table.create_dining_tables[{BULK_SIZE}]", create_dining_tables
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_update_position(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        (dining_table_id,) = await select_ids(DbDiningTable, 1)
+        update_position_func = partial(
+            db_batch_ops_dining_table.update_position,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+
+        async def update_position():
+            await app_ops_dining_table.update_position(
+                dining_table_id,
+                schema_dining_table.SchemaUpdatePosition(x=10, y=10),
+                update_position_func=update_position_func,
+            )
+
+        await benchmark_recorder.measure(
+            "dining_table.update_position", update_position
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_update_dining_tables(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        dining_table_ids = await select_ids(DbDiningTable, BULK_SIZE)
+        update_dining_tables_func = partial(
+            db_batch_ops_dining_table.update_dining_tables,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+        requests = {
+            dining_table_id: schema_dining_table.SchemaUpdateDiningTable(
+                x=index, y=index
+            )
+            for index, dining_table_id in enumerate(dining_table_ids)
+        }
+
+        async def update_dining_tables():
+            await app_ops_dining_table.update_dining_tables(
+                requests, update_dining_tables_func=update_dining_tables_func
+            )
+
+        await benchmark_recorder.measure(
+            f"dining_table.update_dining_tables[{len(requests)}]",
+            update_dining_tables,
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_select_dining_table_list(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale) as volumes:
+        last_page_index = volumes[DbDiningTable] // PAGE_SIZE - 1
+        select_dining_table_list_func = partial(
+            db_batch_ops_dining_table.select_dining_table_list,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+
+        async def select_page(page_index, after=None):
+            return await select_dining_table_list_func(
+                page_index, PAGE_SIZE, SORT_BY, after
+            )
+
+        await benchmark_recorder.measure(
+            "dining_table.select_dining_table_list.first_page",
+            partial(select_page, 0),
+        )
+        await benchmark_recorder.measure(
+            "dining_table.select_dining_table_list.last_page_offset",
+            partial(select_page, last_page_index),
+        )
+
+        previous_page = await select_page(last_page_index - 1)
+        after = app_ops_utils.get_next_cursor(previous_page, SORT_BY)
+        await benchmark_recorder.measure(
+            "dining_table.select_dining_table_list.last_page_keyset",
+            partial(select_page, 0, after),
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_get_dining_table_list_cached(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        select_dining_table_list_func = partial(
+            db_batch_ops_dining_table.select_dining_table_list,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+
+        async def get_dining_table_list():
+            await app_ops_dining_table.get_dining_table_list(
+                0,
+                PAGE_SIZE,
+                SORT_BY,
+                select_dining_table_list_func=select_dining_table_list_func,
+            )
+
+        await benchmark_recorder.measure(
+            "dining_table.get_dining_table_list.cached", get_dining_table_list
+        )
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable
+
+import pytest
+
+from src.app.ops import app_ops_menu, app_ops_tag
+from src.persistence.database.models.db_menu import DbMenu
+from src.persistence.database.models.db_tag import DbTag
+from src.persistence.database.ops import db_batch_ops_menu, db_batch_ops_tag
+from src.schemas import schema_menu, schema_tag
+from tests.benchmarks.bench_utils import (
+    async_benchmark_session_scope,
+    seeded_database,
+    select_ids,
+)
+
+PAGE_SIZE = 20
+SORT_BY = "name"
+
+
+@dataclass(frozen=True)
+class NamedEntity:
+    """
+    The ops of an entity whose records only have a name, i.e. menus and tags.
+    The benchmarks are recorded as e.g. "menu.create_menu".
+    """
+
+    name: str
+    entity_type: type
+    create_func: Callable
+    insert_func: Callable
+    create_schema: type
+    update_name_func: Callable
+    batch_update_name_func: Callable
+    update_name_schema: type
+    select_list_func: Callable
+
+
+NAMED_ENTITIES = [
+    NamedEntity(
+        name="menu",
+        entity_type=DbMenu,
+        create_func=app_ops_menu.create_menu,
+        insert_func=db_batch_ops_menu.insert_menu,
+        create_schema=schema_menu.SchemaMenuCreate,
+        update_name_func=app_ops_menu.update_name,
+        batch_update_name_func=db_batch_ops_menu.update_name,
+        update_name_schema=schema_menu.SchemaUpdateName,
+        select_list_func=db_batch_ops_menu.select_menu_list,
+    ),
+    NamedEntity(
+        name="tag",
+        entity_type=DbTag,
+        create_func=app_ops_tag.create_tag,
+        insert_func=db_batch_ops_tag.insert_tag,
+        create_schema=schema_tag.SchemaTagCreate,
+        update_name_func=app_ops_tag.update_name,
+        batch_update_name_func=db_batch_ops_tag.update_name,
+        update_name_schema=schema_tag.SchemaUpdateName,
+        select_list_func=db_batch_ops_tag.select_tag_list,
+    ),
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("entity", NAMED_ENTITIES, ids=lambda entity: entity.name)
+async def test_bench_create(benchmark_recorder, benchmark_scale, entity):
+    async with seeded_database(benchmark_scale):
+        insert_func = partial(
+            entity.insert_func,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+
+        async def create():
+            await entity.create_func(
+                entity.create_schema(name="bench"),
+                **{f"insert_{entity.name}_func": insert_func},
+            )
+
+        await benchmark_recorder.measure(f"{entity.name}.create_{entity.name}", create)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("entity", NAMED_ENTITIES, ids=lambda entity: entity.name)
+async def test_bench_update_name(benchmark_recorder, benchmark_scale, entity):
+    async with seeded_database(benchmark_scale):
+        (entity_id,) = await select_ids(entity.entity_type, 1)
+        update_name_func = partial(
+            entity.batch_update_name_func,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+
+        async def update_name():
+            await entity.update_name_func(
+                entity_id,
+                entity.update_name_schema(name="bench"),
+                update_name_func=update_name_func,
+            )
+
+        await benchmark_recorder.measure(f"{entity.name}.update_name", update_name)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("entity", NAMED_ENTITIES, ids=lambda entity: entity.name)
+async def test_bench_select_list(benchmark_recorder, benchmark_scale, entity):
+    async with seeded_database(benchmark_scale) as volumes:
+        last_page_index = volumes[entity.entity_type] // PAGE_SIZE - 1
+        select_list_func = partial(
+            entity.select_list_func,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+        name = f"{entity.name}.select_{entity.name}_list"
+
+        await benchmark_recorder.measure(
+            f"{name}.first_page",
+            partial(select_list_func, 0, PAGE_SIZE, SORT_BY),
+        )
+        await benchmark_recorder.measure(
+            f"{name}.last_page_offset",
+            partial(select_list_func, last_page_index, PAGE_SIZE, SORT_BY),
+        )
@@ -0,0 +1,74 @@
+from functools import partial
+
+import pytest
+
+from src.app.ops import app_ops_user
+from src.app.ops.utils.credential_cache import CredentialCache
+from src.persistence.database.ops import db_batch_ops_user
+from tests.benchmarks.bench_utils import (
+    SEED_PASSWORD,
+    async_benchmark_session_scope,
+    seeded_database,
+)
+
+PAGE_SIZE = 20
+SORT_BY = "username"
+# bcrypt makes each login take a noticeable fraction of a second.
+LOGIN_ROUNDS = 5
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_login(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        select_user_by_username_and_password_func = partial(
+            db_batch_ops_user.select_user_by_username_and_password,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+        disabled_credential_cache = CredentialCache(max_size=0, ttl=0)
+
+        async def login():
+            assert await app_ops_user.login(
+                "user0",
+                SEED_PASSWORD,
+                select_user_by_username_and_password_func=select_user_by_username_and_password_func,
+                credential_cache=disabled_credential_cache,
+            )
+
+        await benchmark_recorder.measure("user.login", login, rounds=LOGIN_ROUNDS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_login_cached(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        select_user_by_username_and_password_func = partial(
+            db_batch_ops_user.select_user_by_username_and_password,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+        credential_cache = CredentialCache(max_size=10, ttl=60)
+
+        async def login():
+            assert await app_ops_user.login(
+                "user0",
+                SEED_PASSWORD,
+                select_user_by_username_and_password_func=select_user_by_username_and_password_func,
+                credential_cache=credential_cache,
+            )
+
+        await benchmark_recorder.measure("user.login.cached", login)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bench_select_user_list(benchmark_recorder, benchmark_scale):
+    async with seeded_database(benchmark_scale):
+        select_user_list_func = partial(
+            db_batch_ops_user.select_user_list,
+            async_session_scope_func=async_benchmark_session_scope,
+        )
+
+        await benchmark_recorder.measure(
+            "user.select_user_list.first_page",
+            partial(select_user_list_func, 0, PAGE_SIZE, SORT_BY),
+        )
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from tests.benchmarks import compare_reports
+from tests.benchmarks.bench_utils import BenchmarkRecorder, summarise
+
+
+def test_summarise():
+    results = summarise([0.1, 0.3, 0.2])
+    assert results["rounds"] == 3
+    assert results["min"] == 0.1
+    assert results["max"] == 0.3
+    assert results["median"] == 0.2
+    assert results["mean"] == pytest.approx(0.2)
+    assert results["ops_per_second"] == pytest.approx(5)
+
+
+@pytest.mark.asyncio
+async def test_recorder_write_report(tmp_path):
+    recorder = BenchmarkRecorder(rounds=3, metadata={"scale": 1})
+
+    async def func():
+        pass
+
+    await recorder.measure("noop", func)
+    report_path = tmp_path / "report.json"
+    recorder.write_report(str(report_path))
+
+    report = json.loads(report_path.read_text())
+    assert report["metadata"] == {"scale": 1}
+    assert report["benchmarks"]["noop"]["rounds"] == 3
+
+
+def test_compare_reports():
+    baseline = {"benchmarks": {"a": {"median": 0.2}, "b": {"median": 0.1}}}
+    candidate = {"benchmarks": {"a": {"median": 0.1}, "c": {"median": 0.3}}}
+
+    assert compare_reports.compare_reports(baseline, candidate) == [
+        ("a", 0.2, 0.1, -0.5),
+        ("b", 0.1, None, None),
+        ("c", None, 0.3, None),
+    ]
+
+
+def test_main_usage():
+    assert compare_reports.main([]) == 2
@@ -0,0 +1,152 @@
+import random
+
+import pytest
+import sqlalchemy
+from sqlalchemy import insert, select
+
+from src.persistence.database.models.db_menu import DbMenu
+from src.persistence.database.models.db_tag import DbTag
+from tests.benchmarks import load_simulator
+from tests.benchmarks.bench_utils import DatabaseNotEmptyError, seeded_database
+
+
+def test_percentile():
+    timings = [float(value) for value in range(1, 101)]
+    assert load_simulator.percentile(timings, 50) == 50
+    assert load_simulator.percentile(timings, 95) == 95
+    assert load_simulator.percentile(timings, 99) == 99
+    assert load_simulator.percentile([0.5], 99) == 0.5
+
+
+def test_summarise_latencies():
+    result = load_simulator.summarise_latencies([0.3, 0.1, 0.2, 0.4], 2.0, errors=1)
+    assert result["count"] == 4
+    assert result["errors"] == 1
+    assert result["ops_per_second"] == 2
+    assert result["p50"] == 0.2
+    assert result["p99"] == 0.4
+    assert result["max"] == 0.4
+
+
+def test_parse_operation_mix():
+    assert load_simulator.parse_operation_mix("login=1, update_position=2.5") == {
+        "login": 1,
+        "update_position": 2.5,
+    }
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("checkout=1", "Unknown operation: checkout."),
+        ("login=many", "Invalid weight for login: many."),
+        ("login=-1", "Invalid weight for login: -1."),
+        ("login=0", "No operation has a positive weight."),
+    ],
+)
+def test_parse_operation_mix_invalid(text, message):
+    with pytest.raises(ValueError, match=message):
+        load_simulator.parse_operation_mix(text)
+
+
+def test_load_report_summary():
+    report = load_simulator.LoadReport(elapsed=1.0)
+    report.record("login", 0.2)
+    report.record("get_menu_list", 0.01)
+    report.record("get_menu_list", 0.03, ValueError())
+    summary = report.summary()
+    assert list(summary) == ["get_menu_list", "login", "total"]
+    assert summary["get_menu_list"]["errors"] == 1
+    assert summary["total"]["count"] == 3
+    assert summary["total"]["errors"] == 1
+    assert "get_menu_list" in report.format()
+
+
+@pytest.mark.asyncio
+async def test_run_terminal():
+    clock_values = iter(range(100))
+    calls = []
+
+    async def operation(rng):
+        calls.append(rng)
+
+    report = load_simulator.LoadReport()
+    await load_simulator.run_terminal(
+        {"login": operation, "get_menu_list": operation},
+        {"login": 1, "get_menu_list": 0},
+        0.0,
+        6,
+        random.Random(0),
+        report,
+        clock=lambda: next(clock_values),
+    )
+    # The clock is read before, at the start and at the end of every operation.
+    assert len(calls) == 2
+    assert list(report.timings) == ["login"]
+
+
+@pytest.mark.asyncio
+async def test_simulate():
+    report = await load_simulator.simulate(
+        terminals=3,
+        duration=0.2,
+        mix={"get_dining_table_list": 1, "update_position": 1, "update_tag_name": 1},
+        scale=0.01,
+        seed=1,
+    )
+    summary = report.summary()
+    assert summary["total"]["count"] > 0
+    assert summary["total"]["errors"] == 0
+    assert set(summary) <= {
+        "get_dining_table_list",
+        "update_position",
+        "update_tag_name",
+        "total",
+    }
+
+
+@pytest.mark.asyncio
+async def test_seeded_database_refuses_existing_tables():
+    async_engine = load_simulator.create_engine(load_simulator.SQLITE_MEMORY_URL)
+    try:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(DbMenu.__table__.create)
+            await conn.execute(insert(DbMenu).values(name="menu1"))
+
+        with pytest.raises(DatabaseNotEmptyError, match="menu"):
+            async with seeded_database(0.01, async_engine):
+                pytest.fail("The database was seeded unexpectedly.")
+
+        async with async_engine.connect() as conn:
+            assert (await conn.execute(select(DbMenu.name))).scalars().all() == [
+                "menu1"
+            ]
+            assert not await conn.run_sync(
+                lambda sync_conn: sqlalchemy.inspect(sync_conn).has_table(
+                    DbTag.__tablename__
+                )
+            )
+    finally:
+        await async_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_seeded_database_drops_its_tables():
+    async_engine = load_simulator.create_engine(load_simulator.SQLITE_MEMORY_URL)
+    try:
+        async with seeded_database(0.01, async_engine):
+            pass
+        async with seeded_database(0.01, async_engine) as volumes:
+            assert volumes[DbMenu] == 20
+    finally:
+        await async_engine.dispose()
+
+
+def test_main_database_not_empty(monkeypatch, capsys):
+    async def mock_simulate(*args, **kwargs):
+        raise DatabaseNotEmptyError("The database already contains the tables menu.")
+
+    monkeypatch.setattr(load_simulator, "simulate", mock_simulate)
+
+    assert load_simulator.main(["--duration", "0"]) == 1
+    assert "already contains the tables menu" in capsys.readouterr().err
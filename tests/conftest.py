@@ -0,0 +1,55 @@
+import pytest
+
+from src.app.ops.utils.credential_cache import default_credential_cache
+from src.app.ops.utils.list_cache import default_list_cache
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the tests marked as benchmark, which are skipped otherwise.",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Path of the JSON report written by the benchmarks.",
+    )
+    group.addoption(
+        "--benchmark-scale",
+        type=float,
+        default=1,
+        help="Multiplier applied to the number of rows seeded by the benchmarks.",
+    )
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=None,
+        help="Number of timed rounds per benchmark.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing test, only run with --run-benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --run-benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(autouse=True)
+def clear_default_caches():
+    default_list_cache.clear()
+    default_credential_cache.clear()
+    yield
+    default_list_cache.clear()
+    default_credential_cache.clear()
@@ -13,6 +13,19 @@ from src.schemas import schema_dining_table
 from tests.persistence.database.ops.mock_utils import mock_async_session_scope_factory
 
 
+def make_db_dining_table(dining_table_id=None):
+    return DbDiningTable(
+        id=dining_table_id or uuid.uuid4(),
+        name="testtable",
+        x=5,
+        y=10,
+        width=30,
+        height=40,
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+
+
 @pytest.mark.asyncio
 async def test_insert_dining_table():
     request = schema_dining_table.SchemaDiningTableCreate(
@@ -41,7 +54,7 @@ async def test_insert_dining_table():
     assert isinstance(new_dining_table, schema_dining_table.SchemaDiningTableDisplay)
     mock_insert_dining_table_func.assert_awaited_once()
     mock_async_session.commit.assert_awaited_once()
-    mock_async_session.refresh.assert_awaited_once()
+    mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
 
 
@@ -145,9 +158,9 @@ async def test_update_position():
     request = schema_dining_table.SchemaUpdatePosition(x=20, y=25)
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_position_func = AsyncMock(return_value=1)
+    mock_update_position_func = AsyncMock(return_value=[make_db_dining_table()])
 
-    rowcount = await db_batch_ops_dining_table.update_position(
+    updated_dining_tables = await db_batch_ops_dining_table.update_position(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -157,7 +170,11 @@ async def test_update_position():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 1
+    assert len(updated_dining_tables) == 1
+    assert all(
+        isinstance(updated_dining_table, schema_dining_table.SchemaDiningTableDisplay)
+        for updated_dining_table in updated_dining_tables
+    )
 
 
 @pytest.mark.asyncio
@@ -186,9 +203,9 @@ async def test_update_position_no_rows_affected():
     request = schema_dining_table.SchemaUpdatePosition(x=20, y=25)
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_position_func = AsyncMock(return_value=0)
+    mock_update_position_func = AsyncMock(return_value=[])
 
-    rowcount = await db_batch_ops_dining_table.update_position(
+    updated_dining_tables = await db_batch_ops_dining_table.update_position(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -198,7 +215,7 @@ async def test_update_position_no_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 0
+    assert updated_dining_tables == []
 
 
 @pytest.mark.asyncio
@@ -206,9 +223,11 @@ async def test_update_position_multiple_rows_affected():
     request = schema_dining_table.SchemaUpdatePosition(x=20, y=25)
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_position_func = AsyncMock(return_value=5)
+    mock_update_position_func = AsyncMock(
+        return_value=[make_db_dining_table() for _ in range(5)]
+    )
 
-    rowcount = await db_batch_ops_dining_table.update_position(
+    updated_dining_tables = await db_batch_ops_dining_table.update_position(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -218,7 +237,11 @@ async def test_update_position_multiple_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 5
+    assert len(updated_dining_tables) == 5
+    assert all(
+        isinstance(updated_dining_table, schema_dining_table.SchemaDiningTableDisplay)
+        for updated_dining_table in updated_dining_tables
+    )
 
 
 @pytest.mark.asyncio
@@ -226,9 +249,9 @@ async def test_update_size():
     request = schema_dining_table.SchemaUpdateSize(width=50, height=100)
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_size_func = AsyncMock(return_value=1)
+    mock_update_size_func = AsyncMock(return_value=[make_db_dining_table()])
 
-    rowcount = await db_batch_ops_dining_table.update_size(
+    updated_dining_tables = await db_batch_ops_dining_table.update_size(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -238,7 +261,11 @@ async def test_update_size():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 1
+    assert len(updated_dining_tables) == 1
+    assert all(
+        isinstance(updated_dining_table, schema_dining_table.SchemaDiningTableDisplay)
+        for updated_dining_table in updated_dining_tables
+    )
 
 
 @pytest.mark.asyncio
@@ -267,9 +294,9 @@ async def test_update_size_no_rows_affected():
     request = schema_dining_table.SchemaUpdateSize(width=50, height=100)
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_size_func = AsyncMock(return_value=0)
+    mock_update_size_func = AsyncMock(return_value=[])
 
-    rowcount = await db_batch_ops_dining_table.update_size(
+    updated_dining_tables = await db_batch_ops_dining_table.update_size(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -279,7 +306,7 @@ async def test_update_size_no_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 0
+    assert updated_dining_tables == []
 
 
 @pytest.mark.asyncio
@@ -287,9 +314,11 @@ async def test_update_size_multiple_rows_affected():
     request = schema_dining_table.SchemaUpdateSize(width=50, height=100)
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_size_func = AsyncMock(return_value=5)
+    mock_update_size_func = AsyncMock(
+        return_value=[make_db_dining_table() for _ in range(5)]
+    )
 
-    rowcount = await db_batch_ops_dining_table.update_size(
+    updated_dining_tables = await db_batch_ops_dining_table.update_size(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -299,7 +328,11 @@ async def test_update_size_multiple_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 5
+    assert len(updated_dining_tables) == 5
+    assert all(
+        isinstance(updated_dining_table, schema_dining_table.SchemaDiningTableDisplay)
+        for updated_dining_table in updated_dining_tables
+    )
 
 
 @pytest.mark.asyncio
@@ -307,9 +340,9 @@ async def test_update_name():
     request = schema_dining_table.SchemaUpdateName(name="TableName")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=1)
+    mock_update_name_func = AsyncMock(return_value=[make_db_dining_table()])
 
-    rowcount = await db_batch_ops_dining_table.update_name(
+    updated_dining_tables = await db_batch_ops_dining_table.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -319,7 +352,11 @@ async def test_update_name():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 1
+    assert len(updated_dining_tables) == 1
+    assert all(
+        isinstance(updated_dining_table, schema_dining_table.SchemaDiningTableDisplay)
+        for updated_dining_table in updated_dining_tables
+    )
 
 
 @pytest.mark.asyncio
@@ -348,9 +385,9 @@ async def test_update_name_no_rows_affected():
     request = schema_dining_table.SchemaUpdateName(name="TableName")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=0)
+    mock_update_name_func = AsyncMock(return_value=[])
 
-    rowcount = await db_batch_ops_dining_table.update_name(
+    updated_dining_tables = await db_batch_ops_dining_table.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -360,7 +397,7 @@ async def test_update_name_no_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 0
+    assert updated_dining_tables == []
 
 
 @pytest.mark.asyncio
@@ -368,9 +405,11 @@ async def test_update_name_multiple_rows_affected():
     request = schema_dining_table.SchemaUpdateName(name="TableName")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=5)
+    mock_update_name_func = AsyncMock(
+        return_value=[make_db_dining_table() for _ in range(5)]
+    )
 
-    rowcount = await db_batch_ops_dining_table.update_name(
+    updated_dining_tables = await db_batch_ops_dining_table.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -380,7 +419,11 @@ async def test_update_name_multiple_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 5
+    assert len(updated_dining_tables) == 5
+    assert all(
+        isinstance(updated_dining_table, schema_dining_table.SchemaDiningTableDisplay)
+        for updated_dining_table in updated_dining_tables
+    )
 
 
 @pytest.mark.asyncio
@@ -443,3 +486,194 @@ async def test_select_dining_table_list_db_error():
             select_dining_table_list_func=mock_select_dining_table_list_func,
         )
     mock_select_dining_table_list_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_insert_dining_tables():
+    requests = [
+        schema_dining_table.SchemaDiningTableCreate(
+            name=f"testtable{i}", x=5, y=10, width=30, height=40
+        )
+        for i in range(2)
+    ]
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+
+    mock_insert_dining_tables_func = AsyncMock(
+        return_value=[
+            DbDiningTable(
+                id=uuid.uuid4(),
+                name=request.name,
+                x=request.x,
+                y=request.y,
+                width=request.width,
+                height=request.height,
+                created_on=datetime.now(),
+                last_updated_on=datetime.now(),
+            )
+            for request in requests
+        ]
+    )
+
+    new_dining_tables = await db_batch_ops_dining_table.insert_dining_tables(
+        requests,
+        async_session_scope_func=mock_async_session_scope,
+        insert_dining_tables_func=mock_insert_dining_tables_func,
+    )
+    assert [dining_table.name for dining_table in new_dining_tables] == [
+        "testtable0",
+        "testtable1",
+    ]
+    assert all(
+        isinstance(dining_table, schema_dining_table.SchemaDiningTableDisplay)
+        for dining_table in new_dining_tables
+    )
+    mock_insert_dining_tables_func.assert_awaited_once()
+    mock_async_session.commit.assert_awaited_once()
+    mock_async_session.refresh.assert_not_called()
+    mock_async_session.rollback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_insert_dining_tables_db_error():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_insert_dining_tables_func = AsyncMock()
+    mock_insert_dining_tables_func.side_effect = PersistenceOpsBaseError()
+
+    with pytest.raises(PersistenceOpsBaseError):
+        await db_batch_ops_dining_table.insert_dining_tables(
+            [
+                schema_dining_table.SchemaDiningTableCreate(
+                    name="testtable", x=5, y=10, width=30, height=40
+                )
+            ],
+            async_session_scope_func=mock_async_session_scope,
+            insert_dining_tables_func=mock_insert_dining_tables_func,
+        )
+
+    mock_insert_dining_tables_func.assert_awaited_once()
+    mock_async_session.commit.assert_not_called()
+    mock_async_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_positions():
+    dining_table_id = uuid.uuid4()
+    requests = {dining_table_id: schema_dining_table.SchemaUpdatePosition(x=20, y=25)}
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+
+    mock_update_positions_func = AsyncMock(
+        return_value=[make_db_dining_table(dining_table_id)]
+    )
+
+    updated_dining_tables = await db_batch_ops_dining_table.update_positions(
+        requests,
+        async_session_scope_func=mock_async_session_scope,
+        update_positions_func=mock_update_positions_func,
+    )
+    mock_update_positions_func.assert_awaited_once_with(mock_async_session, requests)
+    mock_async_session.commit.assert_awaited_once()
+    mock_async_session.rollback.assert_not_called()
+    assert [
+        updated_dining_table.id for updated_dining_table in updated_dining_tables
+    ] == [dining_table_id]
+
+
+@pytest.mark.asyncio
+async def test_update_positions_db_error():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+
+    mock_update_positions_func = AsyncMock()
+    mock_update_positions_func.side_effect = PersistenceOpsBaseError()
+
+    with pytest.raises(PersistenceOpsBaseError):
+        await db_batch_ops_dining_table.update_positions(
+            {uuid.uuid4(): schema_dining_table.SchemaUpdatePosition(x=20, y=25)},
+            async_session_scope_func=mock_async_session_scope,
+            update_positions_func=mock_update_positions_func,
+        )
+    mock_update_positions_func.assert_awaited_once()
+    mock_async_session.commit.assert_not_called()
+    mock_async_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_dining_tables():
+    dining_table_ids = [uuid.uuid4(), uuid.uuid4()]
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+
+    mock_delete_dining_tables_func = AsyncMock(return_value=dining_table_ids[:1])
+
+    deleted_ids = await db_batch_ops_dining_table.delete_dining_tables(
+        dining_table_ids,
+        async_session_scope_func=mock_async_session_scope,
+        delete_dining_tables_func=mock_delete_dining_tables_func,
+    )
+    mock_delete_dining_tables_func.assert_awaited_once_with(
+        mock_async_session, dining_table_ids
+    )
+    mock_async_session.commit.assert_awaited_once()
+    mock_async_session.rollback.assert_not_called()
+    assert deleted_ids == dining_table_ids[:1]
+
+
+@pytest.mark.asyncio
+async def test_delete_dining_tables_db_error():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+
+    mock_delete_dining_tables_func = AsyncMock()
+    mock_delete_dining_tables_func.side_effect = PersistenceOpsBaseError()
+
+    with pytest.raises(PersistenceOpsBaseError):
+        await db_batch_ops_dining_table.delete_dining_tables(
+            [uuid.uuid4()],
+            async_session_scope_func=mock_async_session_scope,
+            delete_dining_tables_func=mock_delete_dining_tables_func,
+        )
+    mock_delete_dining_tables_func.assert_awaited_once()
+    mock_async_session.commit.assert_not_called()
+    mock_async_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables():
+    dining_table_id = uuid.uuid4()
+    requests = {
+        dining_table_id: schema_dining_table.SchemaUpdateDiningTable(x=20, name="t1")
+    }
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+
+    mock_update_dining_tables_func = AsyncMock(
+        return_value=[make_db_dining_table(dining_table_id)]
+    )
+
+    updated_dining_tables = await db_batch_ops_dining_table.update_dining_tables(
+        requests,
+        async_session_scope_func=mock_async_session_scope,
+        update_dining_tables_func=mock_update_dining_tables_func,
+    )
+    mock_update_dining_tables_func.assert_awaited_once_with(
+        mock_async_session, requests, expected_last_updated_on=None
+    )
+    mock_async_session.commit.assert_awaited_once()
+    mock_async_session.rollback.assert_not_called()
+    assert [
+        updated_dining_table.id for updated_dining_table in updated_dining_tables
+    ] == [dining_table_id]
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables_db_error():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+
+    mock_update_dining_tables_func = AsyncMock()
+    mock_update_dining_tables_func.side_effect = PersistenceOpsBaseError()
+
+    with pytest.raises(PersistenceOpsBaseError):
+        await db_batch_ops_dining_table.update_dining_tables(
+            {uuid.uuid4(): schema_dining_table.SchemaUpdateDiningTable(x=20)},
+            async_session_scope_func=mock_async_session_scope,
+            update_dining_tables_func=mock_update_dining_tables_func,
+        )
+    mock_update_dining_tables_func.assert_awaited_once()
+    mock_async_session.commit.assert_not_called()
+    mock_async_session.rollback.assert_awaited_once()
@@ -13,6 +13,15 @@ from src.schemas import schema_menu
 from tests.persistence.database.ops.mock_utils import mock_async_session_scope_factory
 
 
+def make_db_menu(menu_id=None):
+    return DbMenu(
+        id=menu_id or uuid.uuid4(),
+        name="testmenu",
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+
+
 @pytest.mark.asyncio
 async def test_insert_menu():
     request = schema_menu.SchemaMenuCreate(name="testmenu")
@@ -35,7 +44,7 @@ async def test_insert_menu():
     assert isinstance(new_menu, schema_menu.SchemaMenuDisplay)
     mock_insert_menu_func.assert_awaited_once()
     mock_async_session.commit.assert_awaited_once()
-    mock_async_session.refresh.assert_awaited_once()
+    mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
 
 
@@ -137,9 +146,9 @@ async def test_update_name():
     request = schema_menu.SchemaUpdateName(name="NewMenu")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=1)
+    mock_update_name_func = AsyncMock(return_value=[make_db_menu()])
 
-    rowcount = await db_batch_ops_menu.update_name(
+    updated_menus = await db_batch_ops_menu.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -149,7 +158,11 @@ async def test_update_name():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 1
+    assert len(updated_menus) == 1
+    assert all(
+        isinstance(updated_menu, schema_menu.SchemaMenuDisplay)
+        for updated_menu in updated_menus
+    )
 
 
 @pytest.mark.asyncio
@@ -178,9 +191,9 @@ async def test_update_name_no_rows_affected():
     request = schema_menu.SchemaUpdateName(name="NewMenu")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=0)
+    mock_update_name_func = AsyncMock(return_value=[])
 
-    rowcount = await db_batch_ops_menu.update_name(
+    updated_menus = await db_batch_ops_menu.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -190,7 +203,7 @@ async def test_update_name_no_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 0
+    assert updated_menus == []
 
 
 @pytest.mark.asyncio
@@ -198,9 +211,9 @@ async def test_update_name_multiple_rows_affected():
     request = schema_menu.SchemaUpdateName(name="NewMenu")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=5)
+    mock_update_name_func = AsyncMock(return_value=[make_db_menu() for _ in range(5)])
 
-    rowcount = await db_batch_ops_menu.update_name(
+    updated_menus = await db_batch_ops_menu.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -210,7 +223,11 @@ async def test_update_name_multiple_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 5
+    assert len(updated_menus) == 5
+    assert all(
+        isinstance(updated_menu, schema_menu.SchemaMenuDisplay)
+        for updated_menu in updated_menus
+    )
 
 
 @pytest.mark.asyncio
@@ -318,3 +335,38 @@ async def test_select_menu_by_id_db_error():
             select_menu_by_id_func=mock_select_menu_by_id_func,
         )
     mock_select_menu_by_id_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus():
+    requests = [schema_menu.SchemaMenuUpsert(id=uuid.uuid4(), name="testmenu")]
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_upsert_menus_func = AsyncMock(return_value=[make_db_menu()])
+
+    upserted_menus = await db_batch_ops_menu.upsert_menus(
+        requests,
+        async_session_scope_func=mock_async_session_scope,
+        upsert_menus_func=mock_upsert_menus_func,
+    )
+    assert len(upserted_menus) == 1
+    assert isinstance(upserted_menus[0], schema_menu.SchemaMenuDisplay)
+    mock_upsert_menus_func.assert_awaited_once_with(mock_async_session, requests)
+    mock_async_session.commit.assert_awaited_once()
+    mock_async_session.rollback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus_db_error():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_upsert_menus_func = AsyncMock(side_effect=PersistenceOpsBaseError())
+
+    with pytest.raises(PersistenceOpsBaseError):
+        await db_batch_ops_menu.upsert_menus(
+            [schema_menu.SchemaMenuUpsert(id=uuid.uuid4(), name="testmenu")],
+            async_session_scope_func=mock_async_session_scope,
+            upsert_menus_func=mock_upsert_menus_func,
+        )
+
+    mock_upsert_menus_func.assert_awaited_once()
+    mock_async_session.commit.assert_not_called()
+    mock_async_session.rollback.assert_awaited_once()
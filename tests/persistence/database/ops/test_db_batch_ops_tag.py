@@ -13,6 +13,15 @@ from src.schemas import schema_tag
 from tests.persistence.database.ops.mock_utils import mock_async_session_scope_factory
 
 
+def make_db_tag(tag_id=None):
+    return DbTag(
+        id=tag_id or uuid.uuid4(),
+        name="testtag",
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+
+
 @pytest.mark.asyncio
 async def test_insert_tag():
     request = schema_tag.SchemaTagCreate(name="testtag")
@@ -35,7 +44,7 @@ async def test_insert_tag():
     assert isinstance(new_tag, schema_tag.SchemaTagDisplay)
     mock_insert_tag_func.assert_awaited_once()
     mock_async_session.commit.assert_awaited_once()
-    mock_async_session.refresh.assert_awaited_once()
+    mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
 
 
@@ -137,9 +146,9 @@ async def test_update_name():
     request = schema_tag.SchemaUpdateName(name="NewTag")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=1)
+    mock_update_name_func = AsyncMock(return_value=[make_db_tag()])
 
-    rowcount = await db_batch_ops_tag.update_name(
+    updated_tags = await db_batch_ops_tag.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -149,7 +158,11 @@ async def test_update_name():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 1
+    assert len(updated_tags) == 1
+    assert all(
+        isinstance(updated_tag, schema_tag.SchemaTagDisplay)
+        for updated_tag in updated_tags
+    )
 
 
 @pytest.mark.asyncio
@@ -178,9 +191,9 @@ async def test_update_name_no_rows_affected():
     request = schema_tag.SchemaUpdateName(name="NewTag")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=0)
+    mock_update_name_func = AsyncMock(return_value=[])
 
-    rowcount = await db_batch_ops_tag.update_name(
+    updated_tags = await db_batch_ops_tag.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -190,7 +203,7 @@ async def test_update_name_no_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 0
+    assert updated_tags == []
 
 
 @pytest.mark.asyncio
@@ -198,9 +211,9 @@ async def test_update_name_multiple_rows_affected():
     request = schema_tag.SchemaUpdateName(name="NewTag")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_name_func = AsyncMock(return_value=5)
+    mock_update_name_func = AsyncMock(return_value=[make_db_tag() for _ in range(5)])
 
-    rowcount = await db_batch_ops_tag.update_name(
+    updated_tags = await db_batch_ops_tag.update_name(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -210,7 +223,11 @@ async def test_update_name_multiple_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 5
+    assert len(updated_tags) == 5
+    assert all(
+        isinstance(updated_tag, schema_tag.SchemaTagDisplay)
+        for updated_tag in updated_tags
+    )
 
 
 @pytest.mark.asyncio
@@ -316,3 +333,38 @@ async def test_select_tag_by_id_db_error():
             select_tag_by_id_func=mock_select_tag_by_id_func,
         )
     mock_select_tag_by_id_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_tags():
+    requests = [schema_tag.SchemaTagUpsert(id=uuid.uuid4(), name="testtag")]
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_upsert_tags_func = AsyncMock(return_value=[make_db_tag()])
+
+    upserted_tags = await db_batch_ops_tag.upsert_tags(
+        requests,
+        async_session_scope_func=mock_async_session_scope,
+        upsert_tags_func=mock_upsert_tags_func,
+    )
+    assert len(upserted_tags) == 1
+    assert isinstance(upserted_tags[0], schema_tag.SchemaTagDisplay)
+    mock_upsert_tags_func.assert_awaited_once_with(mock_async_session, requests)
+    mock_async_session.commit.assert_awaited_once()
+    mock_async_session.rollback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_tags_db_error():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_upsert_tags_func = AsyncMock(side_effect=PersistenceOpsBaseError())
+
+    with pytest.raises(PersistenceOpsBaseError):
+        await db_batch_ops_tag.upsert_tags(
+            [schema_tag.SchemaTagUpsert(id=uuid.uuid4(), name="testtag")],
+            async_session_scope_func=mock_async_session_scope,
+            upsert_tags_func=mock_upsert_tags_func,
+        )
+
+    mock_upsert_tags_func.assert_awaited_once()
+    mock_async_session.commit.assert_not_called()
+    mock_async_session.rollback.assert_awaited_once()
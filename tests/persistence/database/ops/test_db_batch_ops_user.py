@@ -1,6 +1,7 @@
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
@@ -14,6 +15,16 @@ from src.utils import bcrypt_hash
 from tests.persistence.database.ops.mock_utils import mock_async_session_scope_factory
 
 
+def make_db_user(user_id=None):
+    return DbUser(
+        id=user_id or uuid.uuid4(),
+        username="testuser",
+        password_hash="hash",
+        created_on=datetime.now(),
+        last_updated_on=datetime.now(),
+    )
+
+
 @pytest.mark.asyncio
 async def test_insert_user():
     request = schema_user.SchemaUserCreate(username="testuser", password="testuser")
@@ -37,7 +48,7 @@ async def test_insert_user():
     assert isinstance(new_user, schema_user.SchemaUserDisplay)
     mock_insert_user_func.assert_awaited_once()
     mock_async_session.commit.assert_awaited_once()
-    mock_async_session.refresh.assert_awaited_once()
+    mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
 
 
@@ -139,9 +150,9 @@ async def test_update_password():
     request = schema_user.SchemaChangePassword(new_password="new_password")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_password_func = AsyncMock(return_value=1)
+    mock_update_password_func = AsyncMock(return_value=[make_db_user()])
 
-    rowcount = await db_batch_ops_user.update_password(
+    updated_users = await db_batch_ops_user.update_password(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -151,7 +162,11 @@ async def test_update_password():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 1
+    assert len(updated_users) == 1
+    assert all(
+        isinstance(updated_user, schema_user.SchemaUserDisplay)
+        for updated_user in updated_users
+    )
 
 
 @pytest.mark.asyncio
@@ -180,9 +195,9 @@ async def test_update_password_no_rows_affected():
     request = schema_user.SchemaChangePassword(new_password="new_password")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_password_func = AsyncMock(return_value=0)
+    mock_update_password_func = AsyncMock(return_value=[])
 
-    rowcount = await db_batch_ops_user.update_password(
+    updated_users = await db_batch_ops_user.update_password(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -192,7 +207,7 @@ async def test_update_password_no_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 0
+    assert updated_users == []
 
 
 @pytest.mark.asyncio
@@ -200,9 +215,11 @@ async def test_update_password_multiple_rows_affected():
     request = schema_user.SchemaChangePassword(new_password="new_password")
     mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
 
-    mock_update_password_func = AsyncMock(return_value=5)
+    mock_update_password_func = AsyncMock(
+        return_value=[make_db_user() for _ in range(5)]
+    )
 
-    rowcount = await db_batch_ops_user.update_password(
+    updated_users = await db_batch_ops_user.update_password(
         uuid.uuid4(),
         request,
         async_session_scope_func=mock_async_session_scope,
@@ -212,7 +229,11 @@ async def test_update_password_multiple_rows_affected():
     mock_async_session.commit.assert_awaited_once()
     mock_async_session.refresh.assert_not_called()
     mock_async_session.rollback.assert_not_called()
-    assert rowcount == 5
+    assert len(updated_users) == 5
+    assert all(
+        isinstance(updated_user, schema_user.SchemaUserDisplay)
+        for updated_user in updated_users
+    )
 
 
 @pytest.mark.asyncio
@@ -497,3 +518,115 @@ async def test_select_user_by_username_and_password_db_error():
             select_user_by_username_func=mock_select_user_by_username_func,
         )
     mock_select_user_by_username_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users():
+    requests = [
+        schema_user.SchemaUserCreate(username="existinguser", password="oldpassword"),
+        schema_user.SchemaUserCreate(username="testuser", password="testpassword"),
+    ]
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_select_existing_usernames_func = AsyncMock(return_value={"existinguser"})
+    mock_upsert_users_func = AsyncMock(return_value=[make_db_user()])
+
+    with patch.object(
+        bcrypt_hash, "bcrypt_async", wraps=bcrypt_hash.bcrypt_async
+    ) as mock_bcrypt_async:
+        upserted_users = await db_batch_ops_user.upsert_users(
+            requests,
+            async_session_scope_func=mock_async_session_scope,
+            upsert_users_func=mock_upsert_users_func,
+            select_existing_usernames_func=mock_select_existing_usernames_func,
+        )
+    assert len(upserted_users) == 1
+    assert isinstance(upserted_users[0], schema_user.SchemaUserDisplay)
+    mock_select_existing_usernames_func.assert_awaited_once_with(
+        mock_async_session, ["existinguser", "testuser"]
+    )
+    # Only the new user's password was hashed.
+    mock_bcrypt_async.assert_awaited_once_with("testpassword")
+    mock_upsert_users_func.assert_awaited_once()
+    (_, password_hashes), kwargs = mock_upsert_users_func.await_args
+    assert kwargs == {"update_passwords": False}
+    assert list(password_hashes) == ["testuser"]
+    assert bcrypt_hash.verify_bcrypt("testpassword", password_hashes["testuser"])
+    mock_async_session.commit.assert_awaited_once()
+    mock_async_session.rollback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_hashes_outside_the_session():
+    requests = [
+        schema_user.SchemaUserCreate(username="testuser", password="testpassword")
+    ]
+    session_open = False
+
+    @asynccontextmanager
+    async def mock_async_session_scope():
+        nonlocal session_open
+        session_open = True
+        try:
+            yield AsyncMock()
+        finally:
+            session_open = False
+
+    async def mock_bcrypt_async(password):
+        assert not session_open
+        return "hash"
+
+    mock_upsert_users_func = AsyncMock(return_value=[make_db_user()])
+    with patch.object(bcrypt_hash, "bcrypt_async", side_effect=mock_bcrypt_async):
+        await db_batch_ops_user.upsert_users(
+            requests,
+            update_passwords=True,
+            async_session_scope_func=mock_async_session_scope,
+            upsert_users_func=mock_upsert_users_func,
+        )
+    mock_upsert_users_func.assert_awaited_once_with(
+        ANY, {"testuser": "hash"}, update_passwords=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_all_existing():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_upsert_users_func = AsyncMock()
+
+    assert (
+        await db_batch_ops_user.upsert_users(
+            [
+                schema_user.SchemaUserCreate(
+                    username="testuser", password="testpassword"
+                )
+            ],
+            async_session_scope_func=mock_async_session_scope,
+            upsert_users_func=mock_upsert_users_func,
+            select_existing_usernames_func=AsyncMock(return_value={"testuser"}),
+        )
+        == []
+    )
+    mock_upsert_users_func.assert_not_called()
+    mock_async_session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_db_error():
+    mock_async_session_scope, mock_async_session = mock_async_session_scope_factory()
+    mock_upsert_users_func = AsyncMock(side_effect=PersistenceOpsBaseError())
+
+    with pytest.raises(PersistenceOpsBaseError):
+        await db_batch_ops_user.upsert_users(
+            [
+                schema_user.SchemaUserCreate(
+                    username="testuser", password="testpassword"
+                )
+            ],
+            async_session_scope_func=mock_async_session_scope,
+            upsert_users_func=mock_upsert_users_func,
+            select_existing_usernames_func=AsyncMock(return_value=set()),
+        )
+
+    mock_upsert_users_func.assert_awaited_once()
+    mock_async_session.commit.assert_not_called()
+    mock_async_session.rollback.assert_awaited_once()
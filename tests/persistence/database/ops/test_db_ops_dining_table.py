@@ -5,18 +5,27 @@ import pytest
 from src.persistence.database.models.db_dining_table import DbDiningTable
 from src.persistence.database.ops.db_ops_dining_table import (
     delete_dining_table,
+    delete_dining_tables,
     insert_dining_table,
+    insert_dining_tables,
     select_dining_table_list,
+    update_dining_tables,
     update_name,
     update_position,
+    update_positions,
     update_size,
 )
+from src.persistence.interface.ops.exceptions.ops_exceptions import (
+    PersistenceOpsBaseError,
+)
 from src.schemas.schema_dining_table import (
     SchemaDiningTableCreate,
+    SchemaUpdateDiningTable,
     SchemaUpdateName,
     SchemaUpdatePosition,
     SchemaUpdateSize,
 )
+from src.utils import paging_cursor
 from tests.persistence.database.ops.mock_utils import (
     async_testing_session_scope,
     reset_test_database,
@@ -152,11 +161,13 @@ async def test_update_position():
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].x == 5
             assert results[0].y == 10
-            rowcount = await update_position(
+            updated_records = await update_position(
                 async_session, results[0].id, SchemaUpdatePosition(x=15, y=20)
             )
+            assert len(updated_records) == 1
+            assert updated_records[0].x == 15
+            assert updated_records[0].y == 20
             await async_session.commit()
-            assert rowcount == 1
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].x == 15
             assert results[0].y == 20
@@ -164,6 +175,43 @@ async def test_update_position():
             await reset_test_database()
 
 
+@pytest.mark.asyncio
+async def test_update_position_stale_last_updated_on():
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            new_record = await insert_dining_table(
+                async_session,
+                SchemaDiningTableCreate(
+                    name="NewTable", x=5, y=10, width=50, height=100
+                ),
+            )
+            await async_session.commit()
+            await async_session.refresh(new_record)
+            record_id = new_record.id
+            read_version = new_record.last_updated_on
+
+            # Written by another terminal after the table was read.
+            await update_size(
+                async_session, record_id, SchemaUpdateSize(width=60, height=70)
+            )
+            await async_session.commit()
+
+            updated_records = await update_position(
+                async_session,
+                record_id,
+                SchemaUpdatePosition(x=15, y=20),
+                expected_last_updated_on=read_version,
+            )
+            await async_session.commit()
+            assert updated_records == []
+            results = await select_dining_table_list(async_session, 0, 10, "created_on")
+            assert results[0].x == 5
+            assert results[0].width == 60
+        finally:
+            await reset_test_database()
+
+
 @pytest.mark.asyncio
 async def test_update_position_not_found():
     await setup_test_database()
@@ -180,11 +228,11 @@ async def test_update_position_not_found():
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].x == 5
             assert results[0].y == 10
-            rowcount = await update_position(
+            updated_records = await update_position(
                 async_session, uuid.uuid4(), SchemaUpdatePosition(x=15, y=20)
             )
             await async_session.commit()
-            assert rowcount == 0
+            assert updated_records == []
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].x == 5
             assert results[0].y == 10
@@ -208,13 +256,13 @@ async def test_update_size():
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].width == 50
             assert results[0].height == 100
-            rowcount = await update_size(
+            updated_records = await update_size(
                 async_session,
                 results[0].id,
                 SchemaUpdateSize(width=150, height=200),
             )
             await async_session.commit()
-            assert rowcount == 1
+            assert len(updated_records) == 1
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].width == 150
             assert results[0].height == 200
@@ -238,11 +286,11 @@ async def test_update_size_not_found():
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].width == 50
             assert results[0].height == 100
-            rowcount = await update_size(
+            updated_records = await update_size(
                 async_session, uuid.uuid4(), SchemaUpdateSize(width=150, height=200)
             )
             await async_session.commit()
-            assert rowcount == 0
+            assert updated_records == []
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].width == 50
             assert results[0].height == 100
@@ -265,13 +313,13 @@ async def test_update_name():
             await async_session.refresh(new_record)
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTable"
-            rowcount = await update_name(
+            updated_records = await update_name(
                 async_session,
                 results[0].id,
                 SchemaUpdateName(name="NewTableNewName"),
             )
             await async_session.commit()
-            assert rowcount == 1
+            assert len(updated_records) == 1
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTableNewName"
         finally:
@@ -293,11 +341,11 @@ async def test_update_name_not_found():
             await async_session.refresh(new_record)
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTable"
-            rowcount = await update_name(
+            updated_records = await update_name(
                 async_session, uuid.uuid4(), SchemaUpdateName(name="NewTableNewName")
             )
             await async_session.commit()
-            assert rowcount == 0
+            assert updated_records == []
             results = await select_dining_table_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTable"
         finally:
@@ -373,3 +421,274 @@ async def test_select_dining_table_list():
 
         finally:
             await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_select_dining_table_list_after():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            for name, width in [("T1", 50), ("T2", 60), ("T3", 50), ("T4", 60)]:
+                await insert_dining_table(
+                    async_session,
+                    SchemaDiningTableCreate(
+                        name=name, x=5, y=10, width=width, height=100
+                    ),
+                )
+            await async_session.commit()
+
+            sort_by = "width desc, name"
+            expected = await select_dining_table_list(async_session, 0, 10, sort_by)
+
+            page_1 = await select_dining_table_list(async_session, 0, 3, sort_by)
+            assert page_1 == expected[:3]
+
+            after = paging_cursor.encode_cursor(page_1[-1], sort_by)
+            page_2 = await select_dining_table_list(async_session, 0, 3, sort_by, after)
+            assert page_2 == expected[3:]
+
+            after = paging_cursor.encode_cursor(page_2[-1], sort_by)
+            page_3 = await select_dining_table_list(async_session, 0, 3, sort_by, after)
+            assert len(page_3) == 0
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_select_dining_table_list_after_sort_mismatch():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            await insert_dining_table(
+                async_session,
+                SchemaDiningTableCreate(name="T1", x=5, y=10, width=50, height=100),
+            )
+            await async_session.commit()
+            results = await select_dining_table_list(async_session, 0, 10, "name")
+            after = paging_cursor.encode_cursor(results[0], "name")
+            with pytest.raises(PersistenceOpsBaseError):
+                await select_dining_table_list(async_session, 0, 10, "width", after)
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_select_dining_table_list_invalid_sort_by():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            with pytest.raises(PersistenceOpsBaseError):
+                await select_dining_table_list(async_session, 0, 10, "nme")
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_insert_dining_tables():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            new_records = await insert_dining_tables(
+                async_session,
+                [
+                    SchemaDiningTableCreate(
+                        name=f"NewTable{i}", x=i, y=i + 1, width=50, height=100
+                    )
+                    for i in range(5)
+                ],
+            )
+            assert [new_record.name for new_record in new_records] == [
+                f"NewTable{i}" for i in range(5)
+            ]
+            assert all(new_record.id is not None for new_record in new_records)
+            assert all(new_record.created_on is not None for new_record in new_records)
+            await async_session.commit()
+            results = await select_dining_table_list(async_session, 0, 10, "name")
+            assert len(results) == 5
+            assert results[3].x == 3
+            assert results[3].y == 4
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_insert_dining_tables_none():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            assert await insert_dining_tables(async_session, []) == []
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_update_positions():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            new_records = await insert_dining_tables(
+                async_session,
+                [
+                    SchemaDiningTableCreate(
+                        name=f"NewTable{i}", x=5, y=10, width=50, height=100
+                    )
+                    for i in range(3)
+                ],
+            )
+            new_ids = [new_record.id for new_record in new_records]
+            await async_session.commit()
+
+            missing_id = uuid.uuid4()
+            updated_records = await update_positions(
+                async_session,
+                {
+                    new_ids[0]: SchemaUpdatePosition(x=15, y=20),
+                    new_ids[2]: SchemaUpdatePosition(x=25, y=30),
+                    missing_id: SchemaUpdatePosition(x=1, y=1),
+                },
+            )
+            assert sorted(record.id for record in updated_records) == sorted(
+                [new_ids[0], new_ids[2]]
+            )
+            await async_session.commit()
+
+            results = await select_dining_table_list(async_session, 0, 10, "name")
+            assert [(result.x, result.y) for result in results] == [
+                (15, 20),
+                (5, 10),
+                (25, 30),
+            ]
+            assert all(result.width == 50 for result in results)
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_delete_dining_tables():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            new_records = await insert_dining_tables(
+                async_session,
+                [
+                    SchemaDiningTableCreate(
+                        name=f"NewTable{i}", x=5, y=10, width=50, height=100
+                    )
+                    for i in range(3)
+                ],
+            )
+            new_ids = [new_record.id for new_record in new_records]
+            await async_session.commit()
+
+            deleted_ids = await delete_dining_tables(
+                async_session, [new_ids[0], new_ids[1], uuid.uuid4()]
+            )
+            await async_session.commit()
+            assert sorted(deleted_ids) == sorted(new_ids[:2])
+
+            results = await select_dining_table_list(async_session, 0, 10, "name")
+            assert [result.id for result in results] == [new_ids[2]]
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            new_records = await insert_dining_tables(
+                async_session,
+                [
+                    SchemaDiningTableCreate(
+                        name=f"NewTable{i}", x=5, y=10, width=50, height=100
+                    )
+                    for i in range(3)
+                ],
+            )
+            new_ids = [new_record.id for new_record in new_records]
+            await async_session.commit()
+
+            updated_records = await update_dining_tables(
+                async_session,
+                {
+                    new_ids[0]: SchemaUpdateDiningTable(x=15, width=60),
+                    new_ids[1]: SchemaUpdateDiningTable(name="Renamed"),
+                    new_ids[2]: SchemaUpdateDiningTable(),
+                },
+            )
+            assert sorted(record.id for record in updated_records) == sorted(
+                new_ids[:2]
+            )
+            await async_session.commit()
+
+            results = await select_dining_table_list(async_session, 0, 10, "name")
+            assert [
+                (result.name, result.x, result.y, result.width) for result in results
+            ] == [
+                ("NewTable0", 15, 10, 60),
+                ("NewTable2", 5, 10, 50),
+                ("Renamed", 5, 10, 50),
+            ]
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_update_dining_tables_expected_last_updated_on():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            new_records = await insert_dining_tables(
+                async_session,
+                [
+                    SchemaDiningTableCreate(
+                        name=f"NewTable{i}", x=5, y=10, width=50, height=100
+                    )
+                    for i in range(3)
+                ],
+            )
+            new_ids = [new_record.id for new_record in new_records]
+            read_versions = [new_record.last_updated_on for new_record in new_records]
+            await async_session.commit()
+
+            # Written by another terminal after the tables were read.
+            await update_size(
+                async_session, new_ids[1], SchemaUpdateSize(width=60, height=70)
+            )
+            await async_session.commit()
+
+            updated_records = await update_dining_tables(
+                async_session,
+                {new_id: SchemaUpdateDiningTable(x=15) for new_id in new_ids},
+                expected_last_updated_on={
+                    new_ids[0]: read_versions[0],
+                    new_ids[1]: read_versions[1],
+                },
+            )
+            assert sorted(record.id for record in updated_records) == sorted(
+                [new_ids[0], new_ids[2]]
+            )
+            assert all(
+                record.last_updated_on not in read_versions
+                for record in updated_records
+            )
+            await async_session.commit()
+
+            results = await select_dining_table_list(async_session, 0, 10, "name")
+            assert [(result.x, result.width) for result in results] == [
+                (15, 50),
+                (5, 60),
+                (15, 50),
+            ]
+        finally:
+            await reset_test_database()
@@ -9,8 +9,14 @@ from src.persistence.database.ops.db_ops_menu import (
     select_menu_by_id,
     select_menu_list,
     update_name,
+    upsert_menus,
+)
+from src.persistence.database.utils import upsert_utils
+from src.schemas.schema_menu import (
+    SchemaMenuCreate,
+    SchemaMenuUpsert,
+    SchemaUpdateName,
 )
-from src.schemas.schema_menu import SchemaMenuCreate, SchemaUpdateName
 from tests.persistence.database.ops.mock_utils import (
     async_testing_session_scope,
     reset_test_database,
@@ -127,13 +133,13 @@ async def test_update_name():
             await async_session.refresh(new_record)
             results = await select_menu_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewMenu"
-            rowcount = await update_name(
+            updated_records = await update_name(
                 async_session,
                 results[0].id,
                 SchemaUpdateName(name="NewMenuNewName"),
             )
             await async_session.commit()
-            assert rowcount == 1
+            assert len(updated_records) == 1
             results = await select_menu_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewMenuNewName"
         finally:
@@ -153,17 +159,58 @@ async def test_update_name_not_found():
             await async_session.refresh(new_record)
             results = await select_menu_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewMenu"
-            rowcount = await update_name(
+            updated_records = await update_name(
                 async_session, uuid.uuid4(), SchemaUpdateName(name="NewMenuNewName")
             )
             await async_session.commit()
-            assert rowcount == 0
+            assert updated_records == []
             results = await select_menu_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewMenu"
         finally:
             await reset_test_database()
 
 
+@pytest.mark.asyncio
+async def test_update_name_expected_last_updated_on():
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            new_record = await insert_menu(
+                async_session,
+                SchemaMenuCreate(name="NewMenu"),
+            )
+            await async_session.commit()
+            await async_session.refresh(new_record)
+            record_id = new_record.id
+            read_version = new_record.last_updated_on
+
+            updated_records = await update_name(
+                async_session,
+                record_id,
+                SchemaUpdateName(name="NewMenuNewName"),
+                expected_last_updated_on=read_version,
+            )
+            await async_session.commit()
+            assert len(updated_records) == 1
+
+            # Another write with the version read before the first one.
+            updated_records = await update_name(
+                async_session,
+                record_id,
+                SchemaUpdateName(name="NewMenuOtherName"),
+                expected_last_updated_on=read_version,
+            )
+            await async_session.commit()
+            assert updated_records == []
+
+            menu = await select_menu_by_id(async_session, record_id)
+            await async_session.refresh(menu)
+            assert menu.name == "NewMenuNewName"
+            assert menu.last_updated_on != read_version
+        finally:
+            await reset_test_database()
+
+
 @pytest.mark.asyncio
 async def test_select_menu_list():
 
@@ -255,3 +302,85 @@ async def test_select_menu_by_id_not_found():
             assert menu is None
         finally:
             await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus():
+    existing_id = uuid.uuid4()
+    unchanged_id = uuid.uuid4()
+    new_id = uuid.uuid4()
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            await upsert_menus(
+                async_session,
+                [
+                    SchemaMenuUpsert(id=existing_id, name="OldMenu"),
+                    SchemaMenuUpsert(id=unchanged_id, name="UnchangedMenu"),
+                ],
+            )
+            upserted_records = await upsert_menus(
+                async_session,
+                [
+                    SchemaMenuUpsert(id=existing_id, name="RenamedMenu"),
+                    SchemaMenuUpsert(id=unchanged_id, name="UnchangedMenu"),
+                    SchemaMenuUpsert(id=new_id, name="NewMenu"),
+                ],
+            )
+            assert all(isinstance(record, DbMenu) for record in upserted_records)
+            assert {(record.id, record.name) for record in upserted_records} == {
+                (existing_id, "RenamedMenu"),
+                (new_id, "NewMenu"),
+            }
+            results = await select_menu_list(async_session, 0, 10, "name")
+            assert [result.name for result in results] == [
+                "NewMenu",
+                "RenamedMenu",
+                "UnchangedMenu",
+            ]
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus_duplicate_ids():
+
+    menu_id = uuid.uuid4()
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            upserted_records = await upsert_menus(
+                async_session,
+                [
+                    SchemaMenuUpsert(id=menu_id, name="FirstMenu"),
+                    SchemaMenuUpsert(id=menu_id, name="LastMenu"),
+                ],
+            )
+            assert len(upserted_records) == 1
+            assert upserted_records[0].name == "LastMenu"
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_menus_in_chunks(monkeypatch):
+    monkeypatch.setattr(upsert_utils, "UPSERT_CHUNK_SIZE", 2)
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            upserted_records = await upsert_menus(
+                async_session,
+                [
+                    SchemaMenuUpsert(id=uuid.uuid4(), name=f"Menu{index}")
+                    for index in range(5)
+                ],
+            )
+            assert len(upserted_records) == 5
+            results = await select_menu_list(async_session, 0, 10, "name")
+            assert [result.name for result in results] == [
+                f"Menu{index}" for index in range(5)
+            ]
+        finally:
+            await reset_test_database()
@@ -9,8 +9,13 @@ from src.persistence.database.ops.db_ops_tag import (
     select_tag_by_id,
     select_tag_list,
     update_name,
+    upsert_tags,
+)
+from src.schemas.schema_tag import (
+    SchemaTagCreate,
+    SchemaTagUpsert,
+    SchemaUpdateName,
 )
-from src.schemas.schema_tag import SchemaTagCreate, SchemaUpdateName
 from tests.persistence.database.ops.mock_utils import (
     async_testing_session_scope,
     reset_test_database,
@@ -127,13 +132,13 @@ async def test_update_name():
             await async_session.refresh(new_record)
             results = await select_tag_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTag"
-            rowcount = await update_name(
+            updated_records = await update_name(
                 async_session,
                 results[0].id,
                 SchemaUpdateName(name="NewTagNewName"),
             )
             await async_session.commit()
-            assert rowcount == 1
+            assert len(updated_records) == 1
             results = await select_tag_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTagNewName"
         finally:
@@ -153,11 +158,11 @@ async def test_update_name_not_found():
             await async_session.refresh(new_record)
             results = await select_tag_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTag"
-            rowcount = await update_name(
+            updated_records = await update_name(
                 async_session, uuid.uuid4(), SchemaUpdateName(name="NewTagNewName")
             )
             await async_session.commit()
-            assert rowcount == 0
+            assert updated_records == []
             results = await select_tag_list(async_session, 0, 10, "created_on")
             assert results[0].name == "NewTag"
         finally:
@@ -255,3 +260,62 @@ async def test_select_tag_by_id_not_found():
             assert tag is None
         finally:
             await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_tags():
+    existing_id = uuid.uuid4()
+    unchanged_id = uuid.uuid4()
+    new_id = uuid.uuid4()
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            await upsert_tags(
+                async_session,
+                [
+                    SchemaTagUpsert(id=existing_id, name="OldTag"),
+                    SchemaTagUpsert(id=unchanged_id, name="UnchangedTag"),
+                ],
+            )
+            upserted_records = await upsert_tags(
+                async_session,
+                [
+                    SchemaTagUpsert(id=existing_id, name="RenamedTag"),
+                    SchemaTagUpsert(id=unchanged_id, name="UnchangedTag"),
+                    SchemaTagUpsert(id=new_id, name="NewTag"),
+                ],
+            )
+            assert all(isinstance(record, DbTag) for record in upserted_records)
+            assert {(record.id, record.name) for record in upserted_records} == {
+                (existing_id, "RenamedTag"),
+                (new_id, "NewTag"),
+            }
+            results = await select_tag_list(async_session, 0, 10, "name")
+            assert [result.name for result in results] == [
+                "NewTag",
+                "RenamedTag",
+                "UnchangedTag",
+            ]
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_tags_duplicate_ids():
+
+    tag_id = uuid.uuid4()
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            upserted_records = await upsert_tags(
+                async_session,
+                [
+                    SchemaTagUpsert(id=tag_id, name="FirstTag"),
+                    SchemaTagUpsert(id=tag_id, name="LastTag"),
+                ],
+            )
+            assert len(upserted_records) == 1
+            assert upserted_records[0].name == "LastTag"
+        finally:
+            await reset_test_database()
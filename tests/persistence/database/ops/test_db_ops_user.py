@@ -6,10 +6,12 @@ from src.persistence.database.models.db_user import DbUser
 from src.persistence.database.ops.db_ops_user import (
     delete_user,
     insert_user,
+    select_existing_usernames,
     select_user_by_id,
     select_user_by_username,
     select_user_list,
     update_password,
+    upsert_users,
 )
 from src.schemas.schema_user import SchemaChangePassword, SchemaUserCreate
 from src.utils import bcrypt_hash
@@ -131,13 +133,13 @@ async def test_update_password():
             results = await select_user_list(async_session, 0, 10, "created_on")
             password_hash_b4_update = results[0].password_hash
             assert password_hash_b4_update is not None
-            rowcount = await update_password(
+            updated_records = await update_password(
                 async_session,
                 results[0].id,
                 SchemaChangePassword(new_password="newpassword"),
             )
             await async_session.commit()
-            assert rowcount == 1
+            assert len(updated_records) == 1
             results = await select_user_list(async_session, 0, 10, "created_on")
             assert results[0].password_hash is not None
             assert results[0].password_hash != password_hash_b4_update
@@ -162,13 +164,13 @@ async def test_update_password_not_found():
             results = await select_user_list(async_session, 0, 10, "created_on")
             password_hash_b4_update = results[0].password_hash
             assert password_hash_b4_update is not None
-            rowcount = await update_password(
+            updated_records = await update_password(
                 async_session,
                 uuid.uuid4(),
                 SchemaChangePassword(new_password="newpassword"),
             )
             await async_session.commit()
-            assert rowcount == 0
+            assert updated_records == []
             results = await select_user_list(async_session, 0, 10, "created_on")
             assert results[0].password_hash == password_hash_b4_update
             assert bcrypt_hash.verify_bcrypt("thepassword", results[0].password_hash)
@@ -343,3 +345,88 @@ async def test_select_user_by_username_not_found():
 
         finally:
             await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            first_records = await upsert_users(
+                async_session, {"ExistingUser": bcrypt_hash.bcrypt("oldpassword")}
+            )
+            existing_id = first_records[0].id
+            upserted_records = await upsert_users(
+                async_session,
+                {
+                    "ExistingUser": bcrypt_hash.bcrypt("newpassword"),
+                    "NewUser": bcrypt_hash.bcrypt("thepassword"),
+                },
+                update_passwords=True,
+            )
+            assert len(upserted_records) == 2
+            assert all(isinstance(record, DbUser) for record in upserted_records)
+            existing_user = await select_user_by_username(async_session, "ExistingUser")
+            assert existing_user.id == existing_id
+            assert await bcrypt_hash.verify_bcrypt_async(
+                "newpassword", existing_user.password_hash
+            )
+            results = await select_user_list(async_session, 0, 10, "username")
+            assert [result.username for result in results] == [
+                "ExistingUser",
+                "NewUser",
+            ]
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_keeps_existing_passwords():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            await upsert_users(
+                async_session, {"ExistingUser": bcrypt_hash.bcrypt("oldpassword")}
+            )
+            upserted_records = await upsert_users(
+                async_session,
+                {
+                    "ExistingUser": bcrypt_hash.bcrypt("newpassword"),
+                    "NewUser": bcrypt_hash.bcrypt("thepassword"),
+                },
+            )
+            assert [record.username for record in upserted_records] == ["NewUser"]
+            existing_user = await select_user_by_username(async_session, "ExistingUser")
+            assert await bcrypt_hash.verify_bcrypt_async(
+                "oldpassword", existing_user.password_hash
+            )
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_select_existing_usernames():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            await upsert_users(async_session, {"ExistingUser": "hash"})
+            assert await select_existing_usernames(
+                async_session, ["ExistingUser", "NewUser"]
+            ) == {"ExistingUser"}
+            assert await select_existing_usernames(async_session, []) == set()
+        finally:
+            await reset_test_database()
+
+
+@pytest.mark.asyncio
+async def test_upsert_users_no_requests():
+
+    await setup_test_database()
+    async with async_testing_session_scope() as async_session:
+        try:
+            assert await upsert_users(async_session, {}) == []
+        finally:
+            await reset_test_database()
@@ -1,8 +1,11 @@
+from types import SimpleNamespace
+
 import pytest
 from sqlalchemy import Column, Integer, String, select
 
 from src.persistence.database.session import Base
 from src.persistence.database.utils import query_utils
+from src.utils import paging_cursor
 
 
 # Mock entity type
@@ -31,7 +34,9 @@ def evaluate_order_by_clause(sort_by: str, expected_order_by_clause: str):
         if not expected_order_by_clause.endswith("DESC"):
             assert f"{expected_order_by_clause} DESC" not in str(final_query)
     else:
-        assert "ORDER BY" not in str(final_query)
+        # Only the tiebreaker is used when no sort order is specified.
+        assert "ORDER BY mock_entities.id" in str(final_query)
+        assert "ORDER BY mock_entities.id DESC" not in str(final_query)
 
 
 @pytest.mark.asyncio
@@ -171,3 +176,109 @@ async def test_apply_sorting_and_paging_to_list_query_3_col():
 async def test_apply_sorting_and_paging_to_list_query_none():
     evaluate_order_by_clause(None, None)
     evaluate_order_by_clause("", None)
+
+
+def build_cursor(sort_by: str, **values):
+    return paging_cursor.encode_cursor(SimpleNamespace(**values), sort_by)
+
+
+def test_apply_sorting_and_paging_to_list_query_after():
+    after = build_cursor("username", username="bob", id=5)
+    final_query = query_utils.apply_sorting_and_paging_to_list_query(
+        select(MockEntity), MockEntity, 3, 10, "username", after
+    )
+    sql = str(final_query)
+    assert "(mock_entities.username, mock_entities.id) > (" in sql
+    assert "ORDER BY mock_entities.username, mock_entities.id" in sql
+    assert "OFFSET" not in sql
+    assert sorted(map(str, final_query.compile().params.values())) == [
+        "10",
+        "5",
+        "bob",
+    ]
+
+
+def test_apply_sorting_and_paging_to_list_query_after_desc():
+    after = build_cursor("username DESC, id DESC", username="bob", id=5)
+    sql = str(
+        query_utils.apply_sorting_and_paging_to_list_query(
+            select(MockEntity), MockEntity, 0, 10, "username DESC, id DESC", after
+        )
+    )
+    assert "(mock_entities.username, mock_entities.id) < (" in sql
+
+
+def test_apply_sorting_and_paging_to_list_query_after_mixed_directions():
+    after = build_cursor("username DESC", username="bob", id=5)
+    sql = str(
+        query_utils.apply_sorting_and_paging_to_list_query(
+            select(MockEntity), MockEntity, 0, 10, "username DESC", after
+        )
+    )
+    assert "mock_entities.username < " in sql
+    assert "mock_entities.username = " in sql
+    assert "mock_entities.id > " in sql
+    assert "ORDER BY mock_entities.username DESC, mock_entities.id" in sql
+
+
+def test_apply_sorting_and_paging_to_list_query_after_sort_mismatch():
+    after = build_cursor("username", username="bob", id=5)
+    with pytest.raises(ValueError, match="Cursor does not match the sort order."):
+        query_utils.apply_sorting_and_paging_to_list_query(
+            select(MockEntity), MockEntity, 0, 10, "created_on", after
+        )
+
+
+def test_apply_sorting_and_paging_to_list_query_after_invalid():
+    with pytest.raises(ValueError, match="Invalid cursor."):
+        query_utils.apply_sorting_and_paging_to_list_query(
+            select(MockEntity), MockEntity, 0, 10, "username", "garbage"
+        )
+
+    after = build_cursor(None, id="not a number")
+    with pytest.raises(ValueError, match="Invalid cursor."):
+        query_utils.apply_sorting_and_paging_to_list_query(
+            select(MockEntity), MockEntity, 0, 10, None, after
+        )
+
+
+def test_compile_sort_spec_appends_tiebreaker():
+    compiled = query_utils.compile_sort_spec(MockEntity, "username DESC")
+    assert compiled.column_names == ["username", "id"]
+    assert [is_descending for _, is_descending in compiled.sort_spec] == [
+        True,
+        False,
+    ]
+
+    compiled = query_utils.compile_sort_spec(MockEntity, "id DESC, username")
+    assert compiled.column_names == ["id", "username"]
+
+
+def test_compile_sort_spec_cached():
+    query_utils.compile_sort_spec.cache_clear()
+
+    compiled = query_utils.compile_sort_spec(MockEntity, "created_on DESC, username")
+    assert query_utils.compile_sort_spec.cache_info().misses == 1
+
+    assert (
+        query_utils.compile_sort_spec(MockEntity, "created_on DESC, username")
+        is compiled
+    )
+    assert query_utils.compile_sort_spec.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "sort_by, message",
+    [
+        ("usernme", "Invalid sort column: usernme."),
+        ("username, password", "Invalid sort column: password."),
+        ("username DOWN", "Invalid sort direction: username DOWN."),
+        ("username ASC DESC", "Invalid sort direction: username ASC DESC."),
+        ("username,", "Invalid sort_by: username,."),
+        ("username, username DESC", "Duplicate sort column: username."),
+        ("metadata", "Invalid sort column: metadata."),
+    ],
+)
+def test_compile_sort_spec_invalid(sort_by, message):
+    with pytest.raises(ValueError, match=message):
+        query_utils.compile_sort_spec(MockEntity, sort_by)
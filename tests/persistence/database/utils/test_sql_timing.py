@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.persistence.database.ops import db_ops_menu
+from src.persistence.database.session import Base
+from src.persistence.database.utils import sql_timing
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        (
+            "SELECT *\n  FROM menu\n WHERE name = 'main' LIMIT 10",
+            "SELECT * FROM menu WHERE name = ? LIMIT ?",
+        ),
+        (
+            "SELECT * FROM menu WHERE id IN (?, ?, ?)",
+            "SELECT * FROM menu WHERE id IN (?)",
+        ),
+        (
+            "SELECT * FROM menu WHERE id IN ($1, $2) AND name = %(name)s",
+            "SELECT * FROM menu WHERE id IN (?) AND name = ?",
+        ),
+        (
+            "INSERT INTO tag (name, id) VALUES (?, ?), (?, ?), (?, ?)",
+            "INSERT INTO tag (name, id) VALUES (?, ?)",
+        ),
+        (
+            "SELECT CAST(x AS INT), x::int FROM t WHERE y = :y",
+            "SELECT CAST(x AS INT), x::int FROM t WHERE y = ?",
+        ),
+    ],
+)
+def test_normalize_sql(statement, expected):
+    assert sql_timing.normalize_sql(statement) == expected
+
+
+def test_describe_parameters():
+    assert sql_timing.describe_parameters(None) == "none"
+    assert sql_timing.describe_parameters(("a", 1)) == "2 positional"
+    assert sql_timing.describe_parameters({"b": 1, "a": "secret"}) == "(a, b)"
+    assert (
+        sql_timing.describe_parameters([("a", 1), ("b", 2)], executemany=True)
+        == "2 x 2 positional"
+    )
+
+
+def test_find_calling_function():
+    def db_function():
+        return sql_timing.find_calling_function(module_prefix=__name__)
+
+    assert db_function() == f"{__name__}.db_function"
+    assert sql_timing.find_calling_function(module_prefix="no.such.module") is None
+
+
+@pytest.mark.asyncio
+async def test_recorder():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    slow_queries = []
+    recorder = sql_timing.SqlTimingRecorder(
+        slow_query_threshold=0, on_slow_query=slow_queries.append
+    )
+    recorder.attach(engine)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        recorder.reset()
+        slow_queries.clear()
+
+        async with async_sessionmaker(bind=engine)() as async_session:
+            for _ in range(2):
+                await db_ops_menu.select_menu_list(async_session, 0, 10, "name")
+
+        stats = recorder.stats()
+        assert len(stats) == 1
+        ((sql, result),) = stats.items()
+        assert sql.startswith("SELECT menu.name, menu.id")
+        assert sql.endswith("LIMIT ? OFFSET ?")
+        assert result["count"] == 2
+        assert sql in recorder.dump()
+
+        assert len(slow_queries) == 2
+        assert slow_queries[0].sql == sql
+        assert slow_queries[0].parameters == "2 positional"
+        assert slow_queries[0].caller == (
+            "src.persistence.database.ops.db_ops_menu.select_menu_list"
+        )
+    finally:
+        recorder.detach(engine)
+        await engine.dispose()
+
+    recorder.reset()
+    assert recorder.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_recorder_slow_query_threshold():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    slow_queries = []
+    clock_values = iter([0.0, 0.1, 1.0, 1.5])
+    recorder = sql_timing.SqlTimingRecorder(
+        slow_query_threshold=0.25,
+        on_slow_query=slow_queries.append,
+        clock=lambda: next(clock_values),
+    )
+    recorder.attach(engine)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+    finally:
+        recorder.detach(engine)
+        await engine.dispose()
+
+    assert recorder.stats()["SELECT ?"]["count"] == 2
+    assert len(slow_queries) == 1
+    assert slow_queries[0].seconds == 0.5
+    assert slow_queries[0].caller is None
+
+
+def test_slow_query_threshold():
+    assert sql_timing._slow_query_threshold(-1) is None
+    assert sql_timing._slow_query_threshold(250) == 0.25
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.persistence.database.ops import db_ops_menu
+from src.persistence.database.session import Base
+from src.persistence.database.utils.sql_tracing import SqlTracing
+from src.schemas.schema_menu import SchemaMenuCreate
+from src.utils.tracing import Tracer
+
+
+class TracedSession(Session):
+    pass
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+@pytest.mark.asyncio
+async def test_sql_tracing():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    exporter = ListExporter()
+    tracer = Tracer(exporter=exporter)
+    sql_tracing = SqlTracing(tracer)
+    sql_tracing.attach(engine)
+    sql_tracing.attach_sessions(TracedSession)
+    session_local = async_sessionmaker(bind=engine, sync_session_class=TracedSession)
+    try:
+        with tracer.span("ui.action") as root:
+            async with session_local() as async_session:
+                await db_ops_menu.insert_menu(
+                    async_session, SchemaMenuCreate(name="menu")
+                )
+                await async_session.commit()
+    finally:
+        sql_tracing.detach(engine)
+        sql_tracing.detach_sessions(TracedSession)
+        await engine.dispose()
+
+    spans_by_name = {span.name: span for span in exporter.spans}
+    assert set(spans_by_name) == {"db.sql", "db.commit", "ui.action"}
+    sql_span = spans_by_name["db.sql"]
+    assert sql_span.attributes["sql"].startswith("INSERT INTO menu")
+    assert sql_span.attributes["caller"] == (
+        "src.persistence.database.ops.db_ops_menu.insert_menu"
+    )
+    for name in ["db.sql", "db.commit"]:
+        assert spans_by_name[name].trace_id == root.trace_id
+        assert spans_by_name[name].parent_id == root.span_id
+        assert spans_by_name[name].error is None
+
+
+@pytest.mark.asyncio
+async def test_sql_tracing_disabled():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    sql_tracing = SqlTracing(Tracer())
+    sql_tracing.attach(engine)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        sql_tracing.detach(engine)
+        await engine.dispose()
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.persistence.database.models.db_menu import DbMenu
+from src.persistence.database.utils import upsert_utils
+
+
+def test_build_upsert_statement_postgresql():
+    stmt = upsert_utils.build_upsert_statement(
+        "postgresql", DbMenu, index_elements=["id"], update_columns=["name"]
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO UPDATE SET name = excluded.name" in sql
+    assert "last_updated_on = excluded.last_updated_on" in sql
+    assert "WHERE menu.name != excluded.name" in sql
+    assert "RETURNING" in sql
+
+
+def test_build_upsert_statement_always_update():
+    stmt = upsert_utils.build_upsert_statement(
+        "postgresql",
+        DbMenu,
+        index_elements=["id"],
+        update_columns=["name"],
+        only_if_changed=False,
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "WHERE menu.name" not in sql
+
+
+def test_build_upsert_statement_do_nothing():
+    stmt = upsert_utils.build_upsert_statement(
+        "postgresql", DbMenu, index_elements=["id"], update_columns=[]
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO NOTHING" in sql
+    assert "RETURNING" in sql
+
+
+def test_build_upsert_statement_unsupported_dialect():
+    with pytest.raises(ValueError, match="Upsert is not supported for mysql."):
+        upsert_utils.build_upsert_statement(
+            "mysql", DbMenu, index_elements=["id"], update_columns=["name"]
+        )
+
+
+def test_dedupe_rows():
+    rows = [
+        {"id": 1, "name": "first"},
+        {"id": 2, "name": "other"},
+        {"id": 1, "name": "last"},
+    ]
+    assert upsert_utils.dedupe_rows(rows, ["id"]) == [
+        {"id": 1, "name": "last"},
+        {"id": 2, "name": "other"},
+    ]
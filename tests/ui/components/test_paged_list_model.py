@@ -0,0 +1,293 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from PySide6.QtCore import Qt
+
+from src.app.ops.exceptions.app_ops_exceptions import GetMenuListError
+from src.ui.components.paged_list_model import KEY_ROLE, LOADING_TEXT, PagedListModel
+from src.utils import paging_cursor
+
+
+def fetch_page_func_factory(row_count: int):
+    rows = [SimpleNamespace(id=index, name=f"{index:04}") for index in range(row_count)]
+
+    async def fetch_page(page_index, page_size, sort_by, after=None):
+        start = 0
+        if after is not None:
+            start = paging_cursor.decode_cursor(after)["id"] + 1
+        return rows[start : start + page_size]
+
+    return AsyncMock(side_effect=fetch_page)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_more():
+    mock_fetch_page_func = fetch_page_func_factory(25)
+    model = PagedListModel(mock_fetch_page_func, "id", page_size=10)
+
+    assert model.rowCount() == 0
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert not model.canFetchMore()
+    await settle()
+
+    assert model.rowCount() == 10
+    assert model.data(model.index(3)) == "0003"
+    assert model.data(model.index(3), KEY_ROLE) == 3
+
+    for expected_row_count in (20, 25):
+        model.fetchMore()
+        await settle()
+        assert model.rowCount() == expected_row_count
+
+    assert not model.canFetchMore()
+    assert mock_fetch_page_func.await_count == 3
+    # Every page after the first is fetched with a cursor.
+    assert mock_fetch_page_func.await_args_list[0].kwargs["after"] is None
+    assert mock_fetch_page_func.await_args_list[2].kwargs["after"] is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_more_exact_multiple_of_page_size():
+    model = PagedListModel(fetch_page_func_factory(20), "id", page_size=10)
+
+    for _ in range(3):
+        model.fetchMore()
+        await settle()
+
+    assert model.rowCount() == 20
+    assert not model.canFetchMore()
+
+
+@pytest.mark.asyncio
+async def test_evicted_page_fetched_again():
+    mock_fetch_page_func = fetch_page_func_factory(50)
+    model = PagedListModel(mock_fetch_page_func, "id", page_size=10, max_cached_pages=2)
+    for _ in range(4):
+        model.fetchMore()
+        await settle()
+
+    assert model.rowCount() == 40
+    assert model.cached_page_count == 2
+    assert model.data(model.index(5)) == LOADING_TEXT
+
+    changed_rows = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right: changed_rows.append(
+            (top_left.row(), bottom_right.row())
+        )
+    )
+    await settle()
+
+    assert changed_rows == [(0, 9)]
+    assert model.data(model.index(5)) == "0005"
+    assert model.cached_page_count == 2
+    assert mock_fetch_page_func.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_refresh():
+    mock_fetch_page_func = fetch_page_func_factory(25)
+    model = PagedListModel(mock_fetch_page_func, "id", page_size=10)
+    model.fetchMore()
+    await settle()
+    model.fetchMore()
+    await settle()
+
+    model.refresh()
+    assert model.rowCount() == 0
+    await settle()
+
+    assert model.rowCount() == 10
+    assert mock_fetch_page_func.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_refresh_ignores_pages_in_flight():
+    release_fetch = asyncio.Event()
+
+    async def slow_fetch_page(page_index, page_size, sort_by, after=None):
+        await release_fetch.wait()
+        return [SimpleNamespace(id=1, name="stale")]
+
+    model = PagedListModel(slow_fetch_page, "id", page_size=10)
+    model.fetchMore()
+    await settle()
+    model.fetch_page_func = fetch_page_func_factory(3)
+    model.refresh()
+    await settle()
+    release_fetch.set()
+    await settle()
+
+    assert model.rowCount() == 3
+    assert model.data(model.index(1), Qt.ItemDataRole.DisplayRole) == "0001"
+
+
+@pytest.mark.asyncio
+async def test_fetch_failed():
+    mock_fetch_page_func = AsyncMock(side_effect=GetMenuListError("Failed."))
+    model = PagedListModel(mock_fetch_page_func, "id", page_size=10)
+    errors = []
+    model.on_fetch_failed.connect(errors.append)
+
+    model.fetchMore()
+    await settle()
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], GetMenuListError)
+    assert model.rowCount() == 0
+    assert model.canFetchMore()
+
+
+@pytest.mark.asyncio
+async def test_reload_updates_rows_in_place():
+    rows = [SimpleNamespace(id=index, name=f"{index:04}") for index in range(15)]
+
+    async def fetch_page(page_index, page_size, sort_by, after=None):
+        start = 0 if after is None else paging_cursor.decode_cursor(after)["id"] + 1
+        return rows[start : start + page_size]
+
+    model = PagedListModel(fetch_page, "id", page_size=10)
+    model.fetchMore()
+    await settle()
+    model.fetchMore()
+    await settle()
+
+    reset_count = []
+    model.modelReset.connect(lambda: reset_count.append(1))
+    rows[3] = SimpleNamespace(id=3, name="renamed")
+    model.reload()
+    await settle()
+
+    assert model.rowCount() == 15
+    assert model.data(model.index(3)) == "renamed"
+    assert reset_count == []
+
+
+def mutable_fetch_page_func_factory(rows: list):
+    async def fetch_page(page_index, page_size, sort_by, after=None):
+        after_id = -1 if after is None else paging_cursor.decode_cursor(after)["id"]
+        return [row for row in rows if row.id > after_id][:page_size]
+
+    return fetch_page
+
+
+def record_signals(model: PagedListModel):
+    signals = []
+    model.modelReset.connect(lambda: signals.append(("reset",)))
+    model.rowsRemoved.connect(
+        lambda parent, first, last: signals.append(("removed", first, last))
+    )
+    model.rowsInserted.connect(
+        lambda parent, first, last: signals.append(("inserted", first, last))
+    )
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: signals.append(
+            ("changed", top_left.row())
+        )
+    )
+    return signals
+
+
+@pytest.mark.asyncio
+async def test_reload_removes_rows():
+    rows = [SimpleNamespace(id=index, name=f"{index:04}") for index in range(15)]
+    model = PagedListModel(mutable_fetch_page_func_factory(rows), "id", page_size=10)
+    model.fetchMore()
+    await settle()
+    model.fetchMore()
+    await settle()
+
+    signals = record_signals(model)
+    del rows[12]
+    model.reload()
+    await settle()
+
+    assert signals == [("removed", 12, 12)]
+    assert model.rowCount() == 14
+    assert [model.data(model.index(row)) for row in range(14)] == [
+        row.name for row in rows
+    ]
+    assert not model.canFetchMore()
+
+
+@pytest.mark.asyncio
+async def test_reload_inserts_rows():
+    rows = [SimpleNamespace(id=index * 2, name=f"{index:04}") for index in range(8)]
+    model = PagedListModel(mutable_fetch_page_func_factory(rows), "id", page_size=10)
+    model.fetchMore()
+    await settle()
+
+    signals = record_signals(model)
+    rows.insert(2, SimpleNamespace(id=3, name="new"))
+    model.reload()
+    await settle()
+
+    assert signals == [("inserted", 2, 2)]
+    assert model.rowCount() == 9
+    assert model.data(model.index(2)) == "new"
+    assert model.data(model.index(2), KEY_ROLE) == 3
+
+
+@pytest.mark.asyncio
+async def test_reload_moves_renamed_row():
+    rows = [SimpleNamespace(id=index, name=f"{index:04}") for index in range(5)]
+
+    async def fetch_page(page_index, page_size, sort_by, after=None):
+        return sorted(rows, key=lambda row: row.name)[:page_size]
+
+    model = PagedListModel(fetch_page, "name", page_size=10)
+    model.fetchMore()
+    await settle()
+
+    signals = record_signals(model)
+    rows[0] = SimpleNamespace(id=0, name="zzzz")
+    model.reload()
+    await settle()
+
+    assert ("reset",) not in signals
+    assert [model.data(model.index(row), KEY_ROLE) for row in range(5)] == [
+        1,
+        2,
+        3,
+        4,
+        0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reload_empty_list():
+    rows = []
+    model = PagedListModel(mutable_fetch_page_func_factory(rows), "id", page_size=10)
+    model.fetchMore()
+    await settle()
+
+    signals = record_signals(model)
+    rows.append(SimpleNamespace(id=1, name="first"))
+    model.reload()
+    await settle()
+
+    assert signals == [("inserted", 0, 0)]
+    assert model.data(model.index(0)) == "first"
+
+
+@pytest.mark.asyncio
+async def test_set_sort_by_resets_model():
+    fetch_page = AsyncMock(return_value=[])
+    model = PagedListModel(fetch_page, "id", page_size=10)
+    model.fetchMore()
+    await settle()
+
+    signals = record_signals(model)
+    model.set_sort_by("name")
+    await settle()
+
+    assert signals == [("reset",)]
+    assert fetch_page.await_args.args[2] == "name"
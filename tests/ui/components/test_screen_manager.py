@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+from src.ui.components.screen_manager import (
+    has_unsaved_changes,
+    select_screens_to_evict,
+)
+
+
+def test_select_screens_to_evict_within_max_screens():
+    last_shown_on = {"tags": 1, "menus": 2}
+    assert select_screens_to_evict(last_shown_on, "menus", 2, None, 10) == []
+
+
+def test_select_screens_to_evict_over_max_screens():
+    last_shown_on = {"tags": 3, "menus": 1, "tables": 4, "items": 2}
+    assert select_screens_to_evict(last_shown_on, "tables", 2, None, 10) == [
+        "menus",
+        "items",
+    ]
+
+
+def test_select_screens_to_evict_never_current():
+    last_shown_on = {"tags": 1, "menus": 2}
+    assert select_screens_to_evict(last_shown_on, "tags", 1, None, 10) == ["menus"]
+
+
+def test_select_screens_to_evict_idle():
+    last_shown_on = {"tags": 1, "menus": 8, "tables": 9}
+    assert select_screens_to_evict(last_shown_on, "tables", 4, 5, 10) == ["tags"]
+    # The current screen is kept even when idle.
+    assert select_screens_to_evict(last_shown_on, "tags", 4, 5, 10) == []
+
+
+def test_select_screens_to_evict_idle_and_over_max_screens():
+    last_shown_on = {"tags": 1, "menus": 8, "items": 7, "tables": 9}
+    assert select_screens_to_evict(last_shown_on, "tables", 2, 5, 10) == [
+        "tags",
+        "items",
+    ]
+
+
+def test_select_screens_to_evict_never_pinned():
+    last_shown_on = {"tags": 3, "menus": 1, "tables": 4, "items": 2}
+    assert select_screens_to_evict(
+        last_shown_on, "tags", 2, None, 10, pinned_names={"menus"}
+    ) == ["items", "tables"]
+    # Pinned screens are kept even when idle or over max_screens.
+    assert (
+        select_screens_to_evict(
+            last_shown_on, "tags", 1, 5, 10, pinned_names={"menus", "tables", "items"}
+        )
+        == []
+    )
+
+
+def test_has_unsaved_changes():
+    assert has_unsaved_changes(SimpleNamespace(has_unsaved_changes=lambda: True))
+    assert not has_unsaved_changes(SimpleNamespace(has_unsaved_changes=lambda: False))
+    assert not has_unsaved_changes(SimpleNamespace())
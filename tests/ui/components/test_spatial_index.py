@@ -0,0 +1,101 @@
+from PySide6.QtCore import QPoint, QRect
+
+from src.ui.components.spatial_index import GridSpatialIndex
+
+
+def test_items_at():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    spatial_index.insert("a", QRect(0, 0, 20, 20))
+    spatial_index.insert("b", QRect(15, 15, 20, 20))
+
+    assert spatial_index.items_at(QPoint(5, 5)) == ["a"]
+    assert spatial_index.items_at(QPoint(17, 17)) == ["a", "b"]
+    assert spatial_index.items_at(QPoint(30, 30)) == ["b"]
+    assert spatial_index.items_at(QPoint(100, 100)) == []
+
+
+def test_items_at_insertion_order():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    for item in ["c", "a", "b"]:
+        spatial_index.insert(item, QRect(0, 0, 10, 10))
+
+    assert spatial_index.items_at(QPoint(5, 5)) == ["c", "a", "b"]
+
+
+def test_items_at_edges():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    spatial_index.insert("a", QRect(10, 10, 10, 10))
+
+    assert spatial_index.items_at(QPoint(10, 10)) == ["a"]
+    assert spatial_index.items_at(QPoint(19, 19)) == ["a"]
+    assert spatial_index.items_at(QPoint(20, 20)) == []
+    assert spatial_index.items_at(QPoint(9, 10)) == []
+
+
+def test_items_in():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    spatial_index.insert("a", QRect(0, 0, 10, 10))
+    spatial_index.insert("b", QRect(50, 50, 10, 10))
+    spatial_index.insert("c", QRect(100, 0, 10, 10))
+
+    assert spatial_index.items_in(QRect(5, 5, 50, 50)) == ["a", "b"]
+    assert spatial_index.items_in(QRect(200, 200, 10, 10)) == []
+
+
+def test_move():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    spatial_index.insert("a", QRect(0, 0, 10, 10))
+    spatial_index.insert("b", QRect(100, 100, 10, 10))
+    spatial_index.move("a", QRect(100, 100, 10, 10))
+
+    assert spatial_index.items_at(QPoint(5, 5)) == []
+    assert spatial_index.items_at(QPoint(105, 105)) == ["a", "b"]
+
+
+def test_insert_copies_rect():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    rect = QRect(0, 0, 10, 10)
+    spatial_index.insert("a", rect)
+    rect.moveTopLeft(QPoint(100, 100))
+
+    assert spatial_index.items_at(QPoint(5, 5)) == ["a"]
+
+
+def test_remove():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    spatial_index.insert("a", QRect(0, 0, 30, 30))
+    spatial_index.remove("a")
+    spatial_index.remove("unknown")
+
+    assert len(spatial_index) == 0
+    assert "a" not in spatial_index
+    assert spatial_index.items_in(QRect(0, 0, 30, 30)) == []
+    assert not spatial_index._cells
+
+
+def test_matches_linear_scan():
+    spatial_index = GridSpatialIndex(cell_size=32)
+    rects = {
+        index: QRect((index * 37) % 900, (index * 53) % 700, 40 + index % 30, 40)
+        for index in range(300)
+    }
+    for index, rect in rects.items():
+        spatial_index.insert(index, rect)
+
+    for x in range(0, 1000, 45):
+        for y in range(0, 800, 45):
+            point = QPoint(x, y)
+            assert spatial_index.items_at(point) == [
+                index for index, rect in rects.items() if rect.contains(point)
+            ]
+
+
+def test_rect_of():
+    spatial_index = GridSpatialIndex(cell_size=10)
+    spatial_index.insert("a", QRect(0, 0, 10, 10))
+    spatial_index.move("a", QRect(20, 20, 10, 10))
+
+    rect = spatial_index.rect_of("a")
+    assert rect == QRect(20, 20, 10, 10)
+    rect.moveTopLeft(QPoint(0, 0))
+    assert spatial_index.rect_of("a") == QRect(20, 20, 10, 10)
@@ -1,6 +1,20 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from src.utils.bcrypt_hash import bcrypt, verify_bcrypt
+from src.utils.bcrypt_hash import (
+    bcrypt,
+    bcrypt_async,
+    get_executor,
+    get_pwd_cxt,
+    shutdown_executor,
+    verify_bcrypt,
+    verify_bcrypt_async,
+)
+
+PASSWORD_HASH = bcrypt("123456")
 
 
 def test_bcrypt_success():
@@ -32,3 +46,61 @@ def test_bcrypt_success_none_password():
     password = None
     with pytest.raises(TypeError):
         bcrypt(password)
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_async_success():
+    password = "123456"
+    password_hash = await bcrypt_async(password)
+    assert password_hash != password
+    assert await verify_bcrypt_async(password, password_hash)
+    assert not await verify_bcrypt_async("654321", password_hash)
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_async_runs_in_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        password_hash = await bcrypt_async("123456", executor=executor)
+        assert await verify_bcrypt_async("123456", password_hash, executor=executor)
+
+
+def test_bcrypt_backend():
+    # The other backends, e.g. os_crypt, hold the GIL while hashing,
+    # which would block the event loop despite the thread pool.
+    assert get_pwd_cxt().handler("bcrypt").get_backend() == "bcrypt"
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_async_does_not_block_event_loop():
+    max_gap = 0.0
+    hashing = True
+
+    async def tick():
+        nonlocal max_gap
+        last_tick = time.perf_counter()
+        while hashing:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last_tick)
+            last_tick = now
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.gather(
+        *(verify_bcrypt_async("123456", PASSWORD_HASH) for _ in range(4))
+    )
+    hashing = False
+    await ticker
+    assert max_gap < 0.05
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_async_none_password():
+    with pytest.raises(TypeError):
+        await bcrypt_async(None)
+
+
+def test_shutdown_executor():
+    executor = get_executor()
+    assert get_executor() is executor
+    shutdown_executor()
+    assert get_executor() is not executor
@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from src.utils.latency_histogram import LatencyHistogram
+
+
+def test_record():
+    histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1))
+    for seconds in [0.005, 0.01, 0.05, 0.2]:
+        histogram.record(seconds)
+    assert histogram.bucket_counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.total == pytest.approx(0.265)
+    assert histogram.max == 0.2
+
+
+def test_percentile():
+    histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1))
+    for _ in range(90):
+        histogram.record(0.005)
+    for _ in range(9):
+        histogram.record(0.05)
+    histogram.record(0.3)
+    assert histogram.percentile(50) == 0.01
+    assert histogram.percentile(95) == 0.1
+    assert histogram.percentile(99) == 0.1
+    assert histogram.percentile(100) == 0.3
+
+
+def test_percentile_capped_by_max():
+    histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1))
+    histogram.record(0.02)
+    assert histogram.percentile(50) == 0.02
+
+
+def test_empty():
+    histogram = LatencyHistogram()
+    assert histogram.mean == 0.0
+    assert histogram.percentile(99) == 0.0
+
+
+def test_as_dict():
+    histogram = LatencyHistogram(bucket_bounds=(0.01,))
+    histogram.record(0.004)
+    histogram.record(0.006)
+    result = histogram.as_dict()
+    assert result["count"] == 2
+    assert result["mean"] == pytest.approx(0.005)
+    assert result["buckets"] == {0.01: 2, math.inf: 0}
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.loop_watchdog import LoopWatchdog, Stall
+
+
+def block_the_loop(seconds):
+    time.sleep(seconds)
+
+
+def test_stall_as_dict():
+    stall = Stall(
+        started_on=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        seconds=0.5,
+        stacks=Counter({("a", "b"): 1, ("a", "c"): 3}),
+    )
+    assert stall.as_dict() == {
+        "started_on": "2024-01-01T00:00:00+00:00",
+        "seconds": 0.5,
+        "samples": [
+            {"count": 3, "stack": ["a", "c"]},
+            {"count": 1, "stack": ["a", "b"]},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_watchdog_reports_stall(tmp_path):
+    report_path = tmp_path / "stalls.jsonl"
+    stalls = []
+    watchdog = LoopWatchdog(
+        stall_threshold=0.05,
+        heartbeat_interval=0.01,
+        sample_interval=0.005,
+        report_path=str(report_path),
+        on_stall=stalls.append,
+    )
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.05)
+        block_the_loop(0.3)
+        await asyncio.sleep(0.1)
+    finally:
+        await watchdog.stop()
+
+    assert not watchdog.is_running
+    assert len(stalls) == 1
+    assert stalls == watchdog.stalls
+    assert 0.2 <= stalls[0].seconds < 0.5
+    assert stalls[0].stacks
+    (stack, _), *_ = stalls[0].stacks.most_common()
+    assert stack[-1].endswith("in block_the_loop")
+
+    (line,) = report_path.read_text(encoding="utf-8").splitlines()
+    report = json.loads(line)
+    assert report["seconds"] == stalls[0].seconds
+    assert report["samples"][0]["stack"] == list(stack)
+
+    assert watchdog.lag.count > 0
+    assert watchdog.lag.max >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_watchdog_no_stall():
+    watchdog = LoopWatchdog(
+        stall_threshold=0.1, heartbeat_interval=0.01, sample_interval=0.005
+    )
+    watchdog.start()
+    try:
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+    finally:
+        await watchdog.stop()
+    assert watchdog.stalls == []
+    assert watchdog.lag.count > 0
+
+
+@pytest.mark.asyncio
+async def test_watchdog_stop_awaits_heartbeat():
+    watchdog = LoopWatchdog(heartbeat_interval=0.01, sample_interval=0.005)
+    watchdog.start()
+    heartbeat_task = watchdog._heartbeat_task
+    await asyncio.sleep(0.02)
+
+    await watchdog.stop()
+    assert heartbeat_task.done()
+    assert heartbeat_task.cancelled()
+    await watchdog.stop()
+    assert not watchdog.is_running
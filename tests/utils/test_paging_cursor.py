@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.paging_cursor import decode_cursor, encode_cursor, sort_column_names
+
+
+def test_sort_column_names():
+    assert sort_column_names("created_on DESC, name") == ["created_on", "name", "id"]
+    assert sort_column_names("name, id DESC") == ["name", "id"]
+    assert sort_column_names(None) == ["id"]
+    assert sort_column_names("") == ["id"]
+
+
+def test_encode_decode_cursor():
+    record_id = uuid.uuid4()
+    created_on = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    record = SimpleNamespace(id=record_id, name="table1", created_on=created_on)
+
+    cursor = encode_cursor(record, "created_on DESC, name")
+
+    assert isinstance(cursor, str)
+    assert decode_cursor(cursor) == {
+        "created_on": str(created_on),
+        "name": "table1",
+        "id": str(record_id),
+    }
+
+
+def test_decode_cursor_invalid():
+    with pytest.raises(ValueError, match="Invalid cursor."):
+        decode_cursor("not a cursor")
+
+    with pytest.raises(ValueError, match="Invalid cursor."):
+        decode_cursor(encode_cursor(SimpleNamespace(id=1), None)[:-4])
@@ -0,0 +1,73 @@
+import sys
+
+from src.utils.startup_profiler import StartupProfiler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_phase_records_duration_and_imported_modules():
+    clock = FakeClock()
+    profiler = StartupProfiler(clock=clock)
+
+    with profiler.phase("import"):
+        clock.now += 0.25
+        sys.modules["_startup_profiler_test_module"] = object()
+    del sys.modules["_startup_profiler_test_module"]
+
+    assert profiler.phases == [("import", 0.25, 1)]
+
+
+def test_phase_is_recorded_when_it_raises():
+    clock = FakeClock()
+    profiler = StartupProfiler(clock=clock)
+
+    try:
+        with profiler.phase("failing"):
+            clock.now += 1
+            raise RuntimeError()
+    except RuntimeError:
+        pass
+
+    assert profiler.phases == [("failing", 1, 0)]
+
+
+def test_mark_records_time_since_start():
+    clock = FakeClock()
+    clock.now = 10
+    profiler = StartupProfiler(clock=clock)
+    clock.now = 10.5
+
+    profiler.mark("first paint")
+
+    assert profiler.marks == [("first paint", 0.5)]
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StartupProfiler(enabled=False, clock=FakeClock())
+
+    with profiler.phase("import"):
+        pass
+    profiler.mark("first paint")
+
+    assert profiler.phases == []
+    assert profiler.marks == []
+
+
+def test_report_lists_phases_and_marks():
+    clock = FakeClock()
+    profiler = StartupProfiler(clock=clock)
+    with profiler.phase("import Qt"):
+        clock.now += 0.1
+    profiler.mark("first paint")
+
+    report = profiler.report()
+
+    assert "import Qt" in report
+    assert "100.0ms" in report
+    assert "first paint" in report
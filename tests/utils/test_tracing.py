@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+import pytest
+
+from src.utils import tracing
+from src.utils.tracing import FileSpanExporter, Tracer
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+def make_tracer():
+    exporter = ListExporter()
+    return Tracer(exporter=exporter), exporter
+
+
+def test_span():
+    tracer, exporter = make_tracer()
+    with tracer.span("ui.action", screen="tables") as root:
+        assert tracer.current_span() is root
+        with tracer.span("app.call") as child:
+            assert tracer.current_span() is child
+        assert tracer.current_span() is root
+    assert tracer.current_span() is None
+
+    assert [span.name for span in exporter.spans] == ["app.call", "ui.action"]
+    assert root.parent_id is None
+    assert root.attributes == {"screen": "tables"}
+    assert child.parent_id == root.span_id
+    assert child.trace_id == root.trace_id
+    assert root.seconds >= child.seconds >= 0
+
+
+def test_span_error():
+    tracer, exporter = make_tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("validation"):
+            raise ValueError("Invalid name.")
+    assert exporter.spans[0].error == "ValueError"
+    assert tracer.current_span() is None
+
+
+def test_span_disabled():
+    tracer = Tracer()
+    assert not tracer.enabled
+    with tracer.span("ui.action") as span:
+        assert span is None
+        assert tracer.current_span() is None
+    assert tracer.start_span("db.sql") is None
+    tracer.end_span(None)
+
+
+def test_new_traces():
+    tracer, exporter = make_tracer()
+    with tracer.span("first"):
+        pass
+    with tracer.span("second"):
+        pass
+    first, second = exporter.spans
+    assert first.trace_id != second.trace_id
+
+
+def test_start_span_does_not_become_current():
+    tracer, exporter = make_tracer()
+    with tracer.span("app.call") as parent:
+        span = tracer.start_span("db.sql", sql="SELECT ?")
+        assert tracer.current_span() is parent
+        tracer.end_span(span)
+    assert exporter.spans[0].parent_id == parent.span_id
+    assert exporter.spans[0].attributes == {"sql": "SELECT ?"}
+
+
+@pytest.mark.asyncio
+async def test_traced():
+    tracer, exporter = make_tracer()
+
+    @tracer.traced("app_ops.get_value")
+    async def get_value(value):
+        await asyncio.sleep(0)
+        return value
+
+    with tracer.span("ui.action") as root:
+        assert await asyncio.gather(get_value(1), get_value(2)) == [1, 2]
+
+    calls = [span for span in exporter.spans if span.name == "app_ops.get_value"]
+    assert len(calls) == 2
+    assert all(span.parent_id == root.span_id for span in calls)
+    assert get_value.__name__ == "get_value"
+
+
+@pytest.mark.asyncio
+async def test_traced_disabled():
+    tracer = Tracer()
+
+    @tracer.traced("app_ops.get_value")
+    async def get_value():
+        return tracer.current_span()
+
+    assert await get_value() is None
+
+
+def test_file_span_exporter(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(exporter=FileSpanExporter(str(path)))
+    with tracer.span("ui.action"):
+        with tracer.span("app.call"):
+            pass
+        # Children are written with their root span.
+        assert not path.exists()
+
+    spans = tracing.load_spans(str(path))
+    assert [span["name"] for span in spans] == ["app.call", "ui.action"]
+    assert (
+        json.loads(path.read_text(encoding="utf-8").splitlines()[1])["parent_id"]
+        is None
+    )
+
+
+def test_format_traces(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(exporter=FileSpanExporter(str(path)))
+    with tracer.span("ui.action"):
+        with tracer.span("db.sql", sql="SELECT ?"):
+            pass
+
+    lines = tracing.format_traces(tracing.load_spans(str(path))).splitlines()
+    assert lines[0].startswith("trace ")
+    assert lines[1].endswith("ms ui.action")
+    assert lines[2].endswith("ms   db.sql sql=SELECT ?")